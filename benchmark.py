@@ -0,0 +1,413 @@
+"""Micro-benchmarks for the website's data layer and page rendering.
+
+Builds a synthetic catalogue in a scratch directory (the real yanti_siggs.db is
+never touched), times every YantiSiggsWebsite getter and mutator, then renders
+the header, each public section and the admin portal headlessly with
+Streamlit's AppTest. Results are compared against a JSON baseline:
+
+    python benchmark.py --scale 10000                   # run and compare
+    python benchmark.py --scale 100000 --update-baseline
+    python benchmark.py --scale 1000000 --skip-render   # data layer only
+
+The exit status is 1 when any benchmark's median exceeds its baseline median
+by more than --threshold (ignoring timings under --min-ms).
+"""
+import argparse
+import array
+import io
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import wave
+from datetime import date, timedelta
+
+from PIL import Image
+
+os.environ.setdefault('YANTI_MEDIA_PORT', '0')  # Any free port; benchmarks never fetch media
+os.environ['YANTI_PERF'] = '1'  # Render timings are read from the app's instrumentation
+import network_control_center_streamlit as site
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(APP_DIR, 'network_control_center_streamlit.py')
+BASELINE_DIR = os.path.join(APP_DIR, 'benchmarks')
+INSERT_CHUNK_ROWS = 10000
+# Uploaded media, so the header, audio players, waveforms and gallery variants render
+HEADER_PHOTOS = 3
+LOCAL_TRACKS = 20  # Newer than every synthetic row, so they fill the first music page
+LOCAL_TRACK_SECONDS = 30
+GALLERY_UPLOADS = 30  # Uploaded today, so they fill the first gallery page
+
+EVENT_STATUSES = ["upcoming", "ongoing", "past", "cancelled"]
+FILM_STATUSES = ["released", "in_production", "upcoming"]
+GALLERY_CATEGORIES = ["Music", "Film", "Studio", "Events", "Personal"]
+WORDS = ("harare nights afro house studio live set festival amapiano groove rhythm "
+         "sunset session club tour premiere story drum bass vocal soul city dance").split()
+
+# Synthetic data
+def phrase(rng, words):
+    return ' '.join(rng.choice(WORDS) for _ in range(words))
+
+def day(rng, start=date(2020, 1, 1), span=2000):
+    return (start + timedelta(days=rng.randrange(span))).isoformat()
+
+def synthetic_rows(rng, scale):
+    """{table: (INSERT sql, row generator)}; the main tables get `scale` rows, the rest a tenth"""
+    minor = max(scale // 10, 1)
+    return {
+        'events': ('INSERT INTO events (title, date, time, venue, description, image_url, registration_url, status) '
+                   'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                   ((phrase(rng, 3).title(), day(rng), '9:00 PM', phrase(rng, 2).title(), phrase(rng, 40),
+                     '', '', rng.choice(EVENT_STATUSES)) for _ in range(scale))),
+        'music': ('INSERT INTO music (title, album, year, duration, youtube_url, spotify_url, soundcloud_url, '
+                  'lyrics, file_path, genre) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                  ((phrase(rng, 2).title(), phrase(rng, 2).title(), rng.randint(2015, 2025),
+                    f"{rng.randint(2, 8)}:{rng.randint(0, 59):02d}", '', '', '',
+                    phrase(rng, 250) if rng.random() < 0.7 else '', '',
+                    rng.choice(site.MUSIC_GENRES))
+                   for _ in range(scale))),
+        'gallery': ('INSERT INTO gallery (title, category, image_url, description, upload_date) VALUES (?, ?, ?, ?, ?)',
+                    ((phrase(rng, 3).title(), rng.choice(GALLERY_CATEGORIES),
+                      f"https://images.example.com/{i}.jpg", phrase(rng, 12), day(rng)) for i in range(scale))),
+        'bookings': ('INSERT INTO bookings (name, email, phone, event_type, event_date, venue, budget, message, '
+                     'date_submitted, status) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                     ((phrase(rng, 2).title(), f"booker{i}@example.com", '+263 77 000 0000', "Club Night",
+                       day(rng), phrase(rng, 2).title(), "$1,000 - $2,500", phrase(rng, 30), day(rng),
+                       rng.choice(site.BOOKING_STATUSES))
+                      for i in range(scale))),
+        'subscribers': ('INSERT INTO subscribers (email, name, date_subscribed) VALUES (?, ?, ?)',
+                        ((f"fan{i}@example.com", phrase(rng, 2).title(), day(rng)) for i in range(scale))),
+        'films': ('INSERT INTO films (title, year, role, description, trailer_url, watch_url, imdb_url, poster_url, '
+                  'status) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                  ((phrase(rng, 3).title(), rng.randint(2015, 2025), "Director", phrase(rng, 60), '', '', '', '',
+                    rng.choice(FILM_STATUSES)) for _ in range(minor))),
+        'press': ('INSERT INTO press (title, outlet, date, url, excerpt, image_url) VALUES (?, ?, ?, ?, ?, ?)',
+                  ((phrase(rng, 6).title(), phrase(rng, 2).title(), day(rng), f"https://press.example.com/{i}",
+                    phrase(rng, 40), '') for i in range(minor))),
+        'contacts': ('INSERT INTO contacts (name, email, phone, message, date_sent, status) VALUES (?, ?, ?, ?, ?, ?)',
+                     ((phrase(rng, 2).title(), f"visitor{i}@example.com", '', phrase(rng, 30), day(rng),
+                       rng.choice(site.CONTACT_STATUSES)) for i in range(minor))),
+    }
+
+def upload(name, data):
+    """A file-like upload, as st.file_uploader returns"""
+    f = io.BytesIO(data)
+    f.name = name
+    return f
+
+def synthetic_jpeg(rng, size):
+    """A smooth random-colour JPEG photo of the given size"""
+    image = Image.frombytes('RGB', (16, 12), rng.randbytes(16 * 12 * 3)).resize(size, Image.BICUBIC)
+    out = io.BytesIO()
+    image.save(out, 'JPEG', quality=90)
+    return out.getvalue()
+
+def synthetic_wav(rng, seconds, rate=22050):
+    """Mono 16-bit noise with a random loudness per second, as a WAV file"""
+    out = io.BytesIO()
+    with wave.open(out, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        for _ in range(seconds):
+            level = rng.randint(1, 32767)
+            block = array.array('h', (rng.randint(-level, level) for _ in range(rate // 50)))
+            wav.writeframes(block.tobytes() * 50)  # A 20 ms block repeated for the second
+    return out.getvalue()
+
+def populate_media(website, rng):
+    """Upload header photos, analysed local tracks and gallery images with their variants; returns counts"""
+    for i in range(HEADER_PHOTOS):
+        path = site.store_upload(upload(f'header{i}.jpg', synthetic_jpeg(rng, (2400, 1600))))
+        website.add_header_photo(path, phrase(rng, 4).title())  # The last one stays active
+    for i in range(LOCAL_TRACKS):
+        path = site.store_upload(upload(f'track{i}.wav', synthetic_wav(rng, LOCAL_TRACK_SECONDS)))
+        music_id = website.add_music(phrase(rng, 2).title(), phrase(rng, 2).title(), 2026, '', '', '', '',
+                                     phrase(rng, 250), path, rng.choice(site.MUSIC_GENRES))
+        website.set_track_audio(music_id, site.analyse_audio(path))
+    for i in range(GALLERY_UPLOADS):
+        path = site.store_upload(upload(f'photo{i}.jpg', synthetic_jpeg(rng, (2000, 1500))))
+        gallery_id = website.add_gallery_item(phrase(rng, 3).title(), rng.choice(GALLERY_CATEGORIES), path,
+                                              phrase(rng, 12))
+        website.set_gallery_variants(gallery_id, site.build_gallery_variants(path))
+    return {'header photos': HEADER_PHOTOS, 'local tracks': LOCAL_TRACKS, 'gallery uploads': GALLERY_UPLOADS}
+
+def populate(website, scale, seed):
+    """Fill the database with seeded synthetic rows and uploaded media; returns {table: rows inserted}"""
+    rng = random.Random(seed)
+    counts = {}
+    for table, (sql, rows) in synthetic_rows(rng, scale).items():
+        counts[table] = 0
+        while True:
+            chunk = [row for _, row in zip(range(INSERT_CHUNK_ROWS), rows)]
+            if not chunk:
+                break
+            with website.write() as cursor:
+                cursor.executemany(sql, chunk)
+            counts[table] += len(chunk)
+    website.bump_generation('events', 'music', 'films', 'press', 'gallery', 'header_photos')
+    counts.update(populate_media(website, rng))
+    return counts
+
+# Timing
+def summarize(times):
+    """Median, p95 and max of a list of seconds, in milliseconds"""
+    times = sorted(times)
+    return {
+        'median_ms': round(statistics.median(times) * 1000, 3),
+        'p95_ms': round(times[min(int(len(times) * 0.95), len(times) - 1)] * 1000, 3),
+        'max_ms': round(times[-1] * 1000, 3),
+        'runs': len(times),
+    }
+
+def measure(func, repeat, before=None):
+    """Seconds taken by each of `repeat` calls; `before` runs untimed ahead of every call"""
+    times = []
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+def data_layer_benchmarks(website, repeat):
+    """Time every getter (with a cold and a warm query cache) and mutator"""
+    w = website
+    results = {}
+
+    # (name, cache table or None, call)
+    reads = [
+        ('get_events', 'events', lambda: w.get_events(limit=10)),
+        ('get_all_events', 'events', w.get_all_events),
+        ('get_music', 'music', lambda: w.get_music(limit=1)),
+        ('query_music newest page', 'music', lambda: w.query_music(limit=20)),
+        ('query_music genre A-Z deep page', 'music',
+         lambda: w.query_music(genre='House', sort='title', limit=20, offset=2000)),
+        ('count_music', 'music', lambda: w.count_music(genre='House')),
+        ('get_lyrics', 'music', lambda: w.get_lyrics(1)),
+        ('get_films', 'films', w.get_films),
+        ('get_all_films', 'films', w.get_all_films),
+        ('get_press', 'press', w.get_press),
+        ('get_gallery', 'gallery', lambda: w.get_gallery(limit=30)),
+        ('get_gallery by category', 'gallery', lambda: w.get_gallery(category='Studio', limit=30)),
+        ('get_header_photo', 'header_photos', w.get_header_photo),
+        ('get_all_header_photos', None, w.get_all_header_photos),
+        ('get_bookings_page', None, lambda: w.get_bookings_page(limit=25)),
+        ('get_bookings_page pending', None, lambda: w.get_bookings_page(status='pending', limit=25)),
+        ('get_contacts_page', None, lambda: w.get_contacts_page(limit=25)),
+        ('get_recent_subscribers', None, w.get_recent_subscribers),
+        ('get_database_stats', None, w.get_database_stats),
+        ('search', None, lambda: w.search('house session')),
+        ('verify_admin', None, lambda: w.verify_admin('admin', 'Yanti123')),
+        ('check_query_plans', None, w.check_query_plans),
+        ('export_subscribers csv', None, lambda: w.export_subscribers(io.StringIO(), 'csv')),
+    ]
+    for name, table, call in reads:
+        if table is None:
+            results[name] = summarize(measure(call, repeat))
+            continue
+        results[name] = summarize(measure(call, repeat, before=lambda: w.bump_generation(table)))
+        call()
+        results[f'{name} (cached)'] = summarize(measure(call, repeat))
+
+    # Mutators: each add is followed by an update and a delete of the same row
+    event = ('Bench Night', '2026-01-01', '9:00 PM', 'Bench Venue', 'Benchmark event', '', '', 'upcoming')
+    track = ('Bench Track', 'Bench Album', 2025, '4:00', '', '', '', 'Bench lyrics', '', 'House')
+    film = ('Bench Film', 2025, 'Director', 'Benchmark film', '', '', '', '', 'released')
+    gallery = ('Bench Photo', 'Studio', 'https://images.example.com/bench.jpg', 'Benchmark photo')
+    mutators = [
+        ('event', lambda: w.add_event(*event), lambda i: w.update_event(i, *event), w.delete_event),
+        ('music', lambda: w.add_music(*track), lambda i: w.update_music(i, *track), w.delete_music),
+        ('film', lambda: w.add_film(*film), lambda i: w.update_film(i, *film), w.delete_film),
+        ('gallery_item', lambda: w.add_gallery_item(*gallery), lambda i: w.update_gallery_item(i, *gallery),
+         w.delete_gallery_item),
+        ('booking', lambda: w.add_booking_request('Bench', 'bench@example.com', '', 'Club Night', '2026-01-01',
+                                                   '', '', 'Benchmark'),
+         lambda i: w.update_booking_status(i, 'contacted'), w.delete_booking),
+        ('contact_message', lambda: w.add_contact_message('Bench', 'bench@example.com', '', 'Benchmark'),
+         lambda i: w.update_contact_status(i, 'read'), w.delete_contact_message),
+    ]
+    for name, add, update, delete in mutators:
+        ids = []
+        results[f'add_{name}'] = summarize(measure(lambda: ids.append(add()), repeat))
+        pending = list(ids)
+        results[f'update_{name}'] = summarize(measure(lambda: update(pending.pop()), repeat))
+        results[f'delete_{name}'] = summarize(measure(lambda: delete(ids.pop()), repeat))
+
+    # Adding a header photo activates it, so the seeded active photo is restored afterwards
+    active = w.get_header_photo()
+    ids = []
+    results['add_header_photo'] = summarize(measure(
+        lambda: ids.append(w.add_header_photo(active.photo_path, 'Bench')), repeat))
+    pending = list(ids)
+    results['set_active_header_photo'] = summarize(measure(lambda: w.set_active_header_photo(pending.pop()), repeat))
+    results['delete_header_photo'] = summarize(measure(lambda: w.delete_header_photo(ids.pop()), repeat))
+    w.set_active_header_photo(active.id)
+
+    results['add_press_article'] = summarize(measure(
+        lambda: w.add_press_article('Bench Article', 'Bench Outlet', '2026-01-01', 'https://press.example.com/bench',
+                                    'Benchmark article', ''), repeat))
+    uploaded = next(item for item in w.get_gallery(limit=30) if item.image_variants)
+    variants = json.loads(uploaded.image_variants)
+    results['set_gallery_variants'] = summarize(measure(lambda: w.set_gallery_variants(uploaded.id, variants), repeat))
+    track = next(track for track in w.query_music(limit=20) if track.file_path)
+    audio = site.analyse_audio(track.file_path)
+    results['set_track_audio'] = summarize(measure(lambda: w.set_track_audio(track.id, audio), repeat))
+
+    emails = iter(range(repeat))
+    results['add_subscriber'] = summarize(measure(lambda: w.add_subscriber(f"bench{next(emails)}@example.com",
+                                                                           'Bench'), repeat))
+    # Queued submissions, timed until the group commit acknowledges them
+    queued_emails = iter(range(repeat))
+    queued = [
+        ('queue_booking_request', lambda: w.queue_booking_request('Bench', 'bench@example.com', '', 'Club Night',
+                                                                  '2026-01-01', '', '', 'Queued')),
+        ('queue_contact_message', lambda: w.queue_contact_message('Bench', 'bench@example.com', '', 'Queued')),
+        ('queue_subscriber', lambda: w.queue_subscriber(f"queued{next(queued_emails)}@example.com", 'Bench')),
+    ]
+    for name, submit in queued:
+        results[f'{name} (acknowledged)'] = summarize(measure(
+            lambda: submit().result(timeout=site.SUBMISSION_ACK_TIMEOUT), repeat))
+    return results
+
+# Rendering
+# AppTest only polls for script completion every 100 ms, so render timings come
+# from the app's own instrumentation (the span of the function under test),
+# which also reports the SQL statements run and the bytes sent per rerun.
+RENDER_SCRIPT = '''
+import network_control_center_streamlit as site
+site.count_emitted_bytes()
+site.website = site.get_website()
+site.{function}()
+'''
+PAGE_SCRIPT = '''
+import network_control_center_streamlit as site
+site.main()
+'''
+
+def render_benchmarks(repeat, timeout):
+    """Time the header, each section body and full page runs headlessly with AppTest"""
+    from streamlit.testing.v1 import AppTest
+    monitor = site.perf_monitor
+    results = {}
+
+    def bench(name, function, session_state=None):
+        script = PAGE_SCRIPT if function == 'main' else RENDER_SCRIPT.format(function=function)
+        at = AppTest.from_string(script, default_timeout=timeout)
+        for key, value in (session_state or {}).items():
+            at.session_state[key] = value
+        samples = []
+        try:
+            for run in range(repeat + 1):
+                monitor.reset()
+                at.run()
+                if at.exception:
+                    raise RuntimeError(at.exception[0].message)
+                if run:  # The first run imports the module and warms the caches
+                    samples.append(monitor.recent[function][-1])
+        except RuntimeError as e:
+            results[name] = {'error': str(e)}
+            return
+        results[name] = summarize([seconds for seconds, _, _ in samples])
+        results[name]['queries'] = round(statistics.mean(queries for _, queries, _ in samples), 1)
+        results[name]['kb_sent'] = round(statistics.mean(sent for _, _, sent in samples) / 1024, 1)
+
+    bench('render_header_with_photo', 'render_header_with_photo')
+    for _, render in site.PUBLIC_SECTIONS.values():
+        bench(render.__name__, render.__name__)
+    bench('render_admin_portal', 'render_admin_portal')
+    for section, (label, _) in site.PUBLIC_SECTIONS.items():
+        bench(f'page {section}', 'main', {'nav_section': label})
+    bench('page admin portal', 'main', {'admin_access': True})
+    return results
+
+# Baselines
+def baseline_path(scale):
+    return os.path.join(BASELINE_DIR, f'baseline_{scale}.json')
+
+def compare(results, baseline, threshold, min_ms):
+    """(name, baseline ms, current ms or None if it now fails) for every benchmark that regressed"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None or 'error' in previous:
+            continue
+        if 'error' in current:
+            regressions.append((name, previous['median_ms'], None))
+        elif current['median_ms'] >= min_ms and current['median_ms'] > previous['median_ms'] * threshold:
+            regressions.append((name, previous['median_ms'], current['median_ms']))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--scale', type=int, default=10000, help="rows per main table (10k-1M)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=20, help="timed calls per benchmark")
+    parser.add_argument('--threshold', type=float, default=1.5, help="allowed slowdown vs the baseline median")
+    parser.add_argument('--min-ms', type=float, default=0.1, help="ignore regressions in faster benchmarks")
+    parser.add_argument('--timeout', type=float, default=120, help="seconds allowed per AppTest run")
+    parser.add_argument('--baseline', help="baseline file (default benchmarks/baseline_<scale>.json)")
+    parser.add_argument('--update-baseline', action='store_true', help="write these results as the baseline")
+    parser.add_argument('--skip-render', action='store_true', help="data layer only")
+    parser.add_argument('--keep', action='store_true', help="keep the scratch directory for inspection")
+    args = parser.parse_args()
+
+    # The app keeps its database and media next to the working directory
+    workdir = tempfile.mkdtemp(prefix='yanti_bench_')
+    os.chdir(workdir)
+    website = None
+    try:
+        website = site.get_website()
+        start = time.perf_counter()
+        counts = populate(website, args.scale, args.seed)
+        print(f"Generated {sum(counts.values()):,} rows in {time.perf_counter() - start:.1f}s: "
+              + ', '.join(f"{table} {rows:,}" for table, rows in counts.items()))
+
+        results = data_layer_benchmarks(website, args.repeat)
+        if not args.skip_render:
+            results.update(render_benchmarks(args.repeat, args.timeout))
+    finally:
+        if website is not None:
+            website.close()
+        os.chdir(APP_DIR)
+        if args.keep:
+            print(f"Scratch directory kept at {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    width = max(map(len, results))
+    for name, result in results.items():
+        if 'error' in result:
+            print(f"{name:<{width}}  ERROR {result['error']}")
+        else:
+            print(f"{name:<{width}}  median {result['median_ms']:>10.3f} ms  p95 {result['p95_ms']:>10.3f} ms")
+
+    path = args.baseline or baseline_path(args.scale)
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({'scale': args.scale, 'seed': args.seed, 'repeat': args.repeat,
+                       'python': sys.version.split()[0], 'results': results}, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {path}")
+        return 0
+    if not os.path.exists(path):
+        print(f"No baseline at {path}; run with --update-baseline to record one")
+        return 0
+
+    with open(path) as f:
+        baseline = json.load(f)['results']
+    regressions = compare(results, baseline, args.threshold, args.min_ms)
+    for name, previous, current in regressions:
+        print(f"REGRESSION {name}: {previous:.3f} ms -> " + (f"{current:.3f} ms" if current is not None else "failed"))
+    if regressions:
+        return 1
+    print(f"No regressions beyond {args.threshold}x the baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,312 @@
+"""Concurrent-session load test for the website.
+
+Starts the app with `streamlit run` in a scratch directory, so the real
+yanti_siggs.db is never touched. Then opens N simultaneous Streamlit websocket
+sessions, the way browsers do, at each concurrency level. Every session
+follows one visitor journey:
+
+    land on Home -> switch to Music -> switch to Bookings -> submit the
+    booking form -> switch to Subscribe -> subscribe
+
+It reports rerun latency (p50/p95/p99, from sending a rerun request to the
+script finishing), error rates and the server's peak RSS per level:
+
+    python loadtest.py --levels 1,10,25,50,100
+    python loadtest.py --url http://localhost:8501 --server-pid 1234
+
+With --url the load is sent to a server that is already running, such as the
+Dockerfile container on port 8501. RSS is reported only when --server-pid is
+given.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tornado.websocket import websocket_connect
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(APP_DIR, 'network_control_center_streamlit.py')
+SERVER_START_TIMEOUT = 60  # seconds
+RSS_SAMPLE_INTERVAL = 0.25  # seconds
+MAX_MESSAGE_SIZE = 64 * 1024 * 1024  # The header photo arrives inline
+
+# Navigation labels, as rendered by render_section_nav()
+NAV_LABEL = "Navigate"
+SECTIONS = {"Home": "🏠 Home", "Music": "🎵 Music", "Bookings": "🎤 Bookings", "Subscribe": "💌 Subscribe"}
+
+# Streamlit session client
+class SessionError(Exception):
+    """A rerun raised, reported an error, or did not finish in time"""
+
+class StreamlitSession:
+    """One browser-like websocket session: sends reruns with widget state, reads deltas back"""
+
+    def __init__(self, url, timeout):
+        self.url = url
+        self.timeout = timeout
+        self.conn = None
+        self.widgets = {}      # (element type, label) -> widget element of the latest run
+        self.states = {}       # widget id -> (value field, value), resent on every rerun
+        self.cached = {}       # ForwardMsg hash -> message, for ref_hash replies
+
+    async def connect(self):
+        ws_url = self.url.replace('http', 'ws', 1).rstrip('/') + '/_stcore/stream'
+        self.conn = await asyncio.wait_for(
+            websocket_connect(ws_url, max_message_size=MAX_MESSAGE_SIZE), self.timeout)
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+
+    async def rerun(self, trigger=None):
+        """Rerun the script with the current widget state; returns its latency in seconds"""
+        msg = BackMsg()
+        msg.rerun_script.query_string = ''
+        for widget_id, (field, value) in self.states.items():
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = widget_id
+            if field.endswith('_array_value'):
+                getattr(state, field).data.extend(value)
+            else:
+                setattr(state, field, value)
+        if trigger is not None:
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = trigger
+            state.trigger_value = True
+
+        start = time.perf_counter()
+        await self.conn.write_message(msg.SerializeToString(), binary=True)
+        await asyncio.wait_for(self.read_run(), self.timeout)
+        return time.perf_counter() - start
+
+    async def read_run(self):
+        """Collect the widgets of one script run; raise SessionError on an app error"""
+        widgets, errors = {}, []
+        while True:
+            data = await self.conn.read_message()
+            if data is None:
+                raise SessionError("connection closed by the server")
+            msg = ForwardMsg()
+            msg.ParseFromString(data)
+            if msg.WhichOneof('type') == 'ref_hash':
+                msg = self.cached[msg.ref_hash]
+            elif msg.metadata.cacheable:
+                self.cached[msg.hash] = msg
+
+            kind = msg.WhichOneof('type')
+            if kind == 'delta' and msg.delta.WhichOneof('type') == 'new_element':
+                element = msg.delta.new_element
+                element_type = element.WhichOneof('type')
+                proto = getattr(element, element_type)
+                if element_type == 'exception':
+                    errors.append(proto.message)
+                elif element_type == 'alert' and proto.format == proto.ERROR:
+                    errors.append(proto.body)
+                elif hasattr(proto, 'id') and hasattr(proto, 'label'):
+                    widgets[(element_type, proto.label)] = proto
+            elif kind == 'script_finished':
+                if msg.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue  # st.rerun(): the next run follows on this connection
+                if msg.script_finished != ForwardMsg.FINISHED_SUCCESSFULLY:
+                    raise SessionError("script failed to compile")
+                self.widgets = widgets
+                if errors:
+                    raise SessionError(errors[0].splitlines()[0])
+                return
+
+    def widget(self, element_type, label):
+        proto = self.widgets.get((element_type, label))
+        if proto is None:
+            raise SessionError(f"no {element_type} labelled {label!r} on the page")
+        return proto
+
+    def set(self, element_type, label, field, value):
+        self.states[self.widget(element_type, label).id] = (field, value)
+
+    async def go_to(self, section):
+        radio = self.widget('radio', NAV_LABEL)
+        self.states[radio.id] = ('int_value', list(radio.options).index(SECTIONS[section]))
+        return await self.rerun()
+
+    async def submit(self, label):
+        return await self.rerun(trigger=self.widget('button', label).id)
+
+# Visitor journey
+visitor_ids = itertools.count()
+
+async def visitor_journey(url, timeout, latencies, errors):
+    """Run one visitor's journey, recording latency per step and any error"""
+    visitor = next(visitor_ids)
+    session = StreamlitSession(url, timeout)
+    step = 'connect'
+    try:
+        await session.connect()
+
+        async def timed_step(name, action):
+            nonlocal step
+            step = name
+            latencies.setdefault(name, []).append(await action)
+
+        await timed_step('land on Home', session.rerun())
+        await timed_step('open Music', session.go_to('Music'))
+        await timed_step('open Bookings', session.go_to('Bookings'))
+        session.set('text_input', "Your Name *", 'string_value', f"Load Test {visitor}")
+        session.set('text_input', "Your Email *", 'string_value', f"loadtest{visitor}@example.com")
+        session.set('text_input', "Your Phone *", 'string_value', '+263 77 000 0000')
+        session.set('text_area', "Event Details *", 'string_value', "Load test booking request")
+        await timed_step('submit booking', session.submit("Submit Booking Request"))
+        await timed_step('open Subscribe', session.go_to('Subscribe'))
+        session.set('text_input', "Your Name", 'string_value', f"Load Test {visitor}")
+        session.set('text_input', "Your Email *", 'string_value', f"loadtest{visitor}@example.com")
+        await timed_step('subscribe', session.submit("Subscribe"))
+    except (SessionError, asyncio.TimeoutError, OSError) as e:
+        errors.append((step, str(e) or type(e).__name__))
+    finally:
+        session.close()
+
+# Server
+def start_server(port, workdir):
+    """Start `streamlit run` on `port` in `workdir`; returns the process once it is healthy"""
+    env = dict(os.environ, YANTI_MEDIA_PORT='0')  # Any free port for the media server
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', APP_PATH, f'--server.port={port}',
+         '--server.headless=true', '--browser.gatherUsageStats=false'],
+        cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"streamlit exited with status {process.returncode}")
+        try:
+            with urllib.request.urlopen(f'http://localhost:{port}/_stcore/health', timeout=1):
+                return process
+        except OSError:
+            time.sleep(0.25)
+    process.terminate()
+    raise RuntimeError(f"streamlit did not become healthy within {SERVER_START_TIMEOUT}s")
+
+def rss_bytes(pid):
+    """Resident set size of a process (Linux), or None if unavailable"""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+async def sample_rss(pid, peak, stop):
+    """Track the peak RSS of `pid` until `stop` is set"""
+    while not stop.is_set():
+        rss = rss_bytes(pid)
+        if rss is not None:
+            peak[0] = max(peak[0] or 0, rss)
+        await asyncio.sleep(RSS_SAMPLE_INTERVAL)
+
+# Reporting
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+async def run_level(url, sessions, timeout, pid):
+    """Run `sessions` concurrent journeys; returns the level's report"""
+    latencies, errors, peak = {}, [], [None]
+    stop = asyncio.Event()
+    sampler = asyncio.ensure_future(sample_rss(pid, peak, stop)) if pid else None
+    start = time.perf_counter()
+    await asyncio.gather(*(visitor_journey(url, timeout, latencies, errors) for _ in range(sessions)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    if sampler:
+        await sampler
+
+    reruns = [latency for step in latencies.values() for latency in step]
+    report = {
+        'sessions': sessions,
+        'seconds': round(elapsed, 2),
+        'reruns': len(reruns),
+        'failed_sessions': len(errors),
+        'error_rate': round(len(errors) / sessions, 4),
+        'errors': sorted({f"{step}: {message}" for step, message in errors}),
+        'peak_rss_mb': round(peak[0] / 1024 / 1024, 1) if peak[0] else None,
+        'steps': {},
+    }
+    for name, values in [('all reruns', reruns)] + list(latencies.items()):
+        if values:
+            report['steps'][name] = {
+                'p50_ms': round(statistics.median(values) * 1000, 1),
+                'p95_ms': round(percentile(values, 0.95) * 1000, 1),
+                'p99_ms': round(percentile(values, 0.99) * 1000, 1),
+                'count': len(values),
+            }
+    return report
+
+def print_report(report):
+    rss = f"{report['peak_rss_mb']} MB" if report['peak_rss_mb'] is not None else "n/a"
+    print(f"\n{report['sessions']} sessions: {report['reruns']} reruns in {report['seconds']}s, "
+          f"{report['failed_sessions']} failed ({report['error_rate']:.1%}), peak server RSS {rss}")
+    for name, step in report['steps'].items():
+        print(f"  {name:<16} p50 {step['p50_ms']:>8.1f} ms  p95 {step['p95_ms']:>8.1f} ms  "
+              f"p99 {step['p99_ms']:>8.1f} ms  ({step['count']})")
+    for error in report['errors']:
+        print(f"  ERROR {error}")
+
+async def run(args, url, pid):
+    reports = []
+    for sessions in args.levels:
+        report = await run_level(url, sessions, args.timeout, pid)
+        print_report(report)
+        reports.append(report)
+        if report['error_rate'] > args.max_error_rate:
+            print(f"\nStopping: error rate above {args.max_error_rate:.0%}")
+            break
+    return reports
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--levels', default='1,5,10,25,50',
+                        type=lambda text: [int(level) for level in text.split(',')],
+                        help="comma-separated concurrent session counts, run in order")
+    parser.add_argument('--port', type=int, default=8599, help="port for the locally started server")
+    parser.add_argument('--url', help="load an already running server instead of starting one")
+    parser.add_argument('--server-pid', type=int, help="process to report RSS for when using --url")
+    parser.add_argument('--timeout', type=float, default=60, help="seconds allowed per rerun")
+    parser.add_argument('--max-error-rate', type=float, default=0.5, help="stop ramping above this error rate")
+    parser.add_argument('--output', help="also write the reports to this JSON file")
+    args = parser.parse_args()
+
+    server, workdir = None, None
+    if args.url:
+        url, pid = args.url, args.server_pid
+    else:
+        workdir = tempfile.mkdtemp(prefix='yanti_load_')
+        server = start_server(args.port, workdir)
+        url, pid = f'http://localhost:{args.port}', server.pid
+        print(f"Started streamlit (pid {pid}) on {url}, working directory {workdir}")
+
+    try:
+        reports = asyncio.run(run(args, url, pid))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(reports, f, indent=2)
+    return 1 if any(report['failed_sessions'] for report in reports) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
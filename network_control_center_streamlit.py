@@ -1,505 +1,1170 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 import sqlite3
 import pandas as pd
 from datetime import datetime
 import json
 import random
 import os
+import time
 import base64
-from PIL import Image
+import hashlib
+from PIL import Image, ImageOps, features
 import io
 import requests
+from requests.adapters import HTTPAdapter
+import threading
+import queue
+import atexit
+import functools
+import inspect
+import bisect
+import http.server
+import ipaddress
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import urllib.parse
+import re
+import csv
+import gzip
+import secrets
+import logging
+import wave
+import array
+import mmap
+import sys
+from contextlib import contextmanager
 
-# Yanti Siggs Website Class
-class YantiSiggsWebsite:
-    def __init__(self):
-        self.setup_database()
-        self.initialize_data()
-        
-    def setup_database(self):
-        """Setup SQLite database for website data with migration support"""
-        self.conn = sqlite3.connect('yanti_siggs.db', check_same_thread=False)
-        cursor = self.conn.cursor()
-        
-        # Enable foreign keys
-        cursor.execute('PRAGMA foreign_keys = ON')
-        
-        # Check if tables need migration
-        self.check_and_migrate_tables()
-        
-        self.conn.commit()
+logger = logging.getLogger(__name__)
+
+# Schema migrations
+# Each entry is (version, description, function(cursor)). Pending entries run once
+# at startup, in order, each in its own transaction, and the version reached is
+# recorded in PRAGMA user_version. Append new migrations; never edit applied ones.
+EVENTS_TABLE_SQL = '''
+    CREATE TABLE {name} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT,
+        date TEXT,
+        time TEXT,
+        venue TEXT,
+        description TEXT,
+        image_url TEXT,
+        registration_url TEXT,
+        status TEXT DEFAULT 'upcoming'
+    )
+'''
+EVENTS_COLUMNS = ('id', 'title', 'date', 'time', 'venue', 'description',
+                  'image_url', 'registration_url', 'status')
+
+def migrate_base_schema(cursor):
+    """v1: create the core tables, adopting databases from earlier releases"""
+    # Events table - older releases created it without a date column
+    cursor.execute("PRAGMA table_info(events)")
+    existing = [col[1] for col in cursor.fetchall()]
+    if not existing:
+        cursor.execute(EVENTS_TABLE_SQL.format(name='events'))
+    elif 'date' not in existing:
+        # Rebuild with the current layout, keeping every column both layouts share
+        cursor.execute(EVENTS_TABLE_SQL.format(name='events_new'))
+        shared = ', '.join(col for col in EVENTS_COLUMNS if col in existing)
+        cursor.execute(f'INSERT INTO events_new ({shared}) SELECT {shared} FROM events')
+        cursor.execute('DROP TABLE events')
+        cursor.execute('ALTER TABLE events_new RENAME TO events')
+    
+    # Gallery table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS gallery (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT,
+            category TEXT,
+            image_url TEXT,
+            description TEXT,
+            upload_date DATE DEFAULT CURRENT_DATE
+        )
+    ''')
+    
+    # Music tracks table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS music (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT,
+            album TEXT,
+            year INTEGER,
+            duration TEXT,
+            youtube_url TEXT,
+            spotify_url TEXT,
+            soundcloud_url TEXT,
+            lyrics TEXT,
+            file_path TEXT,
+            genre TEXT
+        )
+    ''')
+    
+    # Film projects table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS films (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT,
+            year INTEGER,
+            role TEXT,
+            description TEXT,
+            trailer_url TEXT,
+            watch_url TEXT,
+            imdb_url TEXT,
+            poster_url TEXT,
+            status TEXT DEFAULT 'released'
+        )
+    ''')
+    
+    # Booking requests table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS bookings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT,
+            email TEXT,
+            phone TEXT,
+            event_type TEXT,
+            event_date TEXT,
+            venue TEXT,
+            budget TEXT,
+            message TEXT,
+            date_submitted DATE DEFAULT CURRENT_DATE,
+            status TEXT DEFAULT 'pending'
+        )
+    ''')
+    
+    # Newsletter subscribers
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS subscribers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT UNIQUE,
+            name TEXT,
+            date_subscribed DATE DEFAULT CURRENT_DATE
+        )
+    ''')
+    
+    # Contact messages
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS contacts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT,
+            email TEXT,
+            phone TEXT,
+            message TEXT,
+            date_sent DATE DEFAULT CURRENT_DATE,
+            status TEXT DEFAULT 'unread'
+        )
+    ''')
+    
+    # Admin users table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS admin_users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE,
+            password_hash TEXT,
+            email TEXT,
+            full_name TEXT,
+            role TEXT DEFAULT 'admin',
+            created_at DATE DEFAULT CURRENT_DATE
+        )
+    ''')
+    
+    # Header photo table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS header_photos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            photo_path TEXT,
+            upload_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+            is_active BOOLEAN DEFAULT 1,
+            caption TEXT,
+            position TEXT DEFAULT 'right'
+        )
+    ''')
+    
+    # Insert default admin if not exists
+    cursor.execute("SELECT COUNT(*) FROM admin_users WHERE username = 'admin'")
+    if cursor.fetchone()[0] == 0:
+        # Default password: Yanti123 (you should change this)
+        cursor.execute(
+            "INSERT INTO admin_users (username, password_hash, email, full_name) VALUES (?, ?, ?, ?)",
+            ('admin', 'pbkdf2:sha256:260000$YOUR_SALT_HERE$your_hash_here', 
+             'admin@yantistudios.com', 'Administrator')
+        )
+    
+    # Activity logs table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS admin_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            admin_id INTEGER,
+            action TEXT,
+            details TEXT,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (admin_id) REFERENCES admin_users(id)
+        )
+    ''')
+    
+    # Press/media table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS press (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT,
+            outlet TEXT,
+            date TEXT,
+            url TEXT,
+            excerpt TEXT,
+            image_url TEXT
+        )
+    ''')
+
+def migrate_sample_content(cursor):
+    """v2: seed sample content into tables that are still empty"""
+    # Check and insert events
+    cursor.execute("SELECT COUNT(*) FROM events")
+    if cursor.fetchone()[0] == 0:
+        sample_events = [
+            ('Club Night DJ Set', '2024-04-20', '10:00 PM - 4:00 AM', 'Club 1940, Harare', 
+             'Main room DJ set featuring house and afrobeat', '', 'https://forms.google.com/example', 'upcoming'),
+            ('Music Festival Performance', '2024-05-15', '8:00 PM - 11:00 PM', 
+             'Harare International Festival', 'Main stage performance at HIFA',
+             '', 'https://forms.google.com/example', 'upcoming'),
+            ('Film Premiere Screening', '2024-04-28', '6:00 PM', 'Ster Kinekor, Borrowdale',
+             'Premiere of latest film project "Urban Dreams"', '', 'https://forms.google.com/example', 'upcoming'),
+            ('DJ Workshop', '2024-05-05', '2:00 PM - 5:00 PM', 'Yanti Studios',
+             'Learn DJ skills with Yanti Siggs', '', 'https://forms.google.com/example', 'upcoming')
+        ]
+        cursor.executemany('INSERT INTO events (title, date, time, venue, description, image_url, registration_url, status) VALUES (?,?,?,?,?,?,?,?)', sample_events)
     
-    def check_and_migrate_tables(self):
-        """Check and migrate existing tables to new schema if needed"""
-        cursor = self.conn.cursor()
-        
-        # Events table - Ensure date column exists
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='events'")
-        if cursor.fetchone():
-            # Check if date column exists
-            cursor.execute("PRAGMA table_info(events)")
-            columns = [col[1] for col in cursor.fetchall()]
-            
-            if 'date' not in columns:
-                # Create new table with correct schema
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS events_new (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        title TEXT,
-                        date TEXT,
-                        time TEXT,
-                        venue TEXT,
-                        description TEXT,
-                        image_url TEXT,
-                        registration_url TEXT,
-                        status TEXT DEFAULT 'upcoming'
-                    )
-                ''')
-                
-                # Copy data from old table if exists
-                try:
-                    cursor.execute("INSERT INTO events_new SELECT * FROM events")
-                except:
-                    # If column mismatch, insert default data
-                    pass
-                
-                # Drop old table and rename new one
-                cursor.execute("DROP TABLE events")
-                cursor.execute("ALTER TABLE events_new RENAME TO events")
-            else:
-                # Table exists with correct columns, just ensure it's correct
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS events (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        title TEXT,
-                        date TEXT,
-                        time TEXT,
-                        venue TEXT,
-                        description TEXT,
-                        image_url TEXT,
-                        registration_url TEXT,
-                        status TEXT DEFAULT 'upcoming'
-                    )
-                ''')
-        else:
-            # Create events table from scratch
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT,
-                    date TEXT,
-                    time TEXT,
-                    venue TEXT,
-                    description TEXT,
-                    image_url TEXT,
-                    registration_url TEXT,
-                    status TEXT DEFAULT 'upcoming'
-                )
-            ''')
-        
-        # Gallery table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS gallery (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT,
-                category TEXT,
-                image_url TEXT,
-                description TEXT,
-                upload_date DATE DEFAULT CURRENT_DATE
-            )
-        ''')
-        
-        # Music tracks table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS music (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT,
-                album TEXT,
-                year INTEGER,
-                duration TEXT,
-                youtube_url TEXT,
-                spotify_url TEXT,
-                soundcloud_url TEXT,
-                lyrics TEXT,
-                file_path TEXT,
-                genre TEXT
-            )
-        ''')
-        
-        # Film projects table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS films (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT,
-                year INTEGER,
-                role TEXT,
-                description TEXT,
-                trailer_url TEXT,
-                watch_url TEXT,
-                imdb_url TEXT,
-                poster_url TEXT,
-                status TEXT DEFAULT 'released'
-            )
-        ''')
-        
-        # Booking requests table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS bookings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT,
-                email TEXT,
-                phone TEXT,
-                event_type TEXT,
-                event_date TEXT,
-                venue TEXT,
-                budget TEXT,
-                message TEXT,
-                date_submitted DATE DEFAULT CURRENT_DATE,
-                status TEXT DEFAULT 'pending'
-            )
+    # Check and insert gallery items
+    cursor.execute("SELECT COUNT(*) FROM gallery")
+    if cursor.fetchone()[0] == 0:
+        sample_gallery = [
+            ('DJ Performance', 'Music', 'https://images.unsplash.com/photo-1493225457124-a3eb161ffa5f?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80', 'Live DJ set at Club 1940'),
+            ('Film Set', 'Film', 'https://images.unsplash.com/photo-1542204165-65bf26472b9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80', 'On set directing latest film'),
+            ('Studio Session', 'Studio', 'https://images.unsplash.com/photo-1511379938547-c1f69419868d?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80', 'Recording session at Yanti Studios'),
+            ('Red Carpet', 'Events', 'https://images.unsplash.com/photo-1492684223066-e9e4aab4d25e?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80', 'Awards night red carpet')
+        ]
+        cursor.executemany('INSERT INTO gallery (title, category, image_url, description) VALUES (?,?,?,?)', sample_gallery)
+    
+    # Check and insert music
+    cursor.execute("SELECT COUNT(*) FROM music")
+    if cursor.fetchone()[0] == 0:
+        sample_music = [
+            ('Urban Dreams', 'Urban Dreams EP', 2023, '5:15', 
+             'https://youtube.com/watch?v=example1', 'https://spotify.com/track/example1',
+             'https://soundcloud.com/yantisiggs/urban-dreams', 'Lyrics for Urban Dreams...', '', 'Afro House'),
+            ('Harare Nights', 'City Vibes', 2022, '4:45',
+             'https://youtube.com/watch?v=example2', 'https://spotify.com/track/example2',
+             'https://soundcloud.com/yantisiggs/harare-nights', 'Lyrics for Harare Nights...', '', 'House'),
+            ('African Queen', 'Roots', 2024, '6:20',
+             'https://youtube.com/watch?v=example3', 'https://spotify.com/track/example3',
+             'https://soundcloud.com/yantisiggs/african-queen', 'Lyrics for African Queen...', '', 'Afrobeat')
+        ]
+        cursor.executemany('INSERT INTO music (title, album, year, duration, youtube_url, spotify_url, soundcloud_url, lyrics, file_path, genre) VALUES (?,?,?,?,?,?,?,?,?,?)', sample_music)
+    
+    # Check and insert films
+    cursor.execute("SELECT COUNT(*) FROM films")
+    if cursor.fetchone()[0] == 0:
+        sample_films = [
+            ('Urban Dreams', 2023, 'Director/Actress', 
+             'A coming-of-age story set in contemporary Harare',
+             'https://youtube.com/watch?v=trailer1', 'https://netflix.com/urbandreams',
+             'https://imdb.com/title/tt1234567', 'https://via.placeholder.com/300x450/9b59b6/ffffff?text=Urban+Dreams', 'released'),
+            ('Shadows of the Past', 2021, 'Producer/Actress',
+             'Psychological thriller exploring family secrets',
+             'https://youtube.com/watch?v=trailer2', 'https://showmax.com/shadows',
+             'https://imdb.com/title/tt2345678', 'https://via.placeholder.com/300x450/3498db/ffffff?text=Shadows', 'released'),
+            ('City Lights', 2024, 'Director/Writer',
+             'Upcoming film about urban life and ambition',
+             '', '', '', 'https://via.placeholder.com/300x450/e74c3c/ffffff?text=City+Lights', 'in_production')
+        ]
+        cursor.executemany('INSERT INTO films (title, year, role, description, trailer_url, watch_url, imdb_url, poster_url, status) VALUES (?,?,?,?,?,?,?,?,?)', sample_films)
+    
+    # Check and insert press
+    cursor.execute("SELECT COUNT(*) FROM press")
+    if cursor.fetchone()[0] == 0:
+        sample_press = [
+            ('Yanti Siggs: The Multifaceted Creative', 'The Herald', '2024-03-15',
+             'https://herald.co.zw/yanti-siggs-interview', 
+             'From DJ decks to film sets, Yanti Siggs is redefining what it means to be a creative entrepreneur in Zimbabwe...',
+             'https://images.unsplash.com/photo-1511735111819-9a3f7709049c?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80'),
+            ('New Film "Urban Dreams" Premieres', 'Zimbo Jam', '2024-02-28',
+             'https://zimbodesk.com/urban-dreams-premiere',
+             'Yanti Siggs\' latest film explores the dreams and challenges of urban youth...',
+             'https://images.unsplash.com/photo-1489599809516-9827b6d1cf13?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80'),
+            ('DJ Yanti Rocks Harare Club Scene', 'Club Magazine', '2024-01-20',
+             'https://clubmag.co.zw/dj-yanti-review',
+             'Yanti Siggs brought the house down with her signature blend of afro house and electronic beats...',
+             'https://images.unsplash.com/photo-1470225620780-dba8ba36b745?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80')
+        ]
+        cursor.executemany('INSERT INTO press (title, outlet, date, url, excerpt, image_url) VALUES (?,?,?,?,?,?)', sample_press)
+
+def migrate_gallery_variants(cursor):
+    """v3: per-size image metadata (JSON) for uploaded gallery images"""
+    cursor.execute('ALTER TABLE gallery ADD COLUMN image_variants TEXT')
+
+# One index per hot access pattern: the equality column first, then the ORDER BY
+# column, so each query walks an index range instead of scanning and sorting
+# (SQLite reads an index backwards for DESC and appends rowid to every index).
+# No ANALYZE: statistics taken on a handful of sample rows would steer the
+# planner towards scan-and-sort, which is exactly what breaks down at scale.
+QUERY_INDEXES = [
+    ('idx_events_status_date', 'events (status, date)'),
+    ('idx_events_date', 'events (date)'),
+    ('idx_music_genre_year', 'music (genre, year)'),
+    ('idx_music_year', 'music (year)'),
+    ('idx_films_status_year', 'films (status, year)'),
+    ('idx_films_year', 'films (year)'),
+    ('idx_press_date', 'press (date)'),
+    ('idx_gallery_category_upload', 'gallery (category, upload_date)'),
+    ('idx_gallery_upload', 'gallery (upload_date)'),
+    ('idx_header_photos_active', 'header_photos (is_active, upload_date)'),
+    ('idx_bookings_submitted', 'bookings (date_submitted)'),
+    ('idx_subscribers_subscribed', 'subscribers (date_subscribed)'),
+    ('idx_contacts_sent', 'contacts (date_sent)'),
+]
+
+def migrate_query_indexes(cursor):
+    """v4: secondary indexes for every hot query"""
+    for name, definition in QUERY_INDEXES:
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {definition}')
+
+# Admin dashboard counters live in one single-row table kept current by triggers,
+# so the dashboard reads every metric with one primary-key lookup. Each entry is
+# (counter column, table, condition on the row); no condition counts every row.
+DASHBOARD_COUNTERS = [
+    ('total_events', 'events', None),
+    ('upcoming_events', 'events', "{row}.status IS 'upcoming'"),
+    ('total_music', 'music', None),
+    ('total_films', 'films', None),
+    ('total_gallery', 'gallery', None),
+    ('total_press', 'press', None),
+    ('total_bookings', 'bookings', None),
+    ('pending_bookings', 'bookings', "{row}.status IS 'pending'"),
+    ('contacted_bookings', 'bookings', "{row}.status IS 'contacted'"),
+    ('confirmed_bookings', 'bookings', "{row}.status IS 'confirmed'"),
+    ('declined_bookings', 'bookings', "{row}.status IS 'declined'"),
+    ('completed_bookings', 'bookings', "{row}.status IS 'completed'"),
+    ('total_subscribers', 'subscribers', None),
+    ('total_contacts', 'contacts', None),
+    ('unread_contacts', 'contacts', "{row}.status IS 'unread'"),
+    ('active_header_photos', 'header_photos', '{row}.is_active IS 1'),
+]
+
+def counter_delta(condition, row):
+    """SQL expression that is 1 when `row` (NEW or OLD) counts towards a counter"""
+    return '1' if condition is None else f'({condition.format(row=row)})'
+
+def migrate_dashboard_counters(cursor):
+    """v5: dashboard counters table, backfilled and maintained by triggers"""
+    columns = ', '.join(f'{name} INTEGER NOT NULL DEFAULT 0' for name, _, _ in DASHBOARD_COUNTERS)
+    cursor.execute(f'CREATE TABLE dashboard_counters (id INTEGER PRIMARY KEY CHECK (id = 1), {columns})')
+    
+    backfill = ', '.join(
+        f'(SELECT COUNT(*) FROM {table} AS t WHERE {counter_delta(condition, "t")})'
+        for _, table, condition in DASHBOARD_COUNTERS
+    )
+    names = ', '.join(name for name, _, _ in DASHBOARD_COUNTERS)
+    cursor.execute(f'INSERT INTO dashboard_counters (id, {names}) VALUES (1, {backfill})')
+    
+    tables = {}
+    for name, table, condition in DASHBOARD_COUNTERS:
+        tables.setdefault(table, []).append((name, condition))
+    for table, counters in tables.items():
+        added = ', '.join(f'{name} = {name} + {counter_delta(c, "NEW")}' for name, c in counters)
+        removed = ', '.join(f'{name} = {name} - {counter_delta(c, "OLD")}' for name, c in counters)
+        cursor.execute(f'''
+            CREATE TRIGGER {table}_counters_insert AFTER INSERT ON {table}
+            BEGIN UPDATE dashboard_counters SET {added} WHERE id = 1; END
         ''')
-        
-        # Newsletter subscribers
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS subscribers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email TEXT UNIQUE,
-                name TEXT,
-                date_subscribed DATE DEFAULT CURRENT_DATE
-            )
+        cursor.execute(f'''
+            CREATE TRIGGER {table}_counters_delete AFTER DELETE ON {table}
+            BEGIN UPDATE dashboard_counters SET {removed} WHERE id = 1; END
         ''')
-        
-        # Contact messages
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS contacts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT,
-                email TEXT,
-                phone TEXT,
-                message TEXT,
-                date_sent DATE DEFAULT CURRENT_DATE,
-                status TEXT DEFAULT 'unread'
+        conditional = [(name, c) for name, c in counters if c is not None]
+        if conditional:
+            moved = ', '.join(
+                f'{name} = {name} + {counter_delta(c, "NEW")} - {counter_delta(c, "OLD")}'
+                for name, c in conditional
             )
-        ''')
+            cursor.execute(f'''
+                CREATE TRIGGER {table}_counters_update AFTER UPDATE ON {table}
+                BEGIN UPDATE dashboard_counters SET {moved} WHERE id = 1; END
+            ''')
+
+def migrate_inbox_indexes(cursor):
+    """v6: status-filtered inbox pages walk (status, date) instead of sorting"""
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_bookings_status_submitted ON bookings (status, date_submitted)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_contacts_status_sent ON contacts (status, date_sent)')
+
+def migrate_music_title_indexes(cursor):
+    """v7: alphabetical catalogue browsing, overall and within a genre"""
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_music_title ON music (title COLLATE NOCASE)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_music_genre_title ON music (genre, title COLLATE NOCASE)')
+
+# Site search
+# One FTS5 index covers every public content table. Each row's rowid encodes its
+# source as id * SEARCH_KIND_SLOTS + kind, so results map straight back to a row
+# and section without a join. Each entry is (kind, table, section, title, detail,
+# body columns); triggers keep the index in step with every insert, edit and delete.
+SEARCH_KIND_SLOTS = 8
+SEARCH_SOURCES = [
+    (1, 'music', 'Music', 'title', 'album', 'lyrics'),
+    (2, 'films', 'Films', 'title', 'role', 'description'),
+    (3, 'events', 'Events', 'title', 'venue', 'description'),
+    (4, 'press', 'Press', 'title', 'outlet', 'excerpt'),
+    (5, 'gallery', 'Gallery', 'title', 'category', 'description'),
+]
+SEARCH_WEIGHTS = (10.0, 4.0, 1.0)  # bm25 weight of title, detail, body
+SEARCH_RESULT_LIMIT = 30
+
+def migrate_search_index(cursor):
+    """v8: FTS5 site search index, backfilled and maintained by triggers"""
+    cursor.execute('''
+        CREATE VIRTUAL TABLE search_index USING fts5(
+            title, detail, body,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        )
+    ''')
+    for kind, table, _, title, detail, body in SEARCH_SOURCES:
+        key = f'{{row}}.id * {SEARCH_KIND_SLOTS} + {kind}'
+        insert = (f'INSERT INTO search_index (rowid, title, detail, body) '
+                  f'VALUES ({key}, {{row}}.{title}, {{row}}.{detail}, {{row}}.{body})')
+        delete = f'DELETE FROM search_index WHERE rowid = {key}'
         
-        # Admin users table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS admin_users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE,
-                password_hash TEXT,
-                email TEXT,
-                full_name TEXT,
-                role TEXT DEFAULT 'admin',
-                created_at DATE DEFAULT CURRENT_DATE
-            )
+        cursor.execute(f'INSERT INTO search_index (rowid, title, detail, body) '
+                       f'SELECT id * {SEARCH_KIND_SLOTS} + {kind}, {title}, {detail}, {body} FROM {table}')
+        cursor.execute(f'''
+            CREATE TRIGGER {table}_search_insert AFTER INSERT ON {table}
+            BEGIN {insert.format(row='NEW')}; END
         ''')
-        
-        # Header photo table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS header_photos (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                photo_path TEXT,
-                upload_date DATETIME DEFAULT CURRENT_TIMESTAMP,
-                is_active BOOLEAN DEFAULT 1,
-                caption TEXT,
-                position TEXT DEFAULT 'right'
-            )
+        cursor.execute(f'''
+            CREATE TRIGGER {table}_search_update AFTER UPDATE OF {title}, {detail}, {body} ON {table}
+            BEGIN {delete.format(row='OLD')}; {insert.format(row='NEW')}; END
         ''')
-        
-        # Insert default admin if not exists
-        cursor.execute("SELECT COUNT(*) FROM admin_users WHERE username = 'admin'")
-        if cursor.fetchone()[0] == 0:
-            # Default password: Yanti123 (you should change this)
-            cursor.execute(
-                "INSERT INTO admin_users (username, password_hash, email, full_name) VALUES (?, ?, ?, ?)",
-                ('admin', 'pbkdf2:sha256:260000$YOUR_SALT_HERE$your_hash_here', 
-                 'admin@yantistudios.com', 'Administrator')
-            )
-        
-        # Activity logs table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS admin_logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                admin_id INTEGER,
-                action TEXT,
-                details TEXT,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (admin_id) REFERENCES admin_users(id)
-            )
+        cursor.execute(f'''
+            CREATE TRIGGER {table}_search_delete AFTER DELETE ON {table}
+            BEGIN {delete.format(row='OLD')}; END
         ''')
+
+def migrate_track_audio(cursor):
+    """v9: analysed duration, format and waveform peaks of uploaded tracks"""
+    for column in ('duration_seconds REAL', 'bitrate INTEGER', 'sample_rate INTEGER',
+                   'channels INTEGER', 'waveform BLOB'):
+        cursor.execute(f'ALTER TABLE music ADD COLUMN {column}')
+    cursor.execute("SELECT id, file_path FROM music WHERE COALESCE(file_path, '') != ''")
+    for music_id, file_path in cursor.fetchall():
+        audio = analyse_audio(file_path)
+        if audio:
+            cursor.execute(TRACK_AUDIO_UPDATE, (*audio, music_id))
+
+def search_match_expression(text):
+    """Turn free text into an FTS5 query: every word must match, the last as a prefix"""
+    words = re.findall(r'\w+', text.lower())
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+SCHEMA_MIGRATIONS = [
+    (1, 'base schema', migrate_base_schema),
+    (2, 'sample content', migrate_sample_content),
+    (3, 'gallery image variants', migrate_gallery_variants),
+    (4, 'query indexes', migrate_query_indexes),
+    (5, 'dashboard counters', migrate_dashboard_counters),
+    (6, 'inbox status indexes', migrate_inbox_indexes),
+    (7, 'music title indexes', migrate_music_title_indexes),
+    (8, 'site search index', migrate_search_index),
+    (9, 'track audio analysis', migrate_track_audio),
+]
+
+# Hot getters, the arguments to call them with and the index their SQL must use.
+# check_query_plans() runs each one uncached, captures the statement it issues and
+# checks its EXPLAIN QUERY PLAN, so the checks can never drift from the real SQL.
+QUERY_PLAN_CHECKS = [
+    ('upcoming events', 'get_events', {'limit': 10}, 'idx_events_status_date'),
+    ('all events', 'get_all_events', {}, 'idx_events_date'),
+    ('music by genre', 'query_music', {'genre': 'House', 'limit': 10}, 'idx_music_genre_year'),
+    ('all music', 'query_music', {'limit': 10}, 'idx_music_year'),
+    ('music page by genre, oldest first', 'query_music',
+     {'genre': 'House', 'sort': 'oldest', 'limit': 20, 'offset': 20}, 'idx_music_genre_year'),
+    ('music A-Z', 'query_music', {'sort': 'title', 'limit': 20}, 'idx_music_title'),
+    ('music A-Z by genre', 'query_music', {'genre': 'House', 'sort': 'title', 'limit': 20}, 'idx_music_genre_title'),
+    ('films by status', 'get_films', {}, 'idx_films_status_year'),
+    ('all films', 'get_all_films', {}, 'idx_films_year'),
+    ('press', 'get_press', {'limit': 10}, 'idx_press_date'),
+    ('gallery by category', 'get_gallery', {'category': 'Music', 'limit': 10}, 'idx_gallery_category_upload'),
+    ('gallery', 'get_gallery', {'limit': 10}, 'idx_gallery_upload'),
+    ('active header photo', 'get_header_photo', {}, 'idx_header_photos_active'),
+    ('recent subscribers', 'get_recent_subscribers', {}, 'idx_subscribers_subscribed'),
+    ('bookings page', 'get_bookings_page', {}, 'idx_bookings_submitted'),
+    ('next bookings page', 'get_bookings_page', {'after': ('2030-01-01', 1000)}, 'idx_bookings_submitted'),
+    ('pending bookings page', 'get_bookings_page', {'status': 'pending'}, 'idx_bookings_status_submitted'),
+    ('contacts page', 'get_contacts_page', {}, 'idx_contacts_sent'),
+    ('next contacts page', 'get_contacts_page', {'after': ('2030-01-01', 1000)}, 'idx_contacts_sent'),
+    ('unread contacts page', 'get_contacts_page', {'status': 'unread'}, 'idx_contacts_status_sent'),
+]
+
+# Record types
+# Getters return lightweight named tuples (no per-row __dict__) and SELECT exactly
+# the record's fields, so list views read only the columns they display and the UI
+# refers to fields by name instead of by position. Fields listed in
+# COMPUTED_FIELDS are SQL expressions rather than stored columns.
+Event = namedtuple('Event', 'id title date time venue description image_url registration_url status')
+TrackSummary = namedtuple('TrackSummary', 'id title album year duration youtube_url spotify_url '
+                                          'soundcloud_url file_path genre has_lyrics '
+                                          'duration_seconds bitrate sample_rate channels waveform')
+Film = namedtuple('Film', 'id title year role description trailer_url watch_url imdb_url poster_url status')
+PressArticle = namedtuple('PressArticle', 'id title outlet date url excerpt')
+GalleryItem = namedtuple('GalleryItem', 'id title category image_url description upload_date image_variants')
+HeaderPhoto = namedtuple('HeaderPhoto', 'id photo_path upload_date is_active caption position')
+Booking = namedtuple('Booking', 'id name email phone event_type event_date venue budget message date_submitted status')
+Contact = namedtuple('Contact', 'id name email phone message date_sent status')
+
+COMPUTED_FIELDS = {
+    'has_lyrics': "COALESCE(lyrics, '') != ''",  # Lyrics themselves load on demand
+}
+
+def record_columns(record):
+    """SELECT list for a record type"""
+    return ', '.join(f'{COMPUTED_FIELDS[field]} AS {field}' if field in COMPUTED_FIELDS else field
+                     for field in record._fields)
+
+# Music catalogue
+# Sort orders accepted by query_music(); each one is served by an index (id breaks
+# ties in rowid order, which every index carries), so pages never sort in memory.
+MUSIC_SORTS = {
+    'newest': 'year DESC, id DESC',
+    'oldest': 'year ASC, id ASC',
+    'title': 'title COLLATE NOCASE, id',
+}
+MUSIC_SORT_LABELS = {"Newest First": 'newest', "Oldest First": 'oldest', "Alphabetical": 'title'}
+MUSIC_GENRES = ["House", "Afro House", "Afrobeat", "Electronic", "Deep House", "Tech House"]
+MUSIC_PAGE_SIZE = 20
+
+# Admin inboxes
+# Booking and contact inboxes are read one page at a time with keyset pagination:
+# each page starts strictly after the (date, id) of the previous page's last row,
+# so a page costs the same however much history sits behind it.
+BOOKING_STATUSES = ["pending", "contacted", "confirmed", "declined", "completed"]
+CONTACT_STATUSES = ["unread", "read", "replied", "archived"]
+INBOX_PAGE_SIZES = [10, 25, 50, 100]
+SUBSCRIBER_PREVIEW_ROWS = 200
+
+# Performance instrumentation
+# main(), the render_* functions and every YantiSiggsWebsite method record their
+# wall time, the SQL statements they ran (counted by a sqlite trace callback) and
+# the bytes of Streamlit messages they emitted. Counters are per thread, so each
+# session's rerun is measured on its own; spans are inclusive of nested spans.
+# The admin Performance tab shows the last PERF_WINDOW samples per section, and
+# the media server exposes cumulative histograms in Prometheus text format at
+# /metrics, to loopback clients or, with YANTI_METRICS_TOKEN set, to requests
+# carrying it as a bearer token. Set YANTI_PERF=0 to switch the instrumentation off.
+PERF_ENABLED = os.environ.get('YANTI_PERF', '1') != '0'
+PERF_WINDOW = 500  # Recent samples kept per section
+PERF_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)  # seconds
+METRICS_PATH = '/metrics'
+METRICS_TOKEN = os.environ.get('YANTI_METRICS_TOKEN', '')
+
+class PerformanceMonitor:
+    """Per-section wall time, SQL statement and emitted-byte counters"""
+    
+    def __init__(self, window):
+        self.window = window
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.recent = {}  # section -> deque of (seconds, statements, bytes)
+        self.totals = {}  # section -> [calls, seconds, statements, bytes, per-bucket counts]
+    
+    def count_query(self, statement):
+        """sqlite3 trace callback: one statement ran on this thread"""
+        self.local.queries = getattr(self.local, 'queries', 0) + 1
+    
+    def count_bytes(self, size):
+        """One message of `size` bytes was sent to the browser from this thread"""
+        self.local.bytes = getattr(self.local, 'bytes', 0) + size
+    
+    @contextmanager
+    def span(self, section):
+        """Measure the enclosed block under `section`"""
+        local = self.local
+        queries, sent = getattr(local, 'queries', 0), getattr(local, 'bytes', 0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(section, time.perf_counter() - start,
+                        getattr(local, 'queries', 0) - queries, getattr(local, 'bytes', 0) - sent)
+    
+    def record(self, section, seconds, queries, sent):
+        """Add one sample to the rolling window and the cumulative totals"""
+        with self.lock:
+            recent = self.recent.get(section)
+            if recent is None:
+                recent = self.recent[section] = deque(maxlen=self.window)
+                self.totals[section] = [0, 0.0, 0, 0, [0] * (len(PERF_BUCKETS) + 1)]
+            recent.append((seconds, queries, sent))
+            totals = self.totals[section]
+            totals[0] += 1
+            totals[1] += seconds
+            totals[2] += queries
+            totals[3] += sent
+            totals[4][bisect.bisect_left(PERF_BUCKETS, seconds)] += 1
+    
+    def summary(self):
+        """One row per section over the rolling window, slowest p95 first"""
+        with self.lock:
+            samples = {section: list(recent) for section, recent in self.recent.items()}
+        rows = []
+        for section, recent in samples.items():
+            times = sorted(seconds for seconds, _, _ in recent)
+            rows.append({
+                'Section': section,
+                'Calls': len(times),
+                'p50 ms': round(times[len(times) // 2] * 1000, 2),
+                'p95 ms': round(times[min(int(len(times) * 0.95), len(times) - 1)] * 1000, 2),
+                'Max ms': round(times[-1] * 1000, 2),
+                'Queries/call': round(sum(q for _, q, _ in recent) / len(recent), 2),
+                'KB/call': round(sum(b for _, _, b in recent) / len(recent) / 1024, 2),
+            })
+        return sorted(rows, key=lambda row: row['p95 ms'], reverse=True)
+    
+    def histogram(self, section):
+        """Sample counts per PERF_BUCKETS bucket over the rolling window"""
+        counts = [0] * (len(PERF_BUCKETS) + 1)
+        with self.lock:
+            for seconds, _, _ in self.recent.get(section, ()):
+                counts[bisect.bisect_left(PERF_BUCKETS, seconds)] += 1
+        labels = [f"≤{bound * 1000:g} ms" for bound in PERF_BUCKETS] + [f">{PERF_BUCKETS[-1] * 1000:g} ms"]
+        return dict(zip(labels, counts))
+    
+    def prometheus(self):
+        """Cumulative counters in the Prometheus text exposition format"""
+        with self.lock:
+            totals = {section: (calls, seconds, queries, sent, list(buckets))
+                      for section, (calls, seconds, queries, sent, buckets) in self.totals.items()}
+        lines = ['# HELP yanti_section_seconds Wall time of instrumented sections',
+                 '# TYPE yanti_section_seconds histogram']
+        for section, (calls, seconds, _, _, buckets) in sorted(totals.items()):
+            cumulative = 0
+            for bound, count in zip(PERF_BUCKETS + (float('inf'),), buckets):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else f'{bound:g}'
+                lines.append(f'yanti_section_seconds_bucket{{section="{section}",le="{le}"}} {cumulative}')
+            lines.append(f'yanti_section_seconds_sum{{section="{section}"}} {seconds:.6f}')
+            lines.append(f'yanti_section_seconds_count{{section="{section}"}} {calls}')
+        lines += ['# HELP yanti_section_queries_total SQL statements run by instrumented sections',
+                  '# TYPE yanti_section_queries_total counter']
+        lines += [f'yanti_section_queries_total{{section="{section}"}} {queries}'
+                  for section, (_, _, queries, _, _) in sorted(totals.items())]
+        lines += ['# HELP yanti_section_bytes_total Bytes sent to the browser by instrumented sections',
+                  '# TYPE yanti_section_bytes_total counter']
+        lines += [f'yanti_section_bytes_total{{section="{section}"}} {sent}'
+                  for section, (_, _, _, sent, _) in sorted(totals.items())]
+        return '\n'.join(lines) + '\n'
+    
+    def reset(self):
+        """Forget every sample"""
+        with self.lock:
+            self.recent.clear()
+            self.totals.clear()
+
+@st.cache_resource(show_spinner=False)
+def get_performance_monitor():
+    """Performance monitor shared by all sessions"""
+    return PerformanceMonitor(PERF_WINDOW)
+
+perf_monitor = get_performance_monitor()
+
+def instrument(func, section):
+    """Wrap `func` so each call is measured under `section`"""
+    if not PERF_ENABLED:
+        return func
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with perf_monitor.span(section):
+            return func(*args, **kwargs)
+    return wrapper
+
+def timed(func):
+    """Measure the decorated function under its own name"""
+    return instrument(func, func.__name__)
+
+def timed_methods(skip=()):
+    """Measure every public method of the decorated class as Class.method"""
+    def decorator(cls):
+        for name, member in list(vars(cls).items()):
+            if callable(member) and not name.startswith('_') and name not in skip:
+                setattr(cls, name, instrument(member, f"{cls.__name__}.{name}"))
+        return cls
+    return decorator
+
+def count_emitted_bytes():
+    """Count the bytes of every message this script run sends to the browser"""
+    ctx = get_script_run_ctx()
+    if not PERF_ENABLED or ctx is None or getattr(ctx, 'perf_counted', False):
+        return
+    enqueue = ctx._enqueue
+    def counting_enqueue(msg):
+        perf_monitor.count_bytes(msg.ByteSize())
+        enqueue(msg)
+    ctx._enqueue = counting_enqueue
+    ctx.perf_counted = True
+
+# Query cache
+# Public content only changes when an admin edits it, so getters decorated with
+# cached_query are answered from memory. Every table has a generation counter;
+# mutators decorated with invalidates bump it, which retires that table's entries.
+def cached_query(table):
+    """Cache a getter's result per (method, arguments) until `table` changes"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            with self.cache_lock:
+                generation = self.table_generations.get(table, 0)
+                entry = self.query_cache.setdefault(table, {}).get(key)
+            if entry is not None and entry[0] == generation:
+                return entry[1]
+            
+            result = method(self, *args, **kwargs)
+            with self.cache_lock:
+                # Only keep the result if no write landed while it was being read
+                if self.table_generations.get(table, 0) == generation:
+                    self.query_cache[table][key] = (generation, result)
+            return result
+        return wrapper
+    return decorator
+
+def invalidates(*tables):
+    """Bump the generation of `tables` once the decorated write has run"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self.bump_generation(*tables)
+        return wrapper
+    return decorator
+
+# Connection pool
+# Every session thread shares one writer connection (writes are serialized by a
+# lock) and a fixed set of reader connections. In WAL mode readers see the last
+# committed state and never wait for the writer, so page views keep flowing while
+# bookings and admin edits are being written.
+DB_READER_CONNECTIONS = 4
+DB_PRAGMAS = (
+    'PRAGMA busy_timeout = 5000',
+    'PRAGMA synchronous = NORMAL',   # Durable at checkpoints; safe with WAL
+    'PRAGMA cache_size = -16000',    # ~16 MB page cache per connection
+    'PRAGMA mmap_size = 268435456',  # Map up to 256 MB of the file
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA foreign_keys = ON',
+)
+
+class ConnectionPool:
+    """One writer connection plus a fixed set of reader connections, all in WAL mode"""
+    
+    def __init__(self, path, readers, on_statement=None):
+        self.path = path
+        self.on_statement = on_statement
+        self.local = threading.local()  # .statements collects this thread's SQL during capture()
+        self.writer_lock = threading.RLock()
+        self.writer_conn = self.connect()
+        self.writer_conn.execute('PRAGMA journal_mode = WAL')
+        self.reader_count = readers
+        self.readers = queue.Queue()
+        for _ in range(readers):
+            self.readers.put(self.connect())
+    
+    def connect(self):
+        """Open a connection with the tuned pragmas applied"""
+        conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+        for pragma in DB_PRAGMAS:
+            conn.execute(pragma)
+        conn.set_trace_callback(self.trace)
+        return conn
+    
+    def trace(self, statement):
+        """Trace callback: report to on_statement and to a capture running on this thread"""
+        if self.on_statement:
+            self.on_statement(statement)
+        statements = getattr(self.local, 'statements', None)
+        if statements is not None:
+            statements.append(statement)
+    
+    @contextmanager
+    def capture(self):
+        """Collect the SQL this thread runs inside the block (with parameters filled in)"""
+        self.local.statements = statements = []
+        try:
+            yield statements
+        finally:
+            self.local.statements = None
+    
+    @contextmanager
+    def reader(self):
+        """Borrow a reader connection's cursor (waits if all readers are busy)"""
+        conn = self.readers.get()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+            self.readers.put(conn)
+    
+    @contextmanager
+    def writer(self):
+        """Borrow the writer connection's cursor; commit on success, roll back on error"""
+        with self.writer_lock:
+            cursor = self.writer_conn.cursor()
+            try:
+                yield cursor
+                self.writer_conn.commit()
+            except Exception:
+                self.writer_conn.rollback()
+                raise
+            finally:
+                cursor.close()
+    
+    def close(self):
+        """Close every connection, waiting for borrowed readers to come back"""
+        with self.writer_lock:
+            self.writer_conn.close()
+        readers = [self.readers.get() for _ in range(self.reader_count)]
+        for conn in readers:
+            conn.close()
+            self.readers.put(conn)  # Late borrowers get ProgrammingError rather than waiting forever
+
+# Public form submissions
+# Booking requests, contact messages and newsletter signups are queued and written
+# by one background thread that commits whatever has arrived within
+# SUBMISSION_FLUSH_INTERVAL as a single transaction (group commit). Each submission
+# returns a Future that resolves only after its batch has committed; forms wait up
+# to SUBMISSION_ACK_TIMEOUT for it and only confirm a submission once it has
+# committed (a slower commit is reported as received but still being saved). A full queue raises
+# queue.Full so the form can ask the visitor to retry instead of piling up.
+SUBMISSION_QUEUE_SIZE = 2000
+SUBMISSION_BATCH_SIZE = 256
+SUBMISSION_FLUSH_INTERVAL = 0.005  # seconds
+SUBMISSION_ACK_TIMEOUT = 2  # seconds a form may wait for its commit acknowledgement
+BUSY_MESSAGE = "We're receiving a lot of messages right now. Please try again in a moment."
+SUBMISSION_FAILED_MESSAGE = "Sorry, we couldn't save your submission. Please try again."
+SUBMISSION_PENDING_MESSAGE = ("We've received your submission and are still saving it. "
+                              "If you don't hear from us within a few days, please send it again.")
+
+BOOKING_INSERT_SQL = '''
+    INSERT INTO bookings (name, email, phone, event_type, event_date, venue, budget, message)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+CONTACT_INSERT_SQL = '''
+    INSERT INTO contacts (name, email, phone, message)
+    VALUES (?, ?, ?, ?)
+'''
+SUBSCRIBER_INSERT_SQL = 'INSERT INTO subscribers (email, name) VALUES (?, ?)'
+
+class SubmissionWriter:
+    """Background writer that batches queued INSERTs into group commits"""
+    
+    def __init__(self, data_layer):
+        self.data_layer = data_layer
+        self.queue = queue.Queue(maxsize=SUBMISSION_QUEUE_SIZE)
+        self.thread = threading.Thread(target=self.run, name="submission-writer", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+    
+    def submit(self, sql, params):
+        """Queue one INSERT; the Future yields its rowid, or None if it hit a UNIQUE constraint"""
+        future = Future()
+        self.queue.put_nowait((sql, params, future))  # queue.Full signals backpressure
+        return future
+    
+    def run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + SUBMISSION_FLUSH_INTERVAL
+            while len(batch) < SUBMISSION_BATCH_SIZE:
+                try:
+                    item = self.queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is None:
+                    self.commit(batch)
+                    return
+                batch.append(item)
+            self.commit(batch)
+    
+    def commit(self, batch):
+        """Write a batch in one transaction, then acknowledge every submission in it"""
+        results = []
+        try:
+            with self.data_layer.write() as cursor:
+                for sql, params, future in batch:
+                    try:
+                        cursor.execute(sql, params)
+                        results.append((future, cursor.lastrowid))
+                    except sqlite3.IntegrityError:
+                        results.append((future, None))  # e.g. email already subscribed
+        except Exception as e:
+            logger.exception("Failed to commit %d queued submissions", len(batch))
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+        for future, rowid in results:
+            future.set_result(rowid)
+    
+    def close(self):
+        """Flush queued submissions and stop the writer thread"""
+        atexit.unregister(self.close)
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join(timeout=5)
+
+def submission_saved(future):
+    """Wait up to SUBMISSION_ACK_TIMEOUT for a queued submission; True once committed, else False after telling the visitor"""
+    try:
+        future.result(timeout=SUBMISSION_ACK_TIMEOUT)
+    except FutureTimeoutError:
+        # Still queued behind a slow commit (the writer logs it if that fails): not yet durable
+        st.info(SUBMISSION_PENDING_MESSAGE)
+        return False
+    except sqlite3.Error:
+        st.error(SUBMISSION_FAILED_MESSAGE)
+        return False
+    return True
+
+# Yanti Siggs Website Class
+@timed_methods(skip=('read', 'write'))
+class YantiSiggsWebsite:
+    def __init__(self):
+        self.cache_lock = threading.Lock()
+        self.query_cache = {}
+        self.table_generations = {}
+        self.setup_database()
+        self.submissions = SubmissionWriter(self)
         
-        # Press/media table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS press (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT,
-                outlet TEXT,
-                date TEXT,
-                url TEXT,
-                excerpt TEXT,
-                image_url TEXT
-            )
-        ''')
+    def setup_database(self):
+        """Setup SQLite database for website data with migration support"""
+        self.pool = ConnectionPool('yanti_siggs.db', DB_READER_CONNECTIONS,
+                                   perf_monitor.count_query if PERF_ENABLED else None)
+        self.apply_migrations()
+    
+    def close(self):
+        """Commit queued submissions, stop their writer and close the connection pool"""
+        self.submissions.close()
+        self.pool.close()
+    
+    def apply_migrations(self):
+        """Bring the schema up to date; a single PRAGMA read when already current"""
+        with self.read() as cursor:
+            cursor.execute('PRAGMA user_version')
+            current_version = cursor.fetchone()[0]
         
-        self.conn.commit()
-    
-    def initialize_data(self):
-        """Initialize sample data if tables are empty"""
-        cursor = self.conn.cursor()
-        
-        # Check and insert events
-        cursor.execute("SELECT COUNT(*) FROM events")
-        if cursor.fetchone()[0] == 0:
-            sample_events = [
-                ('Club Night DJ Set', '2024-04-20', '10:00 PM - 4:00 AM', 'Club 1940, Harare', 
-                 'Main room DJ set featuring house and afrobeat', '', 'https://forms.google.com/example', 'upcoming'),
-                ('Music Festival Performance', '2024-05-15', '8:00 PM - 11:00 PM', 
-                 'Harare International Festival', 'Main stage performance at HIFA',
-                 '', 'https://forms.google.com/example', 'upcoming'),
-                ('Film Premiere Screening', '2024-04-28', '6:00 PM', 'Ster Kinekor, Borrowdale',
-                 'Premiere of latest film project "Urban Dreams"', '', 'https://forms.google.com/example', 'upcoming'),
-                ('DJ Workshop', '2024-05-05', '2:00 PM - 5:00 PM', 'Yanti Studios',
-                 'Learn DJ skills with Yanti Siggs', '', 'https://forms.google.com/example', 'upcoming')
-            ]
-            cursor.executemany('INSERT INTO events (title, date, time, venue, description, image_url, registration_url, status) VALUES (?,?,?,?,?,?,?,?)', sample_events)
-        
-        # Check and insert gallery items
-        cursor.execute("SELECT COUNT(*) FROM gallery")
-        if cursor.fetchone()[0] == 0:
-            sample_gallery = [
-                ('DJ Performance', 'Music', 'https://images.unsplash.com/photo-1493225457124-a3eb161ffa5f?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80', 'Live DJ set at Club 1940'),
-                ('Film Set', 'Film', 'https://images.unsplash.com/photo-1542204165-65bf26472b9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80', 'On set directing latest film'),
-                ('Studio Session', 'Studio', 'https://images.unsplash.com/photo-1511379938547-c1f69419868d?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80', 'Recording session at Yanti Studios'),
-                ('Red Carpet', 'Events', 'https://images.unsplash.com/photo-1492684223066-e9e4aab4d25e?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80', 'Awards night red carpet')
-            ]
-            cursor.executemany('INSERT INTO gallery (title, category, image_url, description) VALUES (?,?,?,?)', sample_gallery)
-        
-        # Check and insert music
-        cursor.execute("SELECT COUNT(*) FROM music")
-        if cursor.fetchone()[0] == 0:
-            sample_music = [
-                ('Urban Dreams', 'Urban Dreams EP', 2023, '5:15', 
-                 'https://youtube.com/watch?v=example1', 'https://spotify.com/track/example1',
-                 'https://soundcloud.com/yantisiggs/urban-dreams', 'Lyrics for Urban Dreams...', '', 'Afro House'),
-                ('Harare Nights', 'City Vibes', 2022, '4:45',
-                 'https://youtube.com/watch?v=example2', 'https://spotify.com/track/example2',
-                 'https://soundcloud.com/yantisiggs/harare-nights', 'Lyrics for Harare Nights...', '', 'House'),
-                ('African Queen', 'Roots', 2024, '6:20',
-                 'https://youtube.com/watch?v=example3', 'https://spotify.com/track/example3',
-                 'https://soundcloud.com/yantisiggs/african-queen', 'Lyrics for African Queen...', '', 'Afrobeat')
-            ]
-            cursor.executemany('INSERT INTO music (title, album, year, duration, youtube_url, spotify_url, soundcloud_url, lyrics, file_path, genre) VALUES (?,?,?,?,?,?,?,?,?,?)', sample_music)
-        
-        # Check and insert films
-        cursor.execute("SELECT COUNT(*) FROM films")
-        if cursor.fetchone()[0] == 0:
-            sample_films = [
-                ('Urban Dreams', 2023, 'Director/Actress', 
-                 'A coming-of-age story set in contemporary Harare',
-                 'https://youtube.com/watch?v=trailer1', 'https://netflix.com/urbandreams',
-                 'https://imdb.com/title/tt1234567', 'https://via.placeholder.com/300x450/9b59b6/ffffff?text=Urban+Dreams', 'released'),
-                ('Shadows of the Past', 2021, 'Producer/Actress',
-                 'Psychological thriller exploring family secrets',
-                 'https://youtube.com/watch?v=trailer2', 'https://showmax.com/shadows',
-                 'https://imdb.com/title/tt2345678', 'https://via.placeholder.com/300x450/3498db/ffffff?text=Shadows', 'released'),
-                ('City Lights', 2024, 'Director/Writer',
-                 'Upcoming film about urban life and ambition',
-                 '', '', '', 'https://via.placeholder.com/300x450/e74c3c/ffffff?text=City+Lights', 'in_production')
-            ]
-            cursor.executemany('INSERT INTO films (title, year, role, description, trailer_url, watch_url, imdb_url, poster_url, status) VALUES (?,?,?,?,?,?,?,?,?)', sample_films)
-        
-        # Check and insert press
-        cursor.execute("SELECT COUNT(*) FROM press")
-        if cursor.fetchone()[0] == 0:
-            sample_press = [
-                ('Yanti Siggs: The Multifaceted Creative', 'The Herald', '2024-03-15',
-                 'https://herald.co.zw/yanti-siggs-interview', 
-                 'From DJ decks to film sets, Yanti Siggs is redefining what it means to be a creative entrepreneur in Zimbabwe...',
-                 'https://images.unsplash.com/photo-1511735111819-9a3f7709049c?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80'),
-                ('New Film "Urban Dreams" Premieres', 'Zimbo Jam', '2024-02-28',
-                 'https://zimbodesk.com/urban-dreams-premiere',
-                 'Yanti Siggs\' latest film explores the dreams and challenges of urban youth...',
-                 'https://images.unsplash.com/photo-1489599809516-9827b6d1cf13?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80'),
-                ('DJ Yanti Rocks Harare Club Scene', 'Club Magazine', '2024-01-20',
-                 'https://clubmag.co.zw/dj-yanti-review',
-                 'Yanti Siggs brought the house down with her signature blend of afro house and electronic beats...',
-                 'https://images.unsplash.com/photo-1470225620780-dba8ba36b745?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80')
-            ]
-            cursor.executemany('INSERT INTO press (title, outlet, date, url, excerpt, image_url) VALUES (?,?,?,?,?,?)', sample_press)
-        
-        self.conn.commit()
+        for version, description, migration in SCHEMA_MIGRATIONS:
+            if version <= current_version:
+                continue
+            with self.write() as cursor:
+                cursor.execute('BEGIN')
+                migration(cursor)
+                cursor.execute(f'PRAGMA user_version = {version}')
+    
+    def read(self):
+        """Borrow a cursor on a reader connection"""
+        return self.pool.reader()
+    
+    def write(self):
+        """Borrow a cursor on the writer connection; commits on success"""
+        return self.pool.writer()
+    
+    def bump_generation(self, *tables):
+        """Invalidate cached query results for the given tables"""
+        with self.cache_lock:
+            for table in tables:
+                self.table_generations[table] = self.table_generations.get(table, 0) + 1
+                self.query_cache.pop(table, None)
+    
+    def select(self, record, clause, params=()):
+        """SELECT `record`'s fields with the given FROM/WHERE/ORDER BY clause; returns records"""
+        with self.read() as cursor:
+            cursor.execute(f'SELECT {record_columns(record)} {clause}', params)
+            return list(map(record._make, cursor.fetchall()))
     
     # Existing methods...
+    @cached_query('events')
     def get_events(self, limit=None, status='upcoming'):
         """Get events from database"""
-        cursor = self.conn.cursor()
-        try:
-            if limit:
-                cursor.execute('SELECT * FROM events WHERE status=? ORDER BY date LIMIT ?', (status, limit))
-            else:
-                cursor.execute('SELECT * FROM events WHERE status=? ORDER BY date', (status,))
-            return cursor.fetchall()
-        except sqlite3.OperationalError as e:
-            # If there's still an error, recreate the table
-            if "no such column: date" in str(e):
-                self.recreate_events_table()
-                return []
-            return []
+        if limit:
+            return self.select(Event, 'FROM events WHERE status=? ORDER BY date LIMIT ?', (status, limit))
+        return self.select(Event, 'FROM events WHERE status=? ORDER BY date', (status,))
     
     def get_music(self, limit=None, genre=None):
-        """Get music from database"""
-        cursor = self.conn.cursor()
+        """Get music from database, newest first"""
+        return self.query_music(genre=genre, limit=limit)
+    
+    @cached_query('music')
+    def query_music(self, genre=None, sort='newest', limit=None, offset=0):
+        """One indexed query over the catalogue: optional genre, a MUSIC_SORTS order, limit/offset"""
+        clause = 'FROM music'
+        params = []
         if genre:
-            cursor.execute('SELECT * FROM music WHERE genre=? ORDER BY year DESC LIMIT ?', (genre, limit))
-        elif limit:
-            cursor.execute('SELECT * FROM music ORDER BY year DESC LIMIT ?', (limit,))
-        else:
-            cursor.execute('SELECT * FROM music ORDER BY year DESC')
-        return cursor.fetchall()
+            clause += ' WHERE genre = ?'
+            params.append(genre)
+        clause += f' ORDER BY {MUSIC_SORTS[sort]}'
+        if limit:
+            clause += ' LIMIT ? OFFSET ?'
+            params.extend([limit, offset])
+        return self.select(TrackSummary, clause, params)
+    
+    @cached_query('music')
+    def get_lyrics(self, track_id):
+        """Lyrics for one track, fetched only when a visitor asks for them"""
+        with self.read() as cursor:
+            cursor.execute('SELECT lyrics FROM music WHERE id = ?', (track_id,))
+            row = cursor.fetchone()
+            return row[0] if row else None
+    
+    @cached_query('music')
+    def count_music(self, genre=None):
+        """Number of tracks, optionally within one genre"""
+        with self.read() as cursor:
+            if genre:
+                cursor.execute('SELECT COUNT(*) FROM music WHERE genre = ?', (genre,))
+            else:
+                cursor.execute('SELECT COUNT(*) FROM music')
+            return cursor.fetchone()[0]
     
+    @cached_query('films')
     def get_films(self, limit=None, status='released'):
         """Get films from database"""
-        cursor = self.conn.cursor()
         if limit:
-            cursor.execute('SELECT * FROM films WHERE status=? ORDER BY year DESC LIMIT ?', (status, limit))
-        else:
-            cursor.execute('SELECT * FROM films WHERE status=? ORDER BY year DESC', (status,))
-        return cursor.fetchall()
+            return self.select(Film, 'FROM films WHERE status=? ORDER BY year DESC LIMIT ?', (status, limit))
+        return self.select(Film, 'FROM films WHERE status=? ORDER BY year DESC', (status,))
     
+    @cached_query('press')
     def get_press(self, limit=None):
         """Get press articles"""
-        cursor = self.conn.cursor()
         if limit:
-            cursor.execute('SELECT * FROM press ORDER BY date DESC LIMIT ?', (limit,))
-        else:
-            cursor.execute('SELECT * FROM press ORDER BY date DESC')
-        return cursor.fetchall()
+            return self.select(PressArticle, 'FROM press ORDER BY date DESC LIMIT ?', (limit,))
+        return self.select(PressArticle, 'FROM press ORDER BY date DESC')
     
+    @cached_query('gallery')
     def get_gallery(self, category=None, limit=None):
-        """Get gallery items"""
-        cursor = self.conn.cursor()
+        """Get gallery items, newest first"""
+        clause = 'FROM gallery'
+        params = []
         if category:
-            cursor.execute('SELECT * FROM gallery WHERE category=? ORDER BY upload_date DESC LIMIT ?', (category, limit))
-        else:
-            cursor.execute('SELECT * FROM gallery ORDER BY upload_date DESC LIMIT ?', (limit,))
-        return cursor.fetchall()
+            clause += ' WHERE category=?'
+            params.append(category)
+        clause += ' ORDER BY upload_date DESC'
+        if limit:
+            clause += ' LIMIT ?'
+            params.append(limit)
+        return self.select(GalleryItem, clause, params)
     
     def add_booking_request(self, name, email, phone, event_type, event_date, venue, budget, message):
         """Add booking request to database"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO bookings (name, email, phone, event_type, event_date, venue, budget, message)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (name, email, phone, event_type, event_date, venue, budget, message))
-        self.conn.commit()
-        return cursor.lastrowid
+        with self.write() as cursor:
+            cursor.execute(BOOKING_INSERT_SQL, (name, email, phone, event_type, event_date, venue, budget, message))
+            return cursor.lastrowid
+    
+    def queue_booking_request(self, name, email, phone, event_type, event_date, venue, budget, message):
+        """Queue a booking request for the background writer; returns its Future"""
+        return self.submissions.submit(BOOKING_INSERT_SQL, (name, email, phone, event_type, event_date, venue, budget, message))
     
     def add_subscriber(self, email, name):
         """Add newsletter subscriber"""
-        cursor = self.conn.cursor()
         try:
-            cursor.execute('INSERT INTO subscribers (email, name) VALUES (?, ?)', (email, name))
-            self.conn.commit()
+            with self.write() as cursor:
+                cursor.execute(SUBSCRIBER_INSERT_SQL, (email, name))
             return True
         except sqlite3.IntegrityError:
             return False  # Email already exists
     
+    def queue_subscriber(self, email, name):
+        """Queue a newsletter signup; the Future yields None if the email is already subscribed"""
+        return self.submissions.submit(SUBSCRIBER_INSERT_SQL, (email, name))
+    
     def add_contact_message(self, name, email, phone, message):
         """Add contact message"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO contacts (name, email, phone, message)
-            VALUES (?, ?, ?, ?)
-        ''', (name, email, phone, message))
-        self.conn.commit()
-        return cursor.lastrowid
+        with self.write() as cursor:
+            cursor.execute(CONTACT_INSERT_SQL, (name, email, phone, message))
+            return cursor.lastrowid
     
+    def queue_contact_message(self, name, email, phone, message):
+        """Queue a contact message for the background writer; returns its Future"""
+        return self.submissions.submit(CONTACT_INSERT_SQL, (name, email, phone, message))
+    
+    @invalidates('press')
     def add_press_article(self, title, outlet, date, url, excerpt, image_url):
         """Add press article"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO press (title, outlet, date, url, excerpt, image_url)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (title, outlet, date, url, excerpt, image_url))
-        self.conn.commit()
-        return cursor.lastrowid
+        with self.write() as cursor:
+            cursor.execute('''
+                INSERT INTO press (title, outlet, date, url, excerpt, image_url)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (title, outlet, date, url, excerpt, image_url))
+            return cursor.lastrowid
     
     # HEADER PHOTO METHODS
+    @cached_query('header_photos')
     def get_header_photo(self):
         """Get the active header photo"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT * FROM header_photos 
+        photos = self.select(HeaderPhoto, '''
+            FROM header_photos 
             WHERE is_active = 1 
             ORDER BY upload_date DESC 
             LIMIT 1
         ''')
-        return cursor.fetchone()
+        return photos[0] if photos else None
     
+    @invalidates('header_photos')
     def add_header_photo(self, photo_path, caption="", position="right"):
         """Add a new header photo and deactivate old ones"""
-        cursor = self.conn.cursor()
-        
-        # First, deactivate all existing photos
-        cursor.execute('UPDATE header_photos SET is_active = 0 WHERE is_active = 1')
-        
-        # Insert new photo
-        cursor.execute('''
-            INSERT INTO header_photos (photo_path, caption, position, is_active)
-            VALUES (?, ?, ?, 1)
-        ''', (photo_path, caption, position))
-        
-        self.conn.commit()
-        return cursor.lastrowid
+        with self.write() as cursor:
+            # First, deactivate all existing photos
+            cursor.execute('UPDATE header_photos SET is_active = 0 WHERE is_active = 1')
+            
+            # Insert new photo
+            cursor.execute('''
+                INSERT INTO header_photos (photo_path, caption, position, is_active)
+                VALUES (?, ?, ?, 1)
+            ''', (photo_path, caption, position))
+            return cursor.lastrowid
     
     def get_all_header_photos(self):
         """Get all header photos"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM header_photos ORDER BY upload_date DESC')
-        return cursor.fetchall()
+        return self.select(HeaderPhoto, 'FROM header_photos ORDER BY upload_date DESC')
     
+    @invalidates('header_photos')
     def set_active_header_photo(self, photo_id):
         """Set a specific photo as active"""
-        cursor = self.conn.cursor()
-        
-        # Deactivate all photos
-        cursor.execute('UPDATE header_photos SET is_active = 0')
-        
-        # Activate the selected photo
-        cursor.execute('UPDATE header_photos SET is_active = 1 WHERE id = ?', (photo_id,))
-        
-        self.conn.commit()
-        return cursor.rowcount
+        with self.write() as cursor:
+            # Deactivate all photos
+            cursor.execute('UPDATE header_photos SET is_active = 0')
+            
+            # Activate the selected photo
+            cursor.execute('UPDATE header_photos SET is_active = 1 WHERE id = ?', (photo_id,))
+            return cursor.rowcount
     
+    @invalidates('header_photos')
     def delete_header_photo(self, photo_id):
         """Delete a header photo"""
-        cursor = self.conn.cursor()
-        
-        # Get the photo path to delete the file
-        cursor.execute('SELECT photo_path FROM header_photos WHERE id = ?', (photo_id,))
-        result = cursor.fetchone()
-        
-        if result:
-            photo_path = result[0]
-            # Delete the file if it exists
-            if photo_path and os.path.exists(photo_path):
-                try:
-                    os.remove(photo_path)
-                except:
-                    pass  # Ignore file deletion errors
-        
-        # Delete from database
-        cursor.execute('DELETE FROM header_photos WHERE id = ?', (photo_id,))
-        self.conn.commit()
-        return cursor.rowcount
+        with self.write() as cursor:
+            # The file is reclaimed by the media reconciler once nothing references it
+            cursor.execute('DELETE FROM header_photos WHERE id = ?', (photo_id,))
+            return cursor.rowcount
     
     # ADMIN METHODS
     def verify_admin(self, username, password):
         """Verify admin credentials"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM admin_users WHERE username = ?', (username,))
-        admin = cursor.fetchone()
+        with self.read() as cursor:
+            cursor.execute('SELECT * FROM admin_users WHERE username = ?', (username,))
+            admin = cursor.fetchone()
         if admin:
             # In production, use proper password hashing
             # For now, using simple check (you should implement proper hashing)
@@ -507,277 +1172,1152 @@ class YantiSiggsWebsite:
                 return admin
         return None
     
+    @invalidates('events')
     def add_event(self, title, date, time, venue, description, image_url, registration_url, status='upcoming'):
         """Add new event"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO events (title, date, time, venue, description, image_url, registration_url, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (title, date, time, venue, description, image_url, registration_url, status))
-        self.conn.commit()
-        return cursor.lastrowid
+        with self.write() as cursor:
+            cursor.execute('''
+                INSERT INTO events (title, date, time, venue, description, image_url, registration_url, status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (title, date, time, venue, description, image_url, registration_url, status))
+            return cursor.lastrowid
     
+    @invalidates('events')
     def update_event(self, event_id, title, date, time, venue, description, image_url, registration_url, status):
         """Update existing event"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            UPDATE events 
-            SET title=?, date=?, time=?, venue=?, description=?, image_url=?, registration_url=?, status=?
-            WHERE id=?
-        ''', (title, date, time, venue, description, image_url, registration_url, status, event_id))
-        self.conn.commit()
-        return cursor.rowcount
+        with self.write() as cursor:
+            cursor.execute('''
+                UPDATE events 
+                SET title=?, date=?, time=?, venue=?, description=?, image_url=?, registration_url=?, status=?
+                WHERE id=?
+            ''', (title, date, time, venue, description, image_url, registration_url, status, event_id))
+            return cursor.rowcount
     
+    @invalidates('events')
     def delete_event(self, event_id):
         """Delete event"""
-        cursor = self.conn.cursor()
-        cursor.execute('DELETE FROM events WHERE id = ?', (event_id,))
-        self.conn.commit()
-        return cursor.rowcount
+        with self.write() as cursor:
+            cursor.execute('DELETE FROM events WHERE id = ?', (event_id,))
+            return cursor.rowcount
     
+    @invalidates('music')
     def add_music(self, title, album, year, duration, youtube_url, spotify_url, soundcloud_url, lyrics, file_path, genre):
         """Add new music track"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO music (title, album, year, duration, youtube_url, spotify_url, soundcloud_url, lyrics, file_path, genre)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (title, album, year, duration, youtube_url, spotify_url, soundcloud_url, lyrics, file_path, genre))
-        self.conn.commit()
-        return cursor.lastrowid
+        with self.write() as cursor:
+            cursor.execute('''
+                INSERT INTO music (title, album, year, duration, youtube_url, spotify_url, soundcloud_url, lyrics, file_path, genre)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (title, album, year, duration, youtube_url, spotify_url, soundcloud_url, lyrics, file_path, genre))
+            return cursor.lastrowid
     
+    @invalidates('music')
     def update_music(self, music_id, title, album, year, duration, youtube_url, spotify_url, soundcloud_url, lyrics, file_path, genre):
         """Update music track"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            UPDATE music 
-            SET title=?, album=?, year=?, duration=?, youtube_url=?, spotify_url=?, soundcloud_url=?, lyrics=?, file_path=?, genre=?
-            WHERE id=?
-        ''', (title, album, year, duration, youtube_url, spotify_url, soundcloud_url, lyrics, file_path, genre, music_id))
-        self.conn.commit()
-        return cursor.rowcount
-    
+        with self.write() as cursor:
+            cursor.execute('''
+                UPDATE music 
+                SET title=?, album=?, year=?, duration=?, youtube_url=?, spotify_url=?, soundcloud_url=?, lyrics=?, file_path=?, genre=?
+                WHERE id=?
+            ''', (title, album, year, duration, youtube_url, spotify_url, soundcloud_url, lyrics, file_path, genre, music_id))
+            return cursor.rowcount
+    
+    @invalidates('music')
+    def set_track_audio(self, music_id, audio):
+        """Store the AudioInfo analysed from a track's file"""
+        with self.write() as cursor:
+            cursor.execute(TRACK_AUDIO_UPDATE, (*audio, music_id))
+            return cursor.rowcount
+    
+    @invalidates('music')
     def delete_music(self, music_id):
         """Delete music track"""
-        cursor = self.conn.cursor()
-        cursor.execute('DELETE FROM music WHERE id = ?', (music_id,))
-        self.conn.commit()
-        return cursor.rowcount
+        with self.write() as cursor:
+            cursor.execute('DELETE FROM music WHERE id = ?', (music_id,))
+            return cursor.rowcount
     
+    @invalidates('films')
     def add_film(self, title, year, role, description, trailer_url, watch_url, imdb_url, poster_url, status):
         """Add new film"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO films (title, year, role, description, trailer_url, watch_url, imdb_url, poster_url, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (title, year, role, description, trailer_url, watch_url, imdb_url, poster_url, status))
-        self.conn.commit()
-        return cursor.lastrowid
+        with self.write() as cursor:
+            cursor.execute('''
+                INSERT INTO films (title, year, role, description, trailer_url, watch_url, imdb_url, poster_url, status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (title, year, role, description, trailer_url, watch_url, imdb_url, poster_url, status))
+            return cursor.lastrowid
     
+    @invalidates('films')
     def update_film(self, film_id, title, year, role, description, trailer_url, watch_url, imdb_url, poster_url, status):
         """Update film"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            UPDATE films 
-            SET title=?, year=?, role=?, description=?, trailer_url=?, watch_url=?, imdb_url=?, poster_url=?, status=?
-            WHERE id=?
-        ''', (title, year, role, description, trailer_url, watch_url, imdb_url, poster_url, status, film_id))
-        self.conn.commit()
-        return cursor.rowcount
+        with self.write() as cursor:
+            cursor.execute('''
+                UPDATE films 
+                SET title=?, year=?, role=?, description=?, trailer_url=?, watch_url=?, imdb_url=?, poster_url=?, status=?
+                WHERE id=?
+            ''', (title, year, role, description, trailer_url, watch_url, imdb_url, poster_url, status, film_id))
+            return cursor.rowcount
     
+    @invalidates('films')
     def delete_film(self, film_id):
         """Delete film"""
-        cursor = self.conn.cursor()
-        cursor.execute('DELETE FROM films WHERE id = ?', (film_id,))
-        self.conn.commit()
-        return cursor.rowcount
+        with self.write() as cursor:
+            cursor.execute('DELETE FROM films WHERE id = ?', (film_id,))
+            return cursor.rowcount
     
+    @invalidates('gallery')
     def add_gallery_item(self, title, category, image_url, description):
         """Add new gallery item"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO gallery (title, category, image_url, description)
-            VALUES (?, ?, ?, ?)
-        ''', (title, category, image_url, description))
-        self.conn.commit()
-        return cursor.lastrowid
+        with self.write() as cursor:
+            cursor.execute('''
+                INSERT INTO gallery (title, category, image_url, description)
+                VALUES (?, ?, ?, ?)
+            ''', (title, category, image_url, description))
+            return cursor.lastrowid
     
+    @invalidates('gallery')
     def update_gallery_item(self, gallery_id, title, category, image_url, description):
         """Update gallery item"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            UPDATE gallery 
-            SET title=?, category=?, image_url=?, description=?
-            WHERE id=?
-        ''', (title, category, image_url, description, gallery_id))
-        self.conn.commit()
-        return cursor.rowcount
-    
+        with self.write() as cursor:
+            cursor.execute('''
+                UPDATE gallery 
+                SET title=?, category=?, image_url=?, description=?
+                WHERE id=?
+            ''', (title, category, image_url, description, gallery_id))
+            return cursor.rowcount
+    
+    @invalidates('gallery')
+    def set_gallery_variants(self, gallery_id, variants):
+        """Store the generated image sizes for a gallery item"""
+        with self.write() as cursor:
+            cursor.execute('UPDATE gallery SET image_variants=? WHERE id=?', (json.dumps(variants), gallery_id))
+            return cursor.rowcount
+    
+    @invalidates('gallery')
     def delete_gallery_item(self, gallery_id):
         """Delete gallery item"""
-        cursor = self.conn.cursor()
-        cursor.execute('DELETE FROM gallery WHERE id = ?', (gallery_id,))
-        self.conn.commit()
-        return cursor.rowcount
-    
-    def get_all_bookings(self):
-        """Get all booking requests"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM bookings ORDER BY date_submitted DESC')
-        return cursor.fetchall()
+        with self.write() as cursor:
+            cursor.execute('DELETE FROM gallery WHERE id = ?', (gallery_id,))
+            return cursor.rowcount
+    
+    def get_inbox_page(self, table, record, date_column, status=None, date_from=None, date_to=None,
+                       after=None, limit=25):
+        """One newest-first inbox page; returns (rows, cursor for the next page or None)"""
+        conditions, params = [], []
+        if status:
+            conditions.append('status = ?')
+            params.append(status)
+        if date_from:
+            conditions.append(f'{date_column} >= ?')
+            params.append(str(date_from))
+        if date_to:
+            conditions.append(f'{date_column} <= ?')
+            params.append(str(date_to))
+        if after:
+            conditions.append(f'({date_column}, id) < (?, ?)')
+            params.extend(after)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        
+        # One extra row tells us whether another page follows
+        rows = self.select(record, f'''
+            FROM {table} {where}
+            ORDER BY {date_column} DESC, id DESC
+            LIMIT ?
+        ''', params + [limit + 1])
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, (getattr(rows[-1], date_column), rows[-1].id)
+    
+    def get_bookings_page(self, status=None, date_from=None, date_to=None, after=None, limit=25):
+        """Page of booking requests, newest first"""
+        return self.get_inbox_page('bookings', Booking, 'date_submitted',
+                                   status, date_from, date_to, after, limit)
     
     def update_booking_status(self, booking_id, status):
         """Update booking request status"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            UPDATE bookings 
-            SET status=?
-            WHERE id=?
-        ''', (status, booking_id))
-        self.conn.commit()
-        return cursor.rowcount
-    
-    def get_all_subscribers(self):
-        """Get all newsletter subscribers"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM subscribers ORDER BY date_subscribed DESC')
-        return cursor.fetchall()
-    
-    def get_all_contacts(self):
-        """Get all contact messages"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM contacts ORDER BY date_sent DESC')
-        return cursor.fetchall()
+        with self.write() as cursor:
+            cursor.execute('''
+                UPDATE bookings 
+                SET status=?
+                WHERE id=?
+            ''', (status, booking_id))
+            return cursor.rowcount
+    
+    def delete_booking(self, booking_id):
+        """Delete booking request"""
+        with self.write() as cursor:
+            cursor.execute('DELETE FROM bookings WHERE id = ?', (booking_id,))
+            return cursor.rowcount
+    
+    def get_recent_subscribers(self, limit=SUBSCRIBER_PREVIEW_ROWS):
+        """Get the most recent newsletter subscribers"""
+        with self.read() as cursor:
+            cursor.execute('SELECT id, email, name, date_subscribed FROM subscribers '
+                           'ORDER BY date_subscribed DESC, id DESC LIMIT ?', (limit,))
+            return cursor.fetchall()
+    
+    def export_subscribers(self, out, fmt='csv', date_from=None, date_to=None):
+        """Stream subscribers, oldest first, into a text file as CSV or JSONL; returns the row count"""
+        conditions, params = [], []
+        if date_from:
+            conditions.append('date_subscribed >= ?')
+            params.append(str(date_from))
+        if date_to:
+            conditions.append('date_subscribed <= ?')
+            params.append(str(date_to))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        
+        count = 0
+        with self.read() as cursor:
+            cursor.execute(f'''
+                SELECT id, email, name, date_subscribed FROM subscribers {where}
+                ORDER BY date_subscribed, id
+            ''', params)
+            columns = [col[0] for col in cursor.description]
+            if fmt == 'csv':
+                writer = csv.writer(out)
+                writer.writerow(columns)
+            # Only EXPORT_CHUNK_ROWS rows are ever held in memory
+            while True:
+                rows = cursor.fetchmany(EXPORT_CHUNK_ROWS)
+                if not rows:
+                    break
+                if fmt == 'csv':
+                    writer.writerows(rows)
+                else:
+                    out.writelines(json.dumps(dict(zip(columns, row)), ensure_ascii=False) + '\n' for row in rows)
+                count += len(rows)
+        return count
+    
+    def get_contacts_page(self, status=None, date_from=None, date_to=None, after=None, limit=25):
+        """Page of contact messages, newest first"""
+        return self.get_inbox_page('contacts', Contact, 'date_sent',
+                                   status, date_from, date_to, after, limit)
     
     def update_contact_status(self, contact_id, status):
         """Update contact message status"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            UPDATE contacts 
-            SET status=?
-            WHERE id=?
-        ''', (status, contact_id))
-        self.conn.commit()
-        return cursor.rowcount
-    
+        with self.write() as cursor:
+            cursor.execute('''
+                UPDATE contacts 
+                SET status=?
+                WHERE id=?
+            ''', (status, contact_id))
+            return cursor.rowcount
+    
+    def delete_contact_message(self, contact_id):
+        """Delete contact message"""
+        with self.write() as cursor:
+            cursor.execute('DELETE FROM contacts WHERE id = ?', (contact_id,))
+            return cursor.rowcount
+    
+    @cached_query('events')
     def get_all_events(self):
         """Get all events"""
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute('SELECT * FROM events ORDER BY date DESC')
-            return cursor.fetchall()
-        except sqlite3.OperationalError as e:
-            if "no such column: date" in str(e):
-                # Recreate table and try again
-                self.recreate_events_table()
-                cursor.execute('SELECT * FROM events ORDER BY date DESC')
-                return cursor.fetchall()
-            return []
+        return self.select(Event, 'FROM events ORDER BY date DESC')
     
+    @cached_query('films')
     def get_all_films(self):
         """Get all films"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM films ORDER BY year DESC')
-        return cursor.fetchall()
+        return self.select(Film, 'FROM films ORDER BY year DESC')
     
     def get_all_music(self):
         """Get all music"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM music ORDER BY year DESC')
-        return cursor.fetchall()
-    
-    def recreate_events_table(self):
-        """Recreate events table with correct schema"""
-        cursor = self.conn.cursor()
-        
-        # Drop existing table
-        cursor.execute('DROP TABLE IF EXISTS events')
-        
-        # Create new table with correct schema
-        cursor.execute('''
-            CREATE TABLE events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT,
-                date TEXT,
-                time TEXT,
-                venue TEXT,
-                description TEXT,
-                image_url TEXT,
-                registration_url TEXT,
-                status TEXT DEFAULT 'upcoming'
-            )
-        ''')
-        
-        # Insert sample data
-        sample_events = [
-            ('Club Night DJ Set', '2024-04-20', '10:00 PM - 4:00 AM', 'Club 1940, Harare', 
-             'Main room DJ set featuring house and afrobeat', '', 'https://forms.google.com/example', 'upcoming'),
-            ('Music Festival Performance', '2024-05-15', '8:00 PM - 11:00 PM', 
-             'Harare International Festival', 'Main stage performance at HIFA',
-             '', 'https://forms.google.com/example', 'upcoming'),
-            ('Film Premiere Screening', '2024-04-28', '6:00 PM', 'Ster Kinekor, Borrowdale',
-             'Premiere of latest film project "Urban Dreams"', '', 'https://forms.google.com/example', 'upcoming'),
-            ('DJ Workshop', '2024-05-05', '2:00 PM - 5:00 PM', 'Yanti Studios',
-             'Learn DJ skills with Yanti Siggs', '', 'https://forms.google.com/example', 'upcoming')
-        ]
-        cursor.executemany('INSERT INTO events (title, date, time, venue, description, image_url, registration_url, status) VALUES (?,?,?,?,?,?,?,?)', sample_events)
-        
-        self.conn.commit()
+        return self.query_music()
+    
+    def search(self, text, limit=SEARCH_RESULT_LIMIT):
+        """Full-text search across the public catalogue, best bm25 match first"""
+        expression = search_match_expression(text)
+        if expression is None:
+            return []
+        sources = {kind: section for kind, _, section, _, _, _ in SEARCH_SOURCES}
+        with self.read() as cursor:
+            cursor.execute(f'''
+                SELECT rowid, title, detail,
+                       snippet(search_index, 2, '**', '**', '…', 16)
+                FROM search_index
+                WHERE search_index MATCH ?
+                ORDER BY bm25(search_index, {', '.join(map(str, SEARCH_WEIGHTS))})
+                LIMIT ?
+            ''', (expression, limit))
+            return [(sources[rowid % SEARCH_KIND_SLOTS], rowid // SEARCH_KIND_SLOTS, title, detail, excerpt)
+                    for rowid, title, detail, excerpt in cursor.fetchall()]
+    
+    @invalidates('events', 'gallery', 'music', 'films', 'press')
+    def clear_test_data(self):
+        """Delete the sample rows seeded by migrate_sample_content"""
+        with self.write() as cursor:
+            cursor.execute("DELETE FROM events WHERE id <= 4")
+            cursor.execute("DELETE FROM gallery WHERE id <= 4")
+            cursor.execute("DELETE FROM music WHERE id <= 3")
+            cursor.execute("DELETE FROM films WHERE id <= 3")
+            cursor.execute("DELETE FROM press WHERE id <= 3")
     
     def get_database_stats(self):
-        """Get database statistics for admin dashboard"""
-        cursor = self.conn.cursor()
-        stats = {}
-        
-        try:
-            # Get event count
-            cursor.execute("SELECT COUNT(*) FROM events")
-            stats['total_events'] = cursor.fetchone()[0]
-        except:
-            stats['total_events'] = 0
+        """Get database statistics for admin dashboard (one row, kept current by triggers)"""
+        with self.read() as cursor:
+            cursor.execute('SELECT * FROM dashboard_counters WHERE id = 1')
+            row = cursor.fetchone()
+            stats = {col[0]: value for col, value in zip(cursor.description, row)}
+        stats['has_header_photo'] = stats['active_header_photos'] > 0
+        return stats
+    
+    def check_query_plans(self):
+        """EXPLAIN the SQL each QUERY_PLAN_CHECKS getter issues; returns (query, expected index, ok, plan) rows"""
+        results = []
+        for label, getter, kwargs, index in QUERY_PLAN_CHECKS:
+            # Unwrapped, so neither the query cache nor instrumentation hides the SQL
+            with self.pool.capture() as statements:
+                inspect.unwrap(getattr(type(self), getter))(self, **kwargs)
+            plan = []
+            with self.read() as cursor:
+                # EXPLAIN does not start a read transaction, so touch the schema first
+                # in case this pooled connection still holds a pre-migration copy of it
+                cursor.execute('SELECT COUNT(*) FROM sqlite_master').fetchone()
+                for statement in statements:
+                    cursor.execute(f'EXPLAIN QUERY PLAN {statement}')
+                    plan.extend(row[3] for row in cursor.fetchall())
+            uses_index = any(f'INDEX {index}' in step for step in plan)
+            sorts = any('TEMP B-TREE' in step for step in plan)
+            results.append((label, index, uses_index and not sorts, '; '.join(plan)))
+        return results
+
+@st.cache_resource
+def get_website():
+    """Create the data layer once per server process and share it across sessions"""
+    return YantiSiggsWebsite()
+
+# Local media server
+# Uploaded files are streamed to the browser straight from disk by a small threaded
+# HTTP server with byte-range support, so players fetch only what they play and the
+# script never reads media into memory. Browsers are only pointed at it once
+# YANTI_MEDIA_URL gives the public address MEDIA_SERVER_PORT is exposed at (use the
+# site's scheme, or HTTPS pages will block it as mixed content); until then the
+# server is not started and files are served through Streamlit as before. It
+# listens on localhost behind a reverse proxy unless YANTI_MEDIA_HOST says otherwise
+# (e.g. 0.0.0.0 to publish the port from a container).
+MEDIA_SERVER_HOST = os.environ.get('YANTI_MEDIA_HOST', '127.0.0.1')
+MEDIA_SERVER_PORT = int(os.environ.get('YANTI_MEDIA_PORT', '8502'))
+MEDIA_BASE_URL = os.environ.get('YANTI_MEDIA_URL', '').rstrip('/')
+MEDIA_DIRECTORIES = ('media', 'music_uploads', 'gallery_uploads', 'header_photos', 'image_cache', 'exports', 'static')
+EXPORTS_DIR = 'exports'  # Served once per DownloadTokens token, as uncached downloads
+MEDIA_CHUNK_SIZE = 64 * 1024
+
+class MediaRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Serve files from the media directories, honouring single byte-range requests"""
+    
+    def __init__(self, *args, metrics=None, metrics_token='', download_tokens=None, **kwargs):
+        # Set first: the base class handles the request in __init__
+        self.metrics = metrics
+        self.metrics_token = metrics_token
+        self.download_tokens = download_tokens
+        super().__init__(*args, **kwargs)
+    
+    def send_head(self):
+        if self.metrics is not None and self.path.split('?', 1)[0] == METRICS_PATH and self.may_read_metrics():
+            return self.send_metrics()
+        path = os.path.realpath(self.translate_path(self.path))
+        relative = os.path.relpath(path, os.path.realpath(self.directory))
+        top = relative.split(os.sep, 1)[0]
+        if top not in MEDIA_DIRECTORIES or not os.path.isfile(path):
+            self.send_error(404, "File not found")
+            return None
+        if top == EXPORTS_DIR:
+            # Subscriber data: only with a token issued to an admin, and only once
+            token = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query).get('token', [''])[0]
+            if self.download_tokens is None or not self.download_tokens.redeem(token, path):
+                self.send_error(404, "File not found")
+                return None
         
-        try:
-            # Get music count
-            cursor.execute("SELECT COUNT(*) FROM music")
-            stats['total_music'] = cursor.fetchone()[0]
-        except:
-            stats['total_music'] = 0
+        f = open(path, 'rb')
+        stat = os.fstat(f.fileno())
+        start, end = 0, stat.st_size - 1
+        byte_range = self.parse_range(self.headers.get('Range'), stat.st_size)
+        if byte_range is False:
+            f.close()
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{stat.st_size}")
+            self.end_headers()
+            return None
         
-        try:
-            # Get film count
-            cursor.execute("SELECT COUNT(*) FROM films")
-            stats['total_films'] = cursor.fetchone()[0]
-        except:
-            stats['total_films'] = 0
+        if byte_range:
+            start, end = byte_range
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{stat.st_size}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Last-Modified", self.date_time_string(stat.st_mtime))
+        if top == EXPORTS_DIR:
+            self.send_header("Content-Disposition", f'attachment; filename="{os.path.basename(path)}"')
+            self.send_header("Cache-Control", "private, no-store")
+            self.send_header("Referrer-Policy", "no-referrer")
+        else:
+            if top in (STATIC_DIR, MEDIA_STORE_DIR):
+                # Content-hashed names: a changed file always gets a new URL
+                self.send_header("Cache-Control", f"public, max-age={STATIC_CACHE_SECONDS}, immutable")
+            else:
+                self.send_header("Cache-Control", "public, max-age=3600")
+            self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
         
+        f.seek(start)
+        self.bytes_remaining = end - start + 1
+        return f
+    
+    def may_read_metrics(self):
+        """True for the configured bearer token, or with none configured, for loopback clients"""
+        if self.metrics_token:
+            return secrets.compare_digest(self.headers.get('Authorization', ''), f"Bearer {self.metrics_token}")
+        return ipaddress.ip_address(self.client_address[0]).is_loopback
+    
+    def send_metrics(self):
+        """Current performance counters in Prometheus text format"""
+        body = self.metrics.prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.bytes_remaining = len(body)
+        return io.BytesIO(body)
+    
+    @staticmethod
+    def parse_range(header, size):
+        """(start, end) for a satisfiable 'bytes=' header, None if absent, False if unsatisfiable"""
+        if not header or not header.startswith('bytes=') or ',' in header:
+            return None
+        first, _, last = header[len('bytes='):].strip().partition('-')
         try:
-            # Get booking count
-            cursor.execute("SELECT COUNT(*) FROM bookings")
-            stats['total_bookings'] = cursor.fetchone()[0]
-        except:
-            stats['total_bookings'] = 0
+            if first:
+                start = int(first)
+                end = min(int(last), size - 1) if last else size - 1
+            else:
+                # Suffix range: the final N bytes
+                start, end = max(size - int(last), 0), size - 1
+        except ValueError:
+            return None
+        if start > end or start >= size:
+            return False
+        return start, end
+    
+    def copyfile(self, source, outputfile):
+        remaining = self.bytes_remaining
+        while remaining > 0:
+            chunk = source.read(min(MEDIA_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            outputfile.write(chunk)
+            remaining -= len(chunk)
+    
+    def log_message(self, format, *args):
+        pass  # Keep request logs out of the Streamlit console
+
+class DownloadTokens:
+    """One-time tokens that each unlock a single export download on the media server"""
+    
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.tokens = {}  # token -> (real path, expiry time)
+    
+    def issue(self, path):
+        """New token for one download of `path`"""
+        token = secrets.token_urlsafe(24)
+        now = time.time()
+        with self.lock:
+            self.tokens = {key: value for key, value in self.tokens.items() if value[1] > now}
+            self.tokens[token] = (os.path.realpath(path), now + self.ttl)
+        return token
+    
+    def redeem(self, token, path):
+        """True (and the token is spent) if `token` was issued for `path` and has not expired"""
+        with self.lock:
+            issued = self.tokens.pop(token, None)
+        return issued is not None and issued[0] == os.path.realpath(path) and issued[1] > time.time()
+
+@st.cache_resource
+def get_download_tokens():
+    """Export download tokens shared by the admin pages and the media server"""
+    return DownloadTokens(EXPORT_TTL)
+
+@st.cache_resource
+def start_media_server():
+    """Start the media server once per process; None if YANTI_MEDIA_URL is unset or the port is unavailable"""
+    if not MEDIA_BASE_URL:
+        return None
+    handler = functools.partial(MediaRequestHandler, directory=os.getcwd(),
+                                metrics=perf_monitor if PERF_ENABLED else None,
+                                metrics_token=METRICS_TOKEN,
+                                download_tokens=get_download_tokens())
+    try:
+        server = http.server.ThreadingHTTPServer((MEDIA_SERVER_HOST, MEDIA_SERVER_PORT), handler)
+    except OSError:
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="media-server", daemon=True).start()
+    return server
+
+def media_server_available():
+    """True when browsers can reach the media server: it is running and YANTI_MEDIA_URL says where"""
+    return start_media_server() is not None
+
+def media_url(path):
+    """Browser URL for a file stored in one of the media directories"""
+    return f"{MEDIA_BASE_URL}/{urllib.parse.quote(path.replace(os.sep, '/'))}"
+
+def image_src(path_or_url):
+    """What to hand st.image: a media-server URL for local files and mirrored remote images"""
+    if not media_server_available():
+        return path_or_url  # Streamlit serves local files; remote URLs load from their host
+    if is_remote_url(path_or_url):
+        # Served from the local mirror once fetched; the first view queues the fetch
+        mirrored = get_image_mirror().lookup(path_or_url)
+        if mirrored is None:
+            return path_or_url
+        path_or_url = mirrored
+    if os.path.isfile(path_or_url):
+        return media_url(path_or_url)
+    return path_or_url
+
+@timed
+def render_audio_player(file_path, key):
+    """Audio player that streams from the media server and loads nothing until played"""
+    if not media_server_available():
+        # Browsers can't reach the media server, so Streamlit serves the file itself;
+        # st.audio reads the whole file on every rerun, so only once a visitor asks
+        if st.checkbox("🎧 Load Player", key=f"player_{key}"):
+            st.audio(file_path)
+        return
+    st.markdown(f'<audio controls preload="none" src="{media_url(file_path)}" style="width: 100%;"></audio>',
+                unsafe_allow_html=True)
+
+# Media store
+# Uploads are copied to disk MEDIA_CHUNK_SIZE at a time while being hashed and
+# stored as media/<first two hex digits>/<sha256>.<ext>, so names never collide,
+# identical uploads are kept once and DB rows reference content by its hash.
+# Stored files never change, which lets the media server cache them for good.
+# A file may back several rows, so deleting a row never deletes its file; the
+# media reconciler below reclaims files once nothing references them.
+MEDIA_STORE_DIR = 'media'
+MEDIA_STORE_LOCK = threading.Lock()  # Orders store_upload's dedup check against reconciler deletes
+
+def store_upload(upload):
+    """Stream a file-like upload into the media store; returns its stored path"""
+    extension = os.path.splitext(getattr(upload, 'name', ''))[1].lower()
+    os.makedirs(MEDIA_STORE_DIR, exist_ok=True)
+    tmp_path = os.path.join(MEDIA_STORE_DIR, f".{secrets.token_hex(8)}.part")
+    digest = hashlib.sha256()
+    upload.seek(0)
+    try:
+        with open(tmp_path, 'wb') as out:
+            for chunk in iter(lambda: upload.read(MEDIA_CHUNK_SIZE), b''):
+                digest.update(chunk)
+                out.write(chunk)
+        path = media_store_path(digest.hexdigest(), extension)
+        with MEDIA_STORE_LOCK:
+            try:
+                # Already stored: touch it so the reconciler's grace period starts over,
+                # since the row about to reference it may revive an orphan
+                os.utime(path)
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        upload.seek(0)
+    return path
+
+def media_store_path(content_hash, extension):
+    """Where the media store keeps the file with this SHA-256"""
+    return os.path.join(MEDIA_STORE_DIR, content_hash[:2], content_hash + extension)
+
+def stored_media_hash(path):
+    """SHA-256 of a media-store file taken from its name, or None for other paths"""
+    if not path or os.path.normpath(path).split(os.sep, 1)[0] != MEDIA_STORE_DIR:
+        return None
+    return os.path.splitext(os.path.basename(path))[0]
+
+# Audio analysis
+# Uploaded tracks are analysed once, at ingest, and the results are stored on the
+# music row: WAV headers are read with the wave module and MP3 files by walking
+# their frame headers, which gives the exact duration, average bitrate and sample
+# rate. WAVEFORM_PEAKS peak levels (one byte each, loudest = 255) are stored too,
+# so the Music tab draws the waveform straight from the row without touching the
+# file. MP3 audio is never decoded: a frame's level is taken from the global_gain
+# of its granules (the quantiser step size, which follows loudness), which is
+# close enough for a preview. Other formats are stored without analysis.
+WAVEFORM_PEAKS = 120
+AudioInfo = namedtuple('AudioInfo', 'duration_seconds bitrate sample_rate channels waveform')
+TRACK_AUDIO_UPDATE = 'UPDATE music SET duration_seconds=?, bitrate=?, sample_rate=?, channels=?, waveform=? WHERE id=?'
+
+# kbps by bitrate index, keyed by (MPEG-1, layer)
+MP3_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}  # by version bits
+MP3Frame = namedtuple('MP3Frame', 'length samples sample_rate channels layer mpeg1 side_info')
+
+def format_duration(seconds):
+    """m:ss"""
+    seconds = round(seconds)
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+def bucket_peaks(levels):
+    """Reduce levels to at most WAVEFORM_PEAKS bytes, each the loudest level of its span"""
+    count = min(WAVEFORM_PEAKS, len(levels))
+    peaks = [max(levels[i * len(levels) // count:(i + 1) * len(levels) // count]) for i in range(count)]
+    loudest = max(peaks, default=0) or 1
+    return bytes(round(255 * peak / loudest) for peak in peaks)
+
+def pcm_peak(chunk, width):
+    """Largest absolute sample in a chunk of little-endian PCM, as a fraction of full scale"""
+    if width == 1:
+        return max(max(chunk) - 128, 128 - min(chunk)) / 128  # 8-bit WAV is unsigned
+    if width == 3:
+        # No 24-bit array type: keep the top two bytes of each sample
+        top = bytearray(len(chunk) // 3 * 2)
+        top[0::2] = chunk[1::3]
+        top[1::2] = chunk[2::3]
+        chunk, width = top, 2
+    samples = array.array('h' if width == 2 else 'i', chunk)
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return max(max(samples), -min(samples)) / (1 << (8 * width - 1))
+
+def analyse_wav(path):
+    """AudioInfo of a PCM WAV file, reading one waveform bucket of frames at a time"""
+    with wave.open(path, 'rb') as wav:
+        sample_rate, channels, width = wav.getframerate(), wav.getnchannels(), wav.getsampwidth()
+        frames = wav.getnframes()
+        if not frames:
+            raise ValueError("WAV file has no audio")
+        if frames * channels * width > os.path.getsize(path):
+            raise ValueError("WAV file is truncated")
+        levels = []
+        for chunk in iter(lambda: wav.readframes(-(-frames // WAVEFORM_PEAKS)), b''):
+            levels.append(pcm_peak(chunk, width))
+    return AudioInfo(frames / sample_rate, round(sample_rate * channels * width * 8 / 1000),
+                     sample_rate, channels, bucket_peaks(levels))
+
+def mp3_frame(data, offset):
+    """MP3Frame for a valid MPEG audio frame header at offset, else None"""
+    if data[offset] != 0xFF or len(data) < offset + 4:
+        return None
+    b1, b2, b3 = data[offset + 1], data[offset + 2], data[offset + 3]
+    version, layer = (b1 >> 3) & 3, 4 - ((b1 >> 1) & 3)
+    bitrate_index, rate_index, padding = b2 >> 4, (b2 >> 2) & 3, (b2 >> 1) & 1
+    if b1 & 0xE0 != 0xE0 or version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    mpeg1 = version == 3
+    kbps = MP3_BITRATES[mpeg1, layer][bitrate_index]
+    sample_rate = MP3_SAMPLE_RATES[version][rate_index]
+    channels = 1 if b3 >> 6 == 3 else 2
+    if layer == 1:
+        length, samples = (12000 * kbps // sample_rate + padding) * 4, 384
+    elif layer == 2 or mpeg1:
+        length, samples = 144000 * kbps // sample_rate + padding, 1152
+    else:
+        length, samples = 72000 * kbps // sample_rate + padding, 576
+    side_info = offset + (4 if b1 & 1 else 6)  # A 16-bit CRC follows the header when the bit is clear
+    return MP3Frame(length, samples, sample_rate, channels, layer, mpeg1, side_info)
+
+def mp3_frame_level(data, frame):
+    """Relative loudness of a Layer III frame from the global_gain of each granule and channel"""
+    bits = int.from_bytes(data[frame.side_info:frame.side_info + 32].ljust(32, b'\0'), 'big')
+    if frame.mpeg1:
+        # main_data_begin, private bits and scfsi, then 59 bits per granule (2) and channel
+        start, entry, granules = 9 + (5 if frame.channels == 1 else 3) + 4 * frame.channels, 59, 2
+    else:
+        start, entry, granules = 8 + frame.channels, 63, 1
+    # Each entry starts with part2_3_length (12 bits) and big_values (9), then global_gain (8),
+    # where +4 doubles the step size; granules with no coded bits are silent
+    gains = [(bits >> (256 - position - 29)) & 0xFF
+             for position in range(start, start + granules * frame.channels * entry, entry)
+             if (bits >> (256 - position - 12)) & 0xFFF]
+    return 2 ** ((max(gains) - 210) / 4) if gains else 0
+
+def analyse_mp3(path):
+    """AudioInfo of an MP3 file, scanned through a read-only memory map so long mixes are never read into memory"""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return scan_mp3(data)
+
+def scan_mp3(data):
+    """AudioInfo from the frame headers in `data`, skipping ID3 tags and any junk between frames"""
+    offset, end = 0, len(data)
+    if data[:3] == b'ID3' and end >= 10:
+        offset = 10 + ((data[6] & 0x7F) << 21 | (data[7] & 0x7F) << 14 | (data[8] & 0x7F) << 7 | data[9] & 0x7F)
+        offset += 10 if data[5] & 0x10 else 0  # Footer
+    if data[-128:-125] == b'TAG':
+        end -= 128  # ID3v1
+    
+    first, synced, samples, audio_bytes, levels = None, False, 0, 0, []
+    while 0 <= offset < end - 4:
+        frame = mp3_frame(data, offset)
+        # Out of sync, only trust a header that is followed by another one
+        if frame is None or (not synced and offset + frame.length < end - 4
+                             and mp3_frame(data, offset + frame.length) is None):
+            synced = False
+            offset = data.find(b'\xff', offset + 1, end)
+            continue
+        synced = True
+        if first is None:
+            first = frame
+            side_length = (17 if frame.channels == 1 else 32) if frame.mpeg1 else (9 if frame.channels == 1 else 17)
+            tag_offset = frame.side_info + side_length
+            if data[tag_offset:tag_offset + 4] in (b'Xing', b'Info') or data[offset + 36:offset + 40] == b'VBRI':
+                offset += frame.length  # VBR header frame: no audio
+                continue
+        samples += frame.samples
+        audio_bytes += min(frame.length, end - offset)
+        if frame.layer == 3:
+            levels.append(mp3_frame_level(data, frame))
+        offset += frame.length
+    
+    if not samples:
+        raise ValueError("no MPEG audio frames found")
+    duration = samples / first.sample_rate
+    return AudioInfo(duration, round(audio_bytes * 8 / duration / 1000), first.sample_rate, first.channels,
+                     bucket_peaks(levels) if levels else None)
+
+AUDIO_ANALYSERS = {'.wav': analyse_wav, '.mp3': analyse_mp3}
+
+def analyse_audio(path):
+    """AudioInfo for a WAV or MP3 file; None for other formats and unreadable files"""
+    analyser = AUDIO_ANALYSERS.get(os.path.splitext(path)[1].lower())
+    if analyser is None:
+        return None
+    try:
+        return analyser(path)
+    except Exception:
+        # Malformed files raise all sorts (wave alone raises RuntimeError on bad
+        # chunk sizes); a bad upload or backfilled file must never break the caller
+        logger.warning("Could not analyse audio file %s", path, exc_info=True)
+        return None
+
+def waveform_svg(peaks):
+    """Inline SVG bar chart of stored waveform peaks"""
+    heights = [max(peak, 4) / 4 for peak in peaks]  # 64 units tall, never thinner than a line
+    bars = ''.join(f'<rect x="{i * 3}" y="{(64 - height) / 2:.1f}" width="2" height="{height:.1f}"/>'
+                   for i, height in enumerate(heights))
+    return (f'<svg class="waveform" viewBox="0 0 {len(peaks) * 3} 64" preserveAspectRatio="none" '
+            f'role="img" aria-label="Waveform">{bars}</svg>')
+
+# Media reconciler
+# Deleting a row leaves its file behind, so a background reconciler diffs the
+# upload directories against the paths the music, gallery and header_photos rows
+# reference (plus gallery variants and header renditions derived from them) and
+# reclaims the rest every MEDIA_GC_INTERVAL. Files younger than MEDIA_GC_GRACE
+# are left alone: an upload is stored before the row that references it exists.
+# Each orphan is checked again just before it is deleted, holding the writer lock
+# (so no row can start referencing it meanwhile) and MEDIA_STORE_LOCK (so a
+# duplicate upload either refreshes its mtime first or stores it afresh after).
+# Set YANTI_MEDIA_GC_DRY_RUN=1 to only report. image_cache, exports and static
+# evict their own files and are only counted in the size report.
+MEDIA_GC_DIRECTORIES = (MEDIA_STORE_DIR, 'music_uploads', 'gallery_uploads', 'header_photos')
+MEDIA_GC_INTERVAL = 6 * 3600  # seconds
+MEDIA_GC_GRACE = 3600  # seconds
+MEDIA_GC_DRY_RUN = os.environ.get('YANTI_MEDIA_GC_DRY_RUN', '0') == '1'
+
+class MediaReconciler:
+    """Finds and reclaims media files that no database row references"""
+    
+    def __init__(self, data_layer):
+        self.data_layer = data_layer  # Kept current by main(): "Refresh Database" replaces it
+        self.pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="media-reconciler")
+        self.lock = threading.Lock()
+        self.running = {}  # dry_run -> Future of the latest pass in that mode
+        self.last_report = None
+    
+    def schedule(self):
+        """Run a pass now and every MEDIA_GC_INTERVAL after that"""
+        self.start(MEDIA_GC_DRY_RUN)
+        timer = threading.Timer(MEDIA_GC_INTERVAL, self.schedule)
+        timer.daemon = True
+        timer.start()
+    
+    def start(self, dry_run):
+        """Queue a pass unless one in the same mode is already pending; returns its Future"""
+        with self.lock:
+            if dry_run not in self.running or self.running[dry_run].done():
+                self.running[dry_run] = self.pool.submit(self.reconcile, dry_run)
+            return self.running[dry_run]
+    
+    def referenced_paths(self, cursor):
+        """Normalised paths every row points at, and the name prefixes of live header renditions"""
+        cursor.execute('SELECT file_path FROM music')
+        paths = [row[0] for row in cursor.fetchall()]
+        cursor.execute('SELECT image_url, image_variants FROM gallery')
+        for image_url, image_variants in cursor.fetchall():
+            paths.append(image_url)
+            if image_variants:
+                paths.extend(variant.get('path') for variant in json.loads(image_variants).values())
+        cursor.execute('SELECT photo_path FROM header_photos')
+        photos = [row[0] for row in cursor.fetchall()]
         
-        try:
-            # Get subscriber count
-            cursor.execute("SELECT COUNT(*) FROM subscribers")
-            stats['total_subscribers'] = cursor.fetchone()[0]
-        except:
-            stats['total_subscribers'] = 0
+        referenced = {os.path.normpath(path) for path in paths + photos if path and not is_remote_url(path)}
+        # Header renditions are named after their source's hash and mtime
+        rendition_keys = set()
+        for photo in photos:
+            try:
+                content_hash = stored_media_hash(photo) or file_sha256(photo)
+                rendition_keys.add(f"{content_hash[:16]}_{os.stat(photo).st_mtime_ns}_")
+            except (OSError, TypeError):
+                pass  # Missing source: its renditions are orphans too
+        return referenced, rendition_keys
+    
+    def is_orphan(self, path, referenced, rendition_keys):
+        """True if nothing references this file"""
+        if path in referenced:
+            return False
+        if os.path.dirname(path) == HEADER_RENDITIONS_DIR:
+            return not os.path.basename(path).startswith(tuple(rendition_keys))
+        return True
+    
+    def reconcile(self, dry_run):
+        """One pass: size every media directory, then report (and unless dry_run, delete) orphans"""
+        with self.data_layer.read() as cursor:
+            referenced, rendition_keys = self.referenced_paths(cursor)
+        cutoff = time.time() - MEDIA_GC_GRACE
+        report = {'dry_run': dry_run, 'directories': {}, 'orphans': [], 'reclaimed_bytes': 0, 'errors': []}
         
-        try:
-            # Get header photo status
-            header_photo = self.get_header_photo()
-            stats['has_header_photo'] = bool(header_photo)
-        except:
-            stats['has_header_photo'] = False
+        for directory in MEDIA_DIRECTORIES:
+            files = size = 0
+            for root, _, names in os.walk(directory):
+                for name in names:
+                    path = os.path.normpath(os.path.join(root, name))
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue  # Removed while we were walking
+                    files += 1
+                    size += stat.st_size
+                    if (directory in MEDIA_GC_DIRECTORIES and stat.st_mtime < cutoff
+                            and self.is_orphan(path, referenced, rendition_keys)):
+                        report['orphans'].append((path, stat.st_size))
+            report['directories'][directory] = {'files': files, 'bytes': size}
         
-        return stats
+        report['missing'] = sorted(path for path in referenced if not os.path.exists(path))
+        if not dry_run:
+            report['orphans'] = self.remove_orphans(report['orphans'], report['errors'])
+            report['reclaimed_bytes'] = sum(size for _, size in report['orphans'])
+        report['finished'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.last_report = report
+        return report
+    
+    def remove_orphans(self, orphans, errors):
+        """Delete the scanned orphans that are still unreferenced and past their grace period; returns those deleted"""
+        removed = []
+        with self.data_layer.write() as cursor, MEDIA_STORE_LOCK:
+            referenced, rendition_keys = self.referenced_paths(cursor)
+            cutoff = time.time() - MEDIA_GC_GRACE
+            for path, size in orphans:
+                try:
+                    if os.stat(path).st_mtime >= cutoff or not self.is_orphan(path, referenced, rendition_keys):
+                        continue  # Uploaded again or referenced since the scan
+                    os.remove(path)
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    errors.append(f"{path}: {e}")
+                    continue
+                removed.append((path, size))
+        return removed
 
-# Custom CSS for the website
-def load_css():
-    st.markdown("""
-    <style>
-    /* Main styling */
-    .main .block-container {
+@st.cache_resource
+def get_media_reconciler():
+    """Background media reconciler shared by all sessions"""
+    reconciler = MediaReconciler(get_website())
+    reconciler.schedule()
+    return reconciler
+
+# Subscriber exports
+# Exports are streamed from the database straight into a file under EXPORTS_DIR
+# (optionally gzip-compressed) and downloaded from the media server, so neither
+# the rows nor the encoded file are ever held in memory. Each download link
+# carries a one-time token (DownloadTokens) and old exports are removed after
+# EXPORT_TTL. Without a media server st.download_button has to copy the file into
+# memory, so it is only offered on the run that prepared the export and only up
+# to EXPORT_INLINE_MAX_BYTES.
+EXPORT_FORMATS = {"CSV": 'csv', "JSON Lines": 'jsonl'}
+EXPORT_CHUNK_ROWS = 5000
+EXPORT_TTL = 3600  # seconds
+EXPORT_INLINE_MAX_BYTES = 20 * 1024 * 1024
+
+def purge_expired_exports():
+    """Delete export files older than EXPORT_TTL"""
+    cutoff = time.time() - EXPORT_TTL
+    for entry in os.scandir(EXPORTS_DIR):
+        if entry.is_file() and entry.stat().st_mtime < cutoff:
+            os.remove(entry.path)
+
+def write_subscriber_export(data_layer, fmt, compress=False, date_from=None, date_to=None):
+    """Stream a subscriber export to a new file; returns (path, row count)"""
+    os.makedirs(EXPORTS_DIR, exist_ok=True)
+    purge_expired_exports()
+    name = f"yanti_siggs_subscribers_{datetime.now():%Y%m%d_%H%M%S}_{secrets.token_urlsafe(12)}.{fmt}"
+    if compress:
+        name += '.gz'
+    path = os.path.join(EXPORTS_DIR, name)
+    opener = gzip.open if compress else open
+    with opener(path + '.part', 'wt', encoding='utf-8', newline='') as out:
+        rows = data_layer.export_subscribers(out, fmt, date_from, date_to)
+    os.replace(path + '.part', path)
+    return path, rows
+
+# Gallery image pipeline
+# Uploaded gallery images are resized off the request thread into thumbnail,
+# medium and large WebP/JPEG variants. The grid shows thumbnails and loads the
+# large size only when a visitor opens an item. Per-size metadata (path,
+# dimensions, bytes, SHA-256) is stored as JSON in gallery.image_variants.
+GALLERY_VARIANT_WIDTHS = {'thumb': 320, 'medium': 800, 'large': 1600}
+GALLERY_VARIANT_QUALITY = 82
+GALLERY_VARIANTS_DIR = os.path.join('gallery_uploads', 'variants')
+IMAGE_WORKERS = 2
+
+class ImageWorkers:
+    """Bounded thread pool for image processing, tracking which gallery items are queued"""
+    
+    def __init__(self, max_workers):
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-worker")
+        self.lock = threading.Lock()
+        self.gallery_in_flight = set()
+    
+    def queue_gallery_variants(self, data_layer, gallery_id, image_path):
+        """Schedule variant generation for a gallery item unless it is already queued"""
+        with self.lock:
+            if gallery_id in self.gallery_in_flight:
+                return
+            self.gallery_in_flight.add(gallery_id)
+        self.pool.submit(self.process_gallery_image, data_layer, gallery_id, image_path)
+    
+    def process_gallery_image(self, data_layer, gallery_id, image_path):
+        """Worker job: build the variants for one gallery item and record them"""
+        try:
+            variants = build_gallery_variants(image_path)
+        except (OSError, ValueError):
+            return  # Unreadable image: it stays marked so it is not retried on every view
+        data_layer.set_gallery_variants(gallery_id, variants)
+        with self.lock:
+            self.gallery_in_flight.discard(gallery_id)
+
+@st.cache_resource
+def get_image_workers():
+    """Image worker pool shared by all sessions"""
+    return ImageWorkers(IMAGE_WORKERS)
+
+def image_file_info(path, image):
+    """Metadata recorded for one stored image"""
+    return {'path': path, 'width': image.width, 'height': image.height,
+            'bytes': os.path.getsize(path), 'sha256': file_sha256(path)}
+
+def build_gallery_variants(image_path):
+    """Resize a gallery upload into every variant width; return the metadata dict"""
+    image_format, extension = HEADER_RENDITION_FORMAT
+    key = (stored_media_hash(image_path) or file_sha256(image_path))[:16]
+    os.makedirs(GALLERY_VARIANTS_DIR, exist_ok=True)
+    with Image.open(image_path) as source:
+        variants = {'original': image_file_info(image_path, source)}
+        image = ImageOps.exif_transpose(source)
+        image = image.convert('RGBA' if image_format == 'WEBP' and image.mode in ('RGBA', 'LA', 'P') else 'RGB')
+        for name, width in GALLERY_VARIANT_WIDTHS.items():
+            path = os.path.join(GALLERY_VARIANTS_DIR, f"{key}_{name}.{extension}")
+            variant = image.copy()
+            variant.thumbnail((width, width * 4), Image.LANCZOS)  # Width-bound, never upscaled
+            if not os.path.exists(path):
+                tmp_path = path + '.tmp'
+                variant.save(tmp_path, image_format, quality=GALLERY_VARIANT_QUALITY)
+                os.replace(tmp_path, path)
+            variants[name] = image_file_info(path, variant)
+    return variants
+
+def gallery_variant(item, name):
+    """Stored path of one variant of a gallery row, or None if not generated yet"""
+    variants = json.loads(item.image_variants) if item.image_variants else {}
+    return variants.get(name, {}).get('path')
+
+# Remote image mirror
+# Film posters, event images and gallery URLs point at third-party hosts. Each one
+# is fetched once into image_cache/ (in the background, through a pooled requests
+# Session) and then served locally by the media server. Entries are revalidated
+# with ETag / Last-Modified after IMAGE_CACHE_REVALIDATE_SECONDS, and the least
+# recently used files are evicted when the cache grows past IMAGE_CACHE_MAX_BYTES.
+# URLs that fail (errors, non-images, oversized bodies) are not retried from page
+# views for IMAGE_FETCH_RETRY_SECONDS. The mirror is only used when the media
+# server has a public URL; otherwise pages link to the original host.
+IMAGE_CACHE_DIR = 'image_cache'
+IMAGE_CACHE_MAX_BYTES = 200 * 1024 * 1024
+IMAGE_CACHE_REVALIDATE_SECONDS = 24 * 60 * 60
+IMAGE_FETCH_TIMEOUT = 10
+IMAGE_FETCH_MAX_BYTES = 20 * 1024 * 1024
+IMAGE_FETCH_RETRY_SECONDS = 60 * 60
+IMAGE_EXTENSIONS = {'image/jpeg': '.jpg', 'image/png': '.png', 'image/gif': '.gif',
+                    'image/webp': '.webp', 'image/svg+xml': '.svg', 'image/avif': '.avif'}
+
+def is_remote_url(value):
+    """True for http(s) URLs"""
+    return isinstance(value, str) and value.startswith(('http://', 'https://'))
+
+class ImageMirror:
+    """Disk-backed, size-capped LRU mirror of remote images"""
+    
+    def __init__(self, cache_dir, max_bytes, executor):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.executor = executor
+        self.lock = threading.Lock()
+        self.pending = set()
+        self.failed = {}  # url -> time of the last failed fetch
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=1)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        os.makedirs(cache_dir, exist_ok=True)
+        try:
+            with open(self.index_path) as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+        # Drop entries whose file has gone missing
+        self.index = {url: entry for url, entry in self.index.items() if os.path.exists(entry['path'])}
+    
+    def lookup(self, url):
+        """Local path of a mirrored URL, or None; schedules a fetch or revalidation when needed"""
+        with self.lock:
+            entry = self.index.get(url)
+            if entry is not None:
+                entry['last_used'] = time.time()
+            recently_failed = time.time() - self.failed.get(url, 0) < IMAGE_FETCH_RETRY_SECONDS
+        if entry is None:
+            if not recently_failed:
+                self.prefetch(url)
+            return None
+        if time.time() - entry['fetched_at'] > IMAGE_CACHE_REVALIDATE_SECONDS and not recently_failed:
+            self.prefetch(url)
+        return entry['path']
+    
+    def prefetch(self, url):
+        """Fetch or revalidate a URL in the background (once at a time per URL)"""
+        if not is_remote_url(url):
+            return
+        with self.lock:
+            if url in self.pending:
+                return
+            self.pending.add(url)
+        self.executor.submit(self.fetch, url)
+    
+    def fetch(self, url):
+        """Download (or revalidate) one URL into the cache; returns the local path or None"""
+        path = None
+        try:
+            with self.lock:
+                entry = dict(self.index.get(url) or {})
+            headers = {}
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+            
+            with self.session.get(url, headers=headers, timeout=IMAGE_FETCH_TIMEOUT, stream=True) as response:
+                if response.status_code == 304 and entry:
+                    entry['fetched_at'] = time.time()
+                elif response.status_code == 200:
+                    content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+                    if not content_type.startswith('image/'):
+                        return None
+                    entry = self.store(url, response, content_type)
+                    if entry is None:
+                        return None
+                else:
+                    return None
+            
+            with self.lock:
+                entry.setdefault('last_used', time.time())
+                self.index[url] = entry
+            self.evict()
+            path = entry['path']
+            return path
+        except requests.RequestException:
+            return None
+        finally:
+            with self.lock:
+                self.pending.discard(url)
+                if path is None:
+                    self.failed[url] = time.time()
+                else:
+                    self.failed.pop(url, None)
+    
+    def store(self, url, response, content_type):
+        """Stream a response body to disk; returns the new index entry, None if too large"""
+        extension = IMAGE_EXTENSIONS.get(content_type, '.img')
+        path = os.path.join(self.cache_dir, hashlib.sha256(url.encode()).hexdigest() + extension)
+        tmp_path = path + '.tmp'
+        size = 0
+        with open(tmp_path, 'wb') as f:
+            for chunk in response.iter_content(MEDIA_CHUNK_SIZE):
+                size += len(chunk)
+                if size > IMAGE_FETCH_MAX_BYTES:
+                    break
+                f.write(chunk)
+        if size > IMAGE_FETCH_MAX_BYTES:
+            os.remove(tmp_path)
+            return None
+        os.replace(tmp_path, path)
+        return {'path': path, 'bytes': size, 'fetched_at': time.time(),
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')}
+    
+    def evict(self):
+        """Remove least recently used files until the cache fits, then persist the index"""
+        with self.lock:
+            total = sum(entry['bytes'] for entry in self.index.values())
+            for url, entry in sorted(self.index.items(), key=lambda item: item[1]['last_used']):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(entry['path'])
+                except OSError:
+                    pass
+                total -= entry['bytes']
+                del self.index[url]
+            
+            tmp_path = self.index_path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(self.index, f)
+            os.replace(tmp_path, self.index_path)
+
+@st.cache_resource
+def get_image_mirror():
+    """Remote image mirror shared by all sessions (fetches run on the image worker pool)"""
+    return ImageMirror(IMAGE_CACHE_DIR, IMAGE_CACHE_MAX_BYTES, get_image_workers().pool)
+
+def prefetch_remote_image(url):
+    """Start mirroring an image URL an admin just saved (retried even if it failed before)"""
+    if url and is_remote_url(url) and media_server_available():
+        get_image_mirror().prefetch(url)
+
+# Site stylesheet
+# The stylesheet is minified and written once per process to a content-hashed file
+# under STATIC_DIR, which the media server serves with a year-long immutable cache
+# lifetime. Each rerun then sends only a <link> tag; browsers fetch the file once.
+# Without a public media server (YANTI_MEDIA_URL) the minified CSS is inlined.
+STATIC_DIR = 'static'
+STATIC_CACHE_SECONDS = 365 * 24 * 3600
+VIEWPORT_META = '<meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no">'
+
+SITE_CSS = """
+    /* Main styling */
+    .main .block-container {
         padding-top: 0;
         max-width: 1200px;
     }
@@ -976,6 +2516,30 @@ def load_css():
         color: white !important;
     }
     
+    /* Public section navigation (horizontal radio styled like the tabs) */
+    div[role="radiogroup"] {
+        gap: 1rem;
+        background: rgba(26, 26, 46, 0.1);
+        border-radius: 10px;
+        padding: 0.5rem;
+        flex-wrap: nowrap !important;
+        overflow-x: auto;
+        scrollbar-width: none;
+    }
+
+    div[role="radiogroup"] label {
+        padding: 0.5rem 1rem;
+        border-radius: 8px;
+        font-weight: 600;
+        color: #ffa726 !important;
+        white-space: nowrap !important;
+    }
+
+    div[role="radiogroup"] label:has(input:checked) {
+        background: linear-gradient(135deg, #ff6b6b 0%, #ffa726 100%) !important;
+        color: white !important;
+    }
+
     /* MOBILE-SPECIFIC TAB FIXES */
     @media (max-width: 768px) {
         .stTabs [data-baseweb="tab-list"] {
@@ -1089,6 +2653,15 @@ def load_css():
         border: 1px solid rgba(255,107,107,0.2);
     }
     
+    /* Waveform preview */
+    .waveform {
+        display: block;
+        width: 100%;
+        height: 48px;
+        margin-bottom: 0.5rem;
+        fill: #ff6b6b;
+    }
+    
     /* Film card */
     .film-card {
         background: rgba(255, 255, 255, 0.05);
@@ -1399,150 +2972,284 @@ def load_css():
             margin: 0 2px;
         }
     }
-    </style>
-    
-    <!-- Add viewport meta for better mobile responsiveness -->
-    <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no">
-    """, unsafe_allow_html=True)
+"""
 
-def get_image_base64(image_path):
-    """Convert image file to base64 format for HTML display"""
+def minify_css(css):
+    """Strip comments and redundant whitespace from a stylesheet"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+@st.cache_resource
+def build_stylesheet():
+    """Write the minified stylesheet to STATIC_DIR once per process; returns (path, minified css)"""
+    css = minify_css(SITE_CSS)
+    digest = hashlib.sha256(css.encode()).hexdigest()[:12]
+    path = os.path.join(STATIC_DIR, f"site.{digest}.css")
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    if not os.path.exists(path):
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(css)
+        os.replace(tmp_path, path)
+    # Stylesheets from earlier releases are never linked again
+    for entry in os.scandir(STATIC_DIR):
+        if entry.name.startswith('site.') and entry.name.endswith('.css') and entry.path != path:
+            os.remove(entry.path)
+    return path, css
+
+def load_css():
+    """Link the site stylesheet (inlined when browsers can't reach the media server)"""
+    path, css = build_stylesheet()
+    if not media_server_available():
+        st.markdown(f"<style>{css}</style>{VIEWPORT_META}", unsafe_allow_html=True)
+        return
+    st.markdown(f'<link rel="stylesheet" href="{media_url(path)}">{VIEWPORT_META}', unsafe_allow_html=True)
+
+# Header photo renditions
+# The header shows the photo in a 320px circle, so uploads are centre-cropped and
+# re-encoded once into small square renditions. Rendition files are named after
+# the source's content hash and mtime, and their base64 text is held in a
+# process-wide cache resource (module globals are rebuilt on every rerun), so a
+# rerun costs one stat() instead of a decode and re-encode.
+HEADER_RENDITION_SIZES = (320, 640)
+HEADER_DISPLAY_SIZE = 640  # 320 CSS px at 2x pixel density
+HEADER_PREVIEW_SIZE = 320
+HEADER_RENDITION_QUALITY = 80
+HEADER_RENDITIONS_DIR = os.path.join('header_photos', 'renditions')
+HEADER_RENDITION_FORMAT = ('WEBP', 'webp') if features.check('webp') else ('JPEG', 'jpeg')
+
+def file_sha256(path):
+    """Hex SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def build_header_renditions(photo_path):
+    """Write the square renditions of a header photo (skipping ones already built); return {size: path}"""
+    image_format, extension = HEADER_RENDITION_FORMAT
+    content_hash = stored_media_hash(photo_path) or file_sha256(photo_path)
+    key = f"{content_hash[:16]}_{os.stat(photo_path).st_mtime_ns}"
+    paths = {size: os.path.join(HEADER_RENDITIONS_DIR, f"{key}_{size}.{extension}")
+             for size in HEADER_RENDITION_SIZES}
+    missing = [size for size, path in paths.items() if not os.path.exists(path)]
+    if not missing:
+        return paths
+    
+    os.makedirs(HEADER_RENDITIONS_DIR, exist_ok=True)
+    with Image.open(photo_path) as source:
+        image = ImageOps.exif_transpose(source)  # Phone photos carry their rotation in EXIF
+        image = image.convert('RGBA' if image_format == 'WEBP' and image.mode in ('RGBA', 'LA', 'P') else 'RGB')
+        for size in missing:
+            edge = min(size, image.width, image.height)
+            rendition = ImageOps.fit(image, (edge, edge), Image.LANCZOS)
+            tmp_path = paths[size] + '.tmp'
+            rendition.save(tmp_path, image_format, quality=HEADER_RENDITION_QUALITY)
+            os.replace(tmp_path, paths[size])
+    return paths
+
+@st.cache_resource(max_entries=16)
+def load_header_rendition(photo_path, mtime_ns, file_size, size):
+    """Base64 text of one rendition; cached per process for each version of the source file"""
+    # Renditions built at upload time are reused from disk
+    rendition_path = build_header_renditions(photo_path)[size]
+    with open(rendition_path, 'rb') as f:
+        return base64.b64encode(f.read()).decode(), HEADER_RENDITION_FORMAT[1]
+
+def get_header_rendition(photo_path, size=HEADER_DISPLAY_SIZE):
+    """(base64 data, mime subtype) of a header photo rendition, or None if the photo is unusable"""
     try:
-        # Check if file exists
-        if not os.path.exists(image_path):
-            st.warning(f"⚠️ Image file not found: {image_path}")
-            return None
-        
-        # Check if it's a valid image file
-        try:
-            img = Image.open(image_path)
-            img.verify()  # Verify it's a valid image
-        except Exception as e:
-            st.warning(f"⚠️ Invalid image file: {image_path} - Error: {str(e)}")
-            return None
-        
-        # Get file extension for MIME type
-        ext = os.path.splitext(image_path)[1].lower()
-        mime_types = {
-            '.jpg': 'jpeg',
-            '.jpeg': 'jpeg',
-            '.png': 'png',
-            '.gif': 'gif',
-            '.bmp': 'bmp',
-            '.webp': 'webp'
-        }
-        mime_type = mime_types.get(ext, 'jpeg')
-        
-        # Read and encode the image
-        with open(image_path, "rb") as image_file:
-            encoded_string = base64.b64encode(image_file.read()).decode()
-        
-        return encoded_string, mime_type
-    except Exception as e:
-        st.error(f"❌ Error encoding image: {str(e)}")
+        stat = os.stat(photo_path)
+        return load_header_rendition(photo_path, stat.st_mtime_ns, stat.st_size, size)
+    except (OSError, ValueError):
         return None
 
+# HTML fragments
+# Card and header markup is rendered once per row version and kept in a
+# process-wide LRU. Keys are the record named tuples themselves, so an edited row
+# is a new key and stale fragments simply age out; a rerun costs a dict lookup.
+FRAGMENT_CACHE_ENTRIES = 2048
+
+class FragmentCache:
+    """Bounded LRU of pre-rendered HTML strings keyed by (kind, key)"""
+    
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.fragments = OrderedDict()
+    
+    def get(self, kind, key, render):
+        """Cached HTML for `key`, calling render(key) on a miss"""
+        with self.lock:
+            html = self.fragments.get((kind, key))
+            if html is not None:
+                self.fragments.move_to_end((kind, key))
+                return html
+        html = render(key)
+        with self.lock:
+            self.fragments[(kind, key)] = html
+            while len(self.fragments) > self.max_entries:
+                self.fragments.popitem(last=False)
+        return html
+
+@st.cache_resource
+def get_fragment_cache():
+    """HTML fragment cache shared by all sessions"""
+    return FragmentCache(FRAGMENT_CACHE_ENTRIES)
+
+@timed
+def render_fragments(kind, records, render):
+    """Write the cached fragments of `records` as one markdown element"""
+    cache = get_fragment_cache()
+    st.markdown(''.join(cache.get(kind, record, render) for record in records), unsafe_allow_html=True)
+
+HEADER_INTRO_HTML = """
+    <h1 class="header-title">Yanti Siggs</h1>
+    <p class="header-subtitle">DJ • Music Producer • Filmmaker • Entrepreneur</p>
+    <p class="header-tagline{tagline_class}">"make sure you die empty, life expectancy is now 45yrs!!"</p>
+    <div style="margin-top: 2rem;">
+        <p>🎵 <strong>CEO & Founder at Yanti Studios</strong> (March 6, 2022 - Present)</p>
+        <p>🎬 <strong>Multi-talented Creative:</strong> Singer, Songwriter, Filmmaker, Actress, Entrepreneur</p>
+        <div style="margin-top: 1rem;">
+            <span class="role-badge badge-dj">DJ</span>
+            <span class="role-badge badge-music">Music Producer</span>
+            <span class="role-badge badge-film">Filmmaker</span>
+            <span class="role-badge badge-entrepreneur">Entrepreneur</span>
+        </div>
+    </div>
+"""
+
+def header_key(header_photo):
+    """Fragment key for the header: (photo id, path, mtime_ns), mtime None if the file is missing"""
+    if not header_photo or not header_photo.photo_path:
+        return None
+    try:
+        mtime_ns = os.stat(header_photo.photo_path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return header_photo.id, header_photo.photo_path, mtime_ns
+
+def header_html(key):
+    """Header markup for a header_key()"""
+    if key is None:
+        # Header WITHOUT photo
+        return f'<div class="header-simple">{HEADER_INTRO_HTML.format(tagline_class=" typewriter")}</div>'
+    
+    _, photo_path, mtime_ns = key
+    encoded_data = get_header_rendition(photo_path) if mtime_ns is not None else None
+    if encoded_data is None:
+        problem = "not found" if mtime_ns is None else "not accessible"
+        return f"""
+    <div class="header-simple">{HEADER_INTRO_HTML.format(tagline_class="")}
+        <div class="warning-box">
+            ⚠️ Header photo file {problem}: {photo_path}
+        </div>
+    </div>
+    """
+    
+    # Header WITH photo (small pre-encoded rendition)
+    img_base64, mime_type = encoded_data
+    return f"""
+    <div class="header-container">
+        <div class="header-content">{HEADER_INTRO_HTML.format(tagline_class="")}</div>
+        <div class="header-photo-container">
+            <img src="data:image/{mime_type};base64,{img_base64}" alt="Yanti Siggs" class="header-photo">
+        </div>
+    </div>
+    """
+
+def event_card_html(event):
+    """Home page card for an upcoming event"""
+    return f"""
+    <div class="event-card">
+        <h4>{event.title}</h4>
+        <p>📅 {event.date} | 🕒 {event.time}<br>
+        📍 {event.venue}</p>
+        <p>{event.description[:100]}...</p>
+    </div>
+    """
+
+def track_duration(track):
+    """Duration analysed from the track's file, else the one typed in by the admin"""
+    return format_duration(track.duration_seconds) if track.duration_seconds else track.duration
+
+def music_card_html(track):
+    """Home page card for the latest release"""
+    return f"""
+    <div class="music-card">
+        <h4>{track.title}</h4>
+        <p>📀 Album: {track.album}<br>
+        🎤 Year: {track.year}<br>
+        ⏱️ Duration: {track_duration(track)}<br>
+        🎶 Genre: {track.genre}</p>
+    </div>
+    """
+
+def press_card_html(article):
+    """Card for one press article"""
+    return f"""
+    <div class="press-card">
+        <h4>{article.title}</h4>
+        <p><strong>{article.outlet}</strong> • {article.date}</p>
+        <p>{article.excerpt}</p>
+        <p><a href="{article.url}" target="_blank">Read full article →</a></p>
+    </div>
+    """
+
+@timed
 def render_header_with_photo():
     """Render the header section with artist photo"""
-    header_photo = website.get_header_photo()
-    
-    if header_photo and header_photo[1]:  # Check if photo exists
-        photo_path = header_photo[1]
-        
-        # Check if file exists and get base64 encoding
-        if os.path.exists(photo_path):
-            encoded_data = get_image_base64(photo_path)
-            
-            if encoded_data:
-                img_base64, mime_type = encoded_data
-                
-                # Header WITH photo (using base64 encoding)
-                st.markdown(f"""
-                <div class="header-container">
-                    <div class="header-content">
-                        <h1 class="header-title">Yanti Siggs</h1>
-                        <p class="header-subtitle">DJ • Music Producer • Filmmaker • Entrepreneur</p>
-                        <p class="header-tagline">"make sure you die empty, life expectancy is now 45yrs!!"</p>
-                        <div style="margin-top: 2rem;">
-                            <p>🎵 <strong>CEO & Founder at Yanti Studios</strong> (March 6, 2022 - Present)</p>
-                            <p>🎬 <strong>Multi-talented Creative:</strong> Singer, Songwriter, Filmmaker, Actress, Entrepreneur</p>
-                            <div style="margin-top: 1rem;">
-                                <span class="role-badge badge-dj">DJ</span>
-                                <span class="role-badge badge-music">Music Producer</span>
-                                <span class="role-badge badge-film">Filmmaker</span>
-                                <span class="role-badge badge-entrepreneur">Entrepreneur</span>
-                            </div>
-                        </div>
-                    </div>
-                    <div class="header-photo-container">
-                        <img src="data:image/{mime_type};base64,{img_base64}" alt="Yanti Siggs" class="header-photo">
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                # Fallback: Show header without photo
-                st.markdown(f"""
-                <div class="header-simple">
-                    <h1 class="header-title">Yanti Siggs</h1>
-                    <p class="header-subtitle">DJ • Music Producer • Filmmaker • Entrepreneur</p>
-                    <p class="header-tagline">"make sure you die empty, life expectancy is now 45yrs!!"</p>
-                    <div style="margin-top: 2rem;">
-                        <p>🎵 <strong>CEO & Founder at Yanti Studios</strong> (March 6, 2022 - Present)</p>
-                        <p>🎬 <strong>Multi-talented Creative:</strong> Singer, Songwriter, Filmmaker, Actress, Entrepreneur</p>
-                        <div style="margin-top: 1rem;">
-                            <span class="role-badge badge-dj">DJ</span>
-                            <span class="role-badge badge-music">Music Producer</span>
-                            <span class="role-badge badge-film">Filmmaker</span>
-                            <span class="role-badge badge-entrepreneur">Entrepreneur</span>
-                        </div>
-                    </div>
-                    <div class="warning-box">
-                        ⚠️ Header photo file not accessible: {photo_path}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-        else:
-            # File doesn't exist - show warning and simple header
-            st.markdown(f"""
-            <div class="header-simple">
-                <h1 class="header-title">Yanti Siggs</h1>
-                <p class="header-subtitle">DJ • Music Producer • Filmmaker • Entrepreneur</p>
-                <p class="header-tagline">"make sure you die empty, life expectancy is now 45yrs!!"</p>
-                <div style="margin-top: 2rem;">
-                    <p>🎵 <strong>CEO & Founder at Yanti Studios</strong> (March 6, 2022 - Present)</p>
-                    <p>🎬 <strong>Multi-talented Creative:</strong> Singer, Songwriter, Filmmaker, Actress, Entrepreneur</p>
-                    <div style="margin-top: 1rem;">
-                        <span class="role-badge badge-dj">DJ</span>
-                        <span class="role-badge badge-music">Music Producer</span>
-                        <span class="role-badge badge-film">Filmmaker</span>
-                        <span class="role-badge badge-entrepreneur">Entrepreneur</span>
-                    </div>
-                </div>
-                <div class="warning-box">
-                    ⚠️ Header photo file not found: {photo_path}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-    else:
-        # Header WITHOUT photo (fallback)
-        st.markdown("""
-        <div class="header-simple">
-            <h1 class="header-title">Yanti Siggs</h1>
-            <p class="header-subtitle">DJ • Music Producer • Filmmaker • Entrepreneur</p>
-            <p class="header-tagline typewriter">"make sure you die empty, life expectancy is now 45yrs!!"</p>
-            <div style="margin-top: 2rem;">
-                <p>🎵 <strong>CEO & Founder at Yanti Studios</strong> (March 6, 2022 - Present)</p>
-                <p>🎬 <strong>Multi-talented Creative:</strong> Singer, Songwriter, Filmmaker, Actress, Entrepreneur</p>
-                <div style="margin-top: 1rem;">
-                    <span class="role-badge badge-dj">DJ</span>
-                    <span class="role-badge badge-music">Music Producer</span>
-                    <span class="role-badge badge-film">Filmmaker</span>
-                    <span class="role-badge badge-entrepreneur">Entrepreneur</span>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    key = header_key(website.get_header_photo())
+    st.markdown(get_fragment_cache().get('header', key, header_html), unsafe_allow_html=True)
+
+def inbox_filters(key, statuses):
+    """Render an inbox's status, date and page size filters; returns them with the page cursor"""
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        status = st.selectbox("Status", ["all"] + statuses, key=f"{key}_status")
+    with col2:
+        dates = st.date_input("Date range", value=(), key=f"{key}_dates")
+    with col3:
+        page_size = st.selectbox("Per page", INBOX_PAGE_SIZES, index=1, key=f"{key}_page_size")
+    
+    status = None if status == "all" else status
+    date_from = dates[0] if len(dates) > 0 else None
+    date_to = dates[1] if len(dates) > 1 else date_from
+    
+    # Changing any filter starts again from the newest page
+    filters = (status, date_from, date_to, page_size)
+    if st.session_state.get(f"{key}_filters") != filters:
+        st.session_state[f"{key}_filters"] = filters
+        st.session_state[f"{key}_pages"] = [None]
+    return status, date_from, date_to, page_size, st.session_state[f"{key}_pages"][-1]
 
+def inbox_next_page(key, cursor):
+    """Move an inbox to the page after `cursor`"""
+    st.session_state[f"{key}_pages"].append(cursor)
+
+def inbox_previous_page(key):
+    """Move an inbox back one page"""
+    st.session_state[f"{key}_pages"].pop()
+
+@timed
+def render_inbox_pager(key, next_cursor):
+    """Previous/Next controls for a keyset-paginated inbox"""
+    pages = st.session_state[f"{key}_pages"]
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        st.button("← Newer", key=f"{key}_prev", disabled=len(pages) == 1,
+                  on_click=inbox_previous_page, args=(key,))
+    with col2:
+        st.caption(f"Page {len(pages)}")
+    with col3:
+        st.button("Older →", key=f"{key}_next", disabled=next_cursor is None,
+                  on_click=inbox_next_page, args=(key, next_cursor))
+
+@timed
 def render_admin_portal():
     """Render the admin portal interface"""
     
@@ -1592,13 +3299,7 @@ def render_admin_portal():
         
         with col4:
             total_bookings = db_stats.get('total_bookings', 0)
-            # Get pending bookings count safely
-            pending_bookings = 0
-            try:
-                bookings = website.get_all_bookings()
-                pending_bookings = len([b for b in bookings if len(b) > 10 and b[10] == 'pending'])
-            except:
-                pass
+            pending_bookings = db_stats.get('pending_bookings', 0)
             st.metric("Booking Requests", total_bookings, delta=f"{pending_bookings} pending")
         
         with col5:
@@ -1613,6 +3314,37 @@ def render_admin_portal():
         # Show simplified dashboard
         st.warning("⚠️ Some dashboard statistics may not be available due to database issues.")
     
+    # Media storage report from the background reconciler
+    reconciler = get_media_reconciler()
+    with st.expander("💾 Media Storage"):
+        report = reconciler.last_report
+        if report is None:
+            st.info("The first storage scan is still running.")
+        else:
+            st.dataframe(pd.DataFrame([{'Directory': directory, 'Files': usage['files'],
+                                        'Size (MB)': round(usage['bytes'] / (1024 * 1024), 2)}
+                                       for directory, usage in report['directories'].items()]),
+                         use_container_width=True, hide_index=True)
+            orphan_bytes = sum(size for _, size in report['orphans'])
+            action = "found (dry run)" if report['dry_run'] else "reclaimed"
+            st.caption(f"Last scan {report['finished']}: {len(report['orphans'])} orphaned files "
+                       f"({orphan_bytes / (1024 * 1024):.2f} MB) {action}, "
+                       f"{len(report['missing'])} referenced files missing.")
+            if report['missing']:
+                st.warning("Referenced but missing on disk:\n\n" + "\n".join(f"- {path}" for path in report['missing']))
+            for error in report['errors']:
+                st.error(error)
+    
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("🔍 Scan (dry run)", use_container_width=True):
+                reconciler.start(dry_run=True).result()
+                st.rerun()
+        with col2:
+            if st.button("🧹 Reclaim Orphans", use_container_width=True):
+                reconciler.start(dry_run=False).result()
+                st.rerun()
+    
     # Admin Tabs
     admin_tabs = st.tabs([
         "📅 Manage Events", 
@@ -1624,7 +3356,8 @@ def render_admin_portal():
         "📋 Booking Requests",
         "📧 Subscribers", 
         "💌 Contact Messages",
-        "👤 Admin Settings"
+        "👤 Admin Settings",
+        "📈 Performance"
     ])
     
     # TAB 1: Manage Events
@@ -1661,6 +3394,7 @@ def render_admin_portal():
                             event_reg_url,
                             event_status
                         )
+                        prefetch_remote_image(event_image_url)
                         st.success("✅ Event added successfully!")
                         st.rerun()
                     else:
@@ -1673,57 +3407,57 @@ def render_admin_portal():
             
             if events:
                 for event in events:
-                    with st.expander(f"{event[1]} - {event[2]} ({event[8] if len(event) > 8 else 'unknown'})", expanded=False):
+                    with st.expander(f"{event.title} - {event.date} ({event.status})", expanded=False):
                         col1, col2 = st.columns([3, 1])
                         
                         with col1:
-                            with st.form(f"edit_event_{event[0]}"):
+                            with st.form(f"edit_event_{event.id}"):
                                 col_a, col_b = st.columns(2)
                                 with col_a:
-                                    edit_title = st.text_input("Title", value=event[1], key=f"title_{event[0]}")
+                                    edit_title = st.text_input("Title", value=event.title, key=f"title_{event.id}")
                                     try:
-                                        edit_date = st.date_input("Date", value=datetime.strptime(event[2], '%Y-%m-%d'), key=f"date_{event[0]}")
+                                        edit_date = st.date_input("Date", value=datetime.strptime(event.date, '%Y-%m-%d'), key=f"date_{event.id}")
                                     except:
-                                        edit_date = st.date_input("Date", value=datetime.now(), key=f"date_{event[0]}")
-                                    edit_time = st.text_input("Time", value=event[3], key=f"time_{event[0]}")
+                                        edit_date = st.date_input("Date", value=datetime.now(), key=f"date_{event.id}")
+                                    edit_time = st.text_input("Time", value=event.time, key=f"time_{event.id}")
                                 
                                 with col_b:
-                                    edit_venue = st.text_input("Venue", value=event[4], key=f"venue_{event[0]}")
+                                    edit_venue = st.text_input("Venue", value=event.venue, key=f"venue_{event.id}")
                                     status_options = ["upcoming", "ongoing", "past", "cancelled"]
-                                    current_status = event[8] if len(event) > 8 else "upcoming"
+                                    current_status = event.status
                                     edit_status = st.selectbox("Status", status_options, 
                                                               index=status_options.index(current_status) if current_status in status_options else 0, 
-                                                              key=f"status_{event[0]}")
-                                    edit_reg_url = st.text_input("Registration URL", value=event[7] if len(event) > 7 else "", key=f"reg_{event[0]}")
+                                                              key=f"status_{event.id}")
+                                    edit_reg_url = st.text_input("Registration URL", value=event.registration_url, key=f"reg_{event.id}")
                                 
-                                edit_description = st.text_area("Description", value=event[5], height=100, key=f"desc_{event[0]}")
-                                edit_image_url = st.text_input("Image URL", value=event[6] if len(event) > 6 else "", key=f"img_{event[0]}")
+                                edit_description = st.text_area("Description", value=event.description, height=100, key=f"desc_{event.id}")
+                                edit_image_url = st.text_input("Image URL", value=event.image_url, key=f"img_{event.id}")
                                 
                                 col_c, col_d = st.columns(2)
                                 with col_c:
                                     if st.form_submit_button("Update Event", type="primary"):
                                         website.update_event(
-                                            event[0], edit_title, str(edit_date), edit_time, 
+                                            event.id, edit_title, str(edit_date), edit_time, 
                                             edit_venue, edit_description, edit_image_url, 
                                             edit_reg_url, edit_status
                                         )
+                                        prefetch_remote_image(edit_image_url)
                                         st.success("✅ Event updated!")
                                         st.rerun()
                                 
                                 with col_d:
                                     if st.form_submit_button("❌ Delete Event"):
-                                        website.delete_event(event[0])
+                                        website.delete_event(event.id)
                                         st.success("✅ Event deleted!")
                                         st.rerun()
                         
                         with col2:
-                            if len(event) > 6 and event[6]:  # If image URL exists
-                                st.image(event[6], width=150)
+                            if event.image_url:
+                                st.image(image_src(event.image_url), width=150)
             else:
                 st.info("No events found. Add your first event above!")
         except Exception as e:
             st.error(f"Error loading events: {str(e)}")
-            st.info("The events table may need to be recreated. Try adding a new event above.")
     
     # TAB 2: Manage Music
     with admin_tabs[1]:
@@ -1740,7 +3474,7 @@ def render_admin_portal():
                     music_genre = st.selectbox("Genre *", ["House", "Afro House", "Afrobeat", "Electronic", "Deep House", "Tech House", "Other"])
                 
                 with col2:
-                    music_duration = st.text_input("Duration *", placeholder="e.g., 4:32")
+                    music_duration = st.text_input("Duration", placeholder="e.g., 4:32 (read from WAV/MP3 uploads)")
                     music_youtube = st.text_input("YouTube URL")
                     music_spotify = st.text_input("Spotify URL")
                     music_soundcloud = st.text_input("SoundCloud URL")
@@ -1752,25 +3486,29 @@ def render_admin_portal():
                 
                 submitted = st.form_submit_button("Add Music Track", type="primary")
                 if submitted:
-                    if music_title and music_album and music_year and music_duration and music_genre:
-                        # Save uploaded file
-                        file_path = ""
+                    if music_title and music_album and music_year and music_genre and (music_duration or music_file):
+                        # Save uploaded file and read its duration, format and waveform
+                        file_path, audio = "", None
                         if music_file:
-                            # Create music directory if it doesn't exist
-                            os.makedirs("music_uploads", exist_ok=True)
-                            file_path = f"music_uploads/{music_file.name}"
-                            with open(file_path, "wb") as f:
-                                f.write(music_file.getbuffer())
+                            file_path = store_upload(music_file)
+                            audio = analyse_audio(file_path)
+                        if audio:
+                            music_duration = music_duration or format_duration(audio.duration_seconds)
                         
-                        website.add_music(
-                            music_title, music_album, music_year, music_duration,
-                            music_youtube, music_spotify, music_soundcloud, 
-                            music_lyrics, file_path, music_genre
-                        )
-                        st.success("✅ Music track added successfully!")
-                        st.rerun()
+                        if music_duration:
+                            music_id = website.add_music(
+                                music_title, music_album, music_year, music_duration,
+                                music_youtube, music_spotify, music_soundcloud, 
+                                music_lyrics, file_path, music_genre
+                            )
+                            if audio:
+                                website.set_track_audio(music_id, audio)
+                            st.success("✅ Music track added successfully!")
+                            st.rerun()
+                        else:
+                            st.error("The duration could not be read from this file; please enter it")
                     else:
-                        st.error("Please fill in all required fields (*)")
+                        st.error("Please fill in all required fields (*) and a duration or an audio file")
     
     # TAB 3: Manage Films
     with admin_tabs[2]:
@@ -1801,6 +3539,7 @@ def render_admin_portal():
                             film_title, film_year, film_role, film_description,
                             film_trailer, film_watch, film_imdb, film_poster, film_status
                         )
+                        prefetch_remote_image(film_poster)
                         st.success("✅ Film added successfully!")
                         st.rerun()
                     else:
@@ -1834,17 +3573,17 @@ def render_admin_portal():
                         
                         # If image uploaded, save it
                         if uploaded_image:
-                            # Create gallery directory
-                            os.makedirs("gallery_uploads", exist_ok=True)
-                            # Save image
-                            image_path = f"gallery_uploads/{uploaded_image.name}"
-                            with open(image_path, "wb") as f:
-                                f.write(uploaded_image.getbuffer())
+                            image_path = store_upload(uploaded_image)
                             image_url = image_path
                         
-                        website.add_gallery_item(
+                        gallery_id = website.add_gallery_item(
                             gallery_title, gallery_category, image_url, gallery_description
                         )
+                        if uploaded_image:
+                            # Thumbnails and display sizes are built in the background
+                            get_image_workers().queue_gallery_variants(website, gallery_id, image_path)
+                        else:
+                            prefetch_remote_image(image_url)
                         st.success("✅ Gallery item added successfully!")
                         st.rerun()
                     else:
@@ -1877,6 +3616,7 @@ def render_admin_portal():
                             press_title, press_outlet, str(press_date),
                             press_url, press_excerpt, press_image
                         )
+                        prefetch_remote_image(press_image)
                         st.success("✅ Press article added successfully!")
                         st.rerun()
                     else:
@@ -1927,18 +3667,10 @@ def render_admin_portal():
                 if submitted:
                     if uploaded_photo:
                         try:
-                            # Create header_photos directory
-                            os.makedirs("header_photos", exist_ok=True)
+                            file_path = store_upload(uploaded_photo)
                             
-                            # Generate unique filename
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                            file_extension = uploaded_photo.name.split('.')[-1]
-                            filename = f"yanti_siggs_{timestamp}.{file_extension}"
-                            file_path = f"header_photos/{filename}"
-                            
-                            # Save the file
-                            with open(file_path, "wb") as f:
-                                f.write(uploaded_photo.getbuffer())
+                            # Pre-build the display renditions (also rejects unreadable images)
+                            build_header_renditions(file_path)
                             
                             # Add to database
                             website.add_header_photo(file_path, photo_caption, photo_position)
@@ -1955,25 +3687,25 @@ def render_admin_portal():
             current_photo = website.get_header_photo()
             
             if current_photo:
-                photo_path = current_photo[1]
+                photo_path = current_photo.photo_path
                 file_exists = os.path.exists(photo_path)
                 
                 st.markdown(f"""
                 <div class="photo-preview">
                     <p><strong>Active Since:</strong><br>
-                    {current_photo[2]}</p>
+                    {current_photo.upload_date}</p>
                     <p><strong>File Path:</strong><br>
                     <code>{photo_path}</code></p>
                     <p><strong>Status:</strong> {"✅ File exists" if file_exists else "❌ File missing"}</p>
-                    <p><strong>Caption:</strong> {current_photo[4] or "No caption"}</p>
-                    <p><strong>Position:</strong> {current_photo[5]}</p>
+                    <p><strong>Caption:</strong> {current_photo.caption or "No caption"}</p>
+                    <p><strong>Position:</strong> {current_photo.position}</p>
                 </div>
                 """, unsafe_allow_html=True)
                 
                 if file_exists:
                     try:
                         # Show image preview
-                        encoded_data = get_image_base64(photo_path)
+                        encoded_data = get_header_rendition(photo_path, HEADER_PREVIEW_SIZE)
                         if encoded_data:
                             img_base64, mime_type = encoded_data
                             st.markdown(f'<img src="data:image/{mime_type};base64,{img_base64}" width="200" style="border-radius:50%;">', 
@@ -1984,7 +3716,7 @@ def render_admin_portal():
                     st.warning("⚠️ Photo file not found at the specified path!")
                 
                 if st.button("Remove Current Photo", use_container_width=True):
-                    website.delete_header_photo(current_photo[0])
+                    website.delete_header_photo(current_photo.id)
                     st.success("✅ Photo removed!")
                     st.rerun()
             else:
@@ -1995,49 +3727,49 @@ def render_admin_portal():
         st.header("📋 Booking Requests Management")
         
         try:
-            bookings = website.get_all_bookings()
+            status, date_from, date_to, page_size, after = inbox_filters("bookings", BOOKING_STATUSES)
+            bookings, next_cursor = website.get_bookings_page(status, date_from, date_to, after, page_size)
             
             if bookings:
                 for booking in bookings:
-                    with st.expander(f"🎤 {booking[1] or 'Anonymous'} - {booking[5]} ({booking[10] if len(booking) > 10 else 'pending'})", expanded=False):
+                    with st.expander(f"🎤 {booking.name or 'Anonymous'} - {booking.event_date} ({booking.status})", expanded=False):
                         col1, col2 = st.columns([3, 1])
                         
                         with col1:
-                            st.write(f"**Name:** {booking[1] or 'Not provided'}")
-                            st.write(f"**Email:** {booking[2] or 'Not provided'}")
-                            st.write(f"**Phone:** {booking[3] or 'Not provided'}")
-                            st.write(f"**Event Type:** {booking[4]}")
-                            st.write(f"**Event Date:** {booking[5]}")
-                            st.write(f"**Venue:** {booking[6] or 'Not specified'}")
-                            st.write(f"**Budget:** {booking[7] or 'Not specified'}")
-                            st.write(f"**Date Submitted:** {booking[9]}")
-                            st.write(f"**Status:** {booking[10] if len(booking) > 10 else 'pending'}")
+                            st.write(f"**Name:** {booking.name or 'Not provided'}")
+                            st.write(f"**Email:** {booking.email or 'Not provided'}")
+                            st.write(f"**Phone:** {booking.phone or 'Not provided'}")
+                            st.write(f"**Event Type:** {booking.event_type}")
+                            st.write(f"**Event Date:** {booking.event_date}")
+                            st.write(f"**Venue:** {booking.venue or 'Not specified'}")
+                            st.write(f"**Budget:** {booking.budget or 'Not specified'}")
+                            st.write(f"**Date Submitted:** {booking.date_submitted}")
+                            st.write(f"**Status:** {booking.status}")
                             
                             st.markdown("---")
                             st.write("**Message:**")
-                            st.write(booking[8])
+                            st.write(booking.message)
                         
                         with col2:
-                            with st.form(f"booking_status_{booking[0]}"):
+                            with st.form(f"booking_status_{booking.id}"):
                                 new_status = st.selectbox("Status", 
-                                                        ["pending", "contacted", "confirmed", "declined", "completed"],
-                                                        index=["pending", "contacted", "confirmed", "declined", "completed"].index(booking[10]) 
-                                                        if len(booking) > 10 and booking[10] in ["pending", "contacted", "confirmed", "declined", "completed"] else 0,
-                                                        key=f"b_status_{booking[0]}")
+                                                        BOOKING_STATUSES,
+                                                        index=BOOKING_STATUSES.index(booking.status) 
+                                                        if booking.status in BOOKING_STATUSES else 0,
+                                                        key=f"b_status_{booking.id}")
                                 
                                 if st.form_submit_button("Update Status", type="primary"):
-                                    website.update_booking_status(booking[0], new_status)
+                                    website.update_booking_status(booking.id, new_status)
                                     st.success("✅ Status updated!")
                                     st.rerun()
                             
-                            if st.button("Delete Request", key=f"b_delete_{booking[0]}"):
-                                cursor = website.conn.cursor()
-                                cursor.execute("DELETE FROM bookings WHERE id = ?", (booking[0],))
-                                website.conn.commit()
+                            if st.button("Delete Request", key=f"b_delete_{booking.id}"):
+                                website.delete_booking(booking.id)
                                 st.success("✅ Booking request deleted!")
                                 st.rerun()
             else:
                 st.info("No booking requests found.")
+            render_inbox_pager("bookings", next_cursor)
         except Exception as e:
             st.error(f"Error loading booking requests: {str(e)}")
     
@@ -2046,21 +3778,56 @@ def render_admin_portal():
         st.header("Newsletter Subscribers")
         
         try:
-            subscribers = website.get_all_subscribers()
+            total_subscribers = website.get_database_stats()['total_subscribers']
+            subscribers = website.get_recent_subscribers()
             
             if subscribers:
-                # Display as table
+                # Display the most recent signups; the full list is available as an export
+                st.caption(f"Showing the {len(subscribers)} most recent of {total_subscribers} subscribers")
                 df = pd.DataFrame(subscribers, columns=['ID', 'Email', 'Name', 'Date Subscribed'])
                 st.dataframe(df, use_container_width=True)
                 
                 # Export option
-                csv = df.to_csv(index=False).encode('utf-8')
-                st.download_button(
-                    label="📥 Export as CSV",
-                    data=csv,
-                    file_name="yanti_siggs_subscribers.csv",
-                    mime="text/csv"
-                )
+                st.subheader("📥 Export Subscribers")
+                prepared = False
+                with st.form("subscriber_export_form"):
+                    col1, col2, col3 = st.columns([1, 2, 1])
+                    with col1:
+                        export_format = st.selectbox("Format", list(EXPORT_FORMATS))
+                    with col2:
+                        export_dates = st.date_input("Subscribed between", value=())
+                    with col3:
+                        export_gzip = st.checkbox("Gzip compress")
+                    
+                    if st.form_submit_button("Prepare Export", type="primary"):
+                        date_from = export_dates[0] if len(export_dates) > 0 else None
+                        date_to = export_dates[1] if len(export_dates) > 1 else date_from
+                        st.session_state.subscriber_export = write_subscriber_export(
+                            website, EXPORT_FORMATS[export_format], export_gzip, date_from, date_to)
+                        prepared = True
+                
+                export = st.session_state.get('subscriber_export')
+                if export and os.path.exists(export[0]):
+                    path, rows = export
+                    size_kb = os.path.getsize(path) / 1024
+                    if media_server_available():
+                        token = get_download_tokens().issue(path)
+                        st.markdown(f"[📥 Download {os.path.basename(path)}]({media_url(path)}?token={token}) "
+                                    f"({rows} rows, {size_kb:,.0f} KB) — the link works once")
+                    elif os.path.getsize(path) > EXPORT_INLINE_MAX_BYTES:
+                        st.warning(f"This export is {size_kb / 1024:,.0f} MB. Exports over "
+                                   f"{EXPORT_INLINE_MAX_BYTES // (1024 * 1024)} MB need the media server "
+                                   "(set YANTI_MEDIA_URL); try gzip or a narrower date range.")
+                    elif prepared:
+                        with open(path, 'rb') as f:
+                            st.download_button(
+                                label=f"📥 Download ({rows} rows, {size_kb:,.0f} KB)",
+                                data=f,
+                                file_name=os.path.basename(path),
+                                mime="application/gzip" if path.endswith('.gz') else "text/plain"
+                            )
+                    else:
+                        st.caption(f"{os.path.basename(path)} ({rows} rows) — prepare the export again to download it.")
             else:
                 st.info("No subscribers found.")
         except Exception as e:
@@ -2071,45 +3838,45 @@ def render_admin_portal():
         st.header("Contact Messages")
         
         try:
-            contacts = website.get_all_contacts()
+            status, date_from, date_to, page_size, after = inbox_filters("contacts", CONTACT_STATUSES)
+            contacts, next_cursor = website.get_contacts_page(status, date_from, date_to, after, page_size)
             
             if contacts:
                 for contact in contacts:
-                    with st.expander(f"📩 {contact[1]} - {contact[5]} ({contact[6] if len(contact) > 6 else 'unread'})", expanded=False):
+                    with st.expander(f"📩 {contact.name} - {contact.date_sent} ({contact.status})", expanded=False):
                         col1, col2 = st.columns([3, 1])
                         
                         with col1:
-                            st.write(f"**Name:** {contact[1]}")
-                            st.write(f"**Email:** {contact[2]}")
-                            st.write(f"**Phone:** {contact[3] or 'Not provided'}")
-                            st.write(f"**Date Sent:** {contact[5]}")
-                            st.write(f"**Status:** {contact[6] if len(contact) > 6 else 'unread'}")
+                            st.write(f"**Name:** {contact.name}")
+                            st.write(f"**Email:** {contact.email}")
+                            st.write(f"**Phone:** {contact.phone or 'Not provided'}")
+                            st.write(f"**Date Sent:** {contact.date_sent}")
+                            st.write(f"**Status:** {contact.status}")
                             
                             st.markdown("---")
                             st.write("**Message:**")
-                            st.write(contact[4])
+                            st.write(contact.message)
                         
                         with col2:
-                            with st.form(f"contact_status_{contact[0]}"):
+                            with st.form(f"contact_status_{contact.id}"):
                                 new_status = st.selectbox("Status", 
-                                                        ["unread", "read", "replied", "archived"],
-                                                        index=["unread", "read", "replied", "archived"].index(contact[6]) 
-                                                        if len(contact) > 6 and contact[6] in ["unread", "read", "replied", "archived"] else 0,
-                                                        key=f"c_status_{contact[0]}")
+                                                        CONTACT_STATUSES,
+                                                        index=CONTACT_STATUSES.index(contact.status) 
+                                                        if contact.status in CONTACT_STATUSES else 0,
+                                                        key=f"c_status_{contact.id}")
                                 
                                 if st.form_submit_button("Update Status", type="primary"):
-                                    website.update_contact_status(contact[0], new_status)
+                                    website.update_contact_status(contact.id, new_status)
                                     st.success("✅ Status updated!")
                                     st.rerun()
                             
-                            if st.button("Delete Message", key=f"c_delete_{contact[0]}"):
-                                cursor = website.conn.cursor()
-                                cursor.execute("DELETE FROM contacts WHERE id = ?", (contact[0],))
-                                website.conn.commit()
+                            if st.button("Delete Message", key=f"c_delete_{contact.id}"):
+                                website.delete_contact_message(contact.id)
                                 st.success("✅ Message deleted!")
                                 st.rerun()
             else:
                 st.info("No contact messages found.")
+            render_inbox_pager("contacts", next_cursor)
         except Exception as e:
             st.error(f"Error loading contact messages: {str(e)}")
     
@@ -2138,28 +3905,69 @@ def render_admin_portal():
             
             if st.button("🔄 Refresh Database", use_container_width=True):
                 try:
-                    website.setup_database()
+                    # Drop the shared instance so the next run reconnects and re-checks the schema
+                    website.close()
+                    get_website.clear()
                     st.success("Database refreshed!")
                     st.rerun()
                 except Exception as e:
                     st.error(f"Error refreshing database: {str(e)}")
             
+            if st.button("🔍 Check Query Plans", use_container_width=True):
+                plans = website.check_query_plans()
+                failures = [row for row in plans if not row[2]]
+                if failures:
+                    st.error(f"{len(failures)} hot queries are not using their index!")
+                else:
+                    st.success("All hot queries use their indexes.")
+                st.dataframe(pd.DataFrame(plans, columns=['Query', 'Expected Index', 'OK', 'Plan']),
+                             use_container_width=True, hide_index=True)
+            
             if st.button("🗑️ Clear Test Data", use_container_width=True):
                 st.warning("This will delete all sample data. Are you sure?")
                 if st.button("Yes, Delete All Test Data"):
                     try:
-                        cursor = website.conn.cursor()
-                        cursor.execute("DELETE FROM events WHERE id <= 4")
-                        cursor.execute("DELETE FROM gallery WHERE id <= 4")
-                        cursor.execute("DELETE FROM music WHERE id <= 3")
-                        cursor.execute("DELETE FROM films WHERE id <= 3")
-                        cursor.execute("DELETE FROM press WHERE id <= 3")
-                        website.conn.commit()
+                        website.clear_test_data()
                         st.success("Test data cleared!")
                         st.rerun()
                     except Exception as e:
                         st.error(f"Error clearing test data: {str(e)}")
     
+    # TAB 11: Performance
+    with admin_tabs[10]:
+        st.header("Performance")
+        
+        if not PERF_ENABLED:
+            st.info("Instrumentation is switched off (YANTI_PERF=0).")
+        else:
+            if not media_server_available():
+                metrics_note = f"set YANTI_MEDIA_URL to serve them at {METRICS_PATH}"
+            elif METRICS_TOKEN:
+                metrics_note = f"{media_url(METRICS_PATH.lstrip('/'))} (with the YANTI_METRICS_TOKEN bearer token)"
+            else:
+                metrics_note = f"{METRICS_PATH} on port {MEDIA_SERVER_PORT}, from localhost only"
+            st.caption(f"Wall time, SQL statements and bytes sent per section over the last {PERF_WINDOW} calls "
+                       f"of each, across all sessions. Cumulative counters: {metrics_note}")
+            rows = perf_monitor.summary()
+            if rows:
+                st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+                
+                section = st.selectbox("Latency histogram", [row['Section'] for row in rows], key="perf_section")
+                histogram = perf_monitor.histogram(section)
+                st.bar_chart(pd.DataFrame({'Calls': list(histogram.values())}, index=list(histogram)))
+            else:
+                st.info("No samples yet.")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.download_button("⬇️ Download Prometheus Metrics", perf_monitor.prometheus(),
+                                   file_name="yanti_siggs_metrics.prom", mime="text/plain",
+                                   use_container_width=True)
+            with col2:
+                if st.button("🔄 Reset Counters", use_container_width=True):
+                    perf_monitor.reset()
+                    st.rerun()
+    
     # BOTTOM NAVIGATION
     st.markdown("---")
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -2173,6 +3981,365 @@ def render_admin_portal():
             st.session_state.booking_clicks = 0
             st.rerun()
 
+@timed
+def render_home_tab():
+    """Render the home tab with bio, upcoming events and latest release"""
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown('<div class="card"><h2 class="card-title">Welcome to Yanti Siggs Official Website</h2>', unsafe_allow_html=True)
+        st.write("""
+        **Yanti Siggs** is a dynamic multi-talented creative force from Zimbabwe, 
+        seamlessly blending music, film, and entrepreneurship. As the CEO & Founder of 
+        Yanti Studios, she's redefining what it means to be a modern creative entrepreneur.
+        
+        ### Creative Portfolio:
+        • **DJ & Music Producer**: Blending house, afrobeat, and electronic sounds
+        • **Filmmaker & Actress**: Creating compelling stories for screen
+        • **Entrepreneur**: Building Yanti Studios into a creative powerhouse
+        • **Singer & Songwriter**: Expressing stories through music
+        
+        **Education**: Studied at Damelin College
+        """)
+        
+        # Quote
+        st.markdown("""
+        <div class="quote-box">
+            <p>"make sure you die empty, life expectancy is now 45yrs!!"</p>
+            <p style="text-align: right; margin-top: 1rem;"><strong>— Yanti Siggs</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Family Section
+        st.markdown("### 👨‍👩‍👧‍👦 Family")
+        col_a, col_b, col_c, col_d = st.columns(4)
+        with col_a:
+            st.markdown("**Eric Zivanai**\n\nBrother")
+        with col_b:
+            st.markdown("**Munashe Munzvengi**\n\nCousin")
+        with col_c:
+            st.markdown("**Acenah Zee**\n\nCousin")
+        with col_d:
+            st.markdown("**Kay Kudzai**\n\nCousin")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+        # Upcoming Events Preview
+        st.markdown('<div class="card"><h2 class="card-title">🎯 Upcoming Events</h2>', unsafe_allow_html=True)
+        try:
+            events = website.get_events(limit=3, status='upcoming')
+            if events:
+                render_fragments('event', events, event_card_html)
+            else:
+                st.info("No upcoming events at the moment. Check back soon!")
+        except Exception as e:
+            st.error(f"Error loading events: {str(e)}")
+            st.info("Events functionality is currently being updated.")
+        
+        st.button("View All Events", key="home_events", on_click=go_to_section, args=("Events",))
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col2:
+        # Quick Links
+        st.markdown('<div class="card"><h2 class="card-title">🔗 Quick Links</h2>', unsafe_allow_html=True)
+        st.button("🎶 Listen to Music", use_container_width=True, on_click=go_to_section, args=("Music",))
+        st.button("🎬 Watch Films", use_container_width=True, on_click=go_to_section, args=("Films",))
+        st.button("📅 View Events Calendar", use_container_width=True, on_click=go_to_section, args=("Events",))
+        st.button("🎤 Book for Event", use_container_width=True, on_click=go_to_section, args=("Bookings",))
+        st.button("📸 View Gallery", use_container_width=True, on_click=go_to_section, args=("Gallery",))
+        st.button("💌 Subscribe", use_container_width=True, on_click=go_to_section, args=("Subscribe",))
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+        # Latest Music
+        st.markdown('<div class="card"><h2 class="card-title">🎵 Latest Release</h2>', unsafe_allow_html=True)
+        try:
+            music = website.get_music(limit=1)
+            if music:
+                render_fragments('music', music, music_card_html)
+            else:
+                st.info("No music available yet. Check back soon!")
+        except Exception as e:
+            st.error(f"Error loading music: {str(e)}")
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+        # Travel Timeline
+        st.markdown('<div class="card"><h2 class="card-title">🌍 Travel Timeline</h2>', unsafe_allow_html=True)
+        st.markdown("""
+        <div class="timeline">
+            <div class="timeline-item">
+                <strong>2006</strong><br>
+                Poland (Sopot, Krakow, Warszawa)<br>
+                Zambia
+            </div>
+            <div class="timeline-item">
+                <strong>2007</strong><br>
+                London, United Kingdom
+            </div>
+            <div class="timeline-item">
+                <strong>2010</strong><br>
+                Victoria Falls, Zimbabwe<br>
+                Cape Town, South Africa
+            </div>
+            <div class="timeline-item">
+                <strong>2011</strong><br>
+                Mozambique
+            </div>
+            <div class="timeline-item">
+                <strong>2012</strong><br>
+                Blantyre, Malawi<br>
+                Got a pet
+            </div>
+            <div class="timeline-item">
+                <strong>2013</strong><br>
+                Botswana<br>
+                Harare, Zimbabwe<br>
+                Johannesburg, South Africa
+            </div>
+            <div class="timeline-item">
+                <strong>2014</strong><br>
+                Other Life Event
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+@timed
+def render_music_tab():
+    """Render the music catalogue tab"""
+    st.markdown('<div class="card"><h2 class="card-title">🎵 Music & DJ Sets</h2>', unsafe_allow_html=True)
+    st.write("""
+    Experience the unique sound of Yanti Siggs - a fusion of house, afrobeat, 
+    and electronic music that gets any crowd moving.
+    """)
+    
+    # Music filters
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        music_genre = st.selectbox("Filter by Genre", ["All"] + MUSIC_GENRES)
+    with col2:
+        sort_by = st.selectbox("Sort By", list(MUSIC_SORT_LABELS))
+    
+    try:
+        genre = music_genre if music_genre != "All" else None
+        pages = max(1, -(-website.count_music(genre) // MUSIC_PAGE_SIZE))
+        with col3:
+            page = st.number_input("Page", min_value=1, max_value=pages, value=1, step=1)
+        music_tracks = website.query_music(genre=genre, sort=MUSIC_SORT_LABELS[sort_by],
+                                           limit=MUSIC_PAGE_SIZE, offset=(page - 1) * MUSIC_PAGE_SIZE)
+        
+        if music_tracks:
+            for track in music_tracks:
+                with st.expander(f"{track.title} - {track.album} ({track.year}) • {track.genre}", expanded=False):
+                    col1, col2 = st.columns([3, 1])
+                    
+                    with col1:
+                        st.markdown(f"**Album:** {track.album}")
+                        st.markdown(f"**Year:** {track.year}")
+                        st.markdown(f"**Duration:** {track_duration(track)}")
+                        st.markdown(f"**Genre:** {track.genre}")
+                        if track.sample_rate:
+                            st.markdown(f"**Audio:** {track.bitrate} kbps • {track.sample_rate / 1000:g} kHz • "
+                                        f"{'stereo' if track.channels == 2 else 'mono'}")
+                        
+                        # Streaming links
+                        if track.youtube_url:
+                            st.markdown(f"[▶️ YouTube]({track.youtube_url})")
+                        if track.spotify_url:
+                            st.markdown(f"[🎵 Spotify]({track.spotify_url})")
+                        if track.soundcloud_url:
+                            st.markdown(f"[🎚️ SoundCloud]({track.soundcloud_url})")
+                        
+                        if track.has_lyrics:
+                            # Lyrics are fetched only once a visitor asks for them
+                            if st.checkbox("📜 View Lyrics", key=f"lyrics_{track.id}"):
+                                st.write(website.get_lyrics(track.id))
+                    
+                    with col2:
+                        # Play button for local files, under the waveform stored at upload
+                        if track.file_path:
+                            if os.path.exists(track.file_path):
+                                if track.waveform:
+                                    st.markdown(get_fragment_cache().get('waveform', track.waveform, waveform_svg),
+                                                unsafe_allow_html=True)
+                                render_audio_player(track.file_path, track.id)
+                            else:
+                                st.warning("Audio file not available")
+        else:
+            st.info("No music tracks available yet. Check back soon!")
+    except Exception as e:
+        st.error(f"Error loading music: {str(e)}")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+@timed
+def render_films_tab():
+    """Render the film projects tab"""
+    st.markdown('<div class="card"><h2 class="card-title">🎬 Film Projects</h2>', unsafe_allow_html=True)
+    st.write("""
+    Explore Yanti Siggs' filmography - from directing and producing to acting, 
+    each project tells a unique story.
+    """)
+    
+    try:
+        films = website.get_films()
+        
+        if films:
+            for film in films:
+                with st.expander(f"{film.title} ({film.year}) - {film.role}", expanded=False):
+                    col1, col2 = st.columns([3, 1])
+                    
+                    with col1:
+                        st.markdown(f"**Year:** {film.year}")
+                        st.markdown(f"**Role:** {film.role}")
+                        st.markdown(f"**Status:** {film.status.replace('_', ' ').title()}")
+                        
+                        st.markdown("---")
+                        st.markdown(f"**Description:**")
+                        st.write(film.description)
+                        
+                        # Links
+                        col_a, col_b, col_c = st.columns(3)
+                        if film.trailer_url:
+                            with col_a:
+                                st.markdown(f"[🎬 Trailer]({film.trailer_url})")
+                        if film.watch_url:
+                            with col_b:
+                                st.markdown(f"[📺 Watch]({film.watch_url})")
+                        if film.imdb_url:
+                            with col_c:
+                                st.markdown(f"[⭐ IMDb]({film.imdb_url})")
+                    
+                    with col2:
+                        if film.poster_url:
+                            st.image(image_src(film.poster_url), width=200)
+        else:
+            st.info("No film projects available yet. Check back soon!")
+    except Exception as e:
+        st.error(f"Error loading films: {str(e)}")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+@timed
+def render_events_tab():
+    """Render the events tab"""
+    st.markdown('<div class="card"><h2 class="card-title">📅 Upcoming Events & Shows</h2>', unsafe_allow_html=True)
+    st.write("""
+    Catch Yanti Siggs live at these upcoming events. From club nights to film premieres, 
+    there's always something exciting happening.
+    """)
+    
+    # Event filters
+    col1, col2 = st.columns(2)
+    with col1:
+        event_status = st.selectbox("Filter Events", ["upcoming", "past", "all"])
+    with col2:
+        if st.button("🗓️ Add to Calendar", use_container_width=True):
+            st.info("Calendar integration coming soon!")
+    
+    try:
+        events = website.get_events(status=event_status) if event_status != "all" else website.get_all_events()
+        
+        if events:
+            for event in events:
+                with st.expander(f"{event.title} - {event.date} ({event.status})", expanded=False):
+                    col1, col2 = st.columns([3, 1])
+                    
+                    with col1:
+                        st.markdown(f"**Date:** {event.date}")
+                        st.markdown(f"**Time:** {event.time}")
+                        st.markdown(f"**Venue:** {event.venue}")
+                        st.markdown(f"**Status:** {event.status.upper()}")
+                        
+                        st.markdown("---")
+                        st.markdown(f"**Description:**")
+                        st.write(event.description)
+                        
+                        if event.registration_url:
+                            st.markdown(f"[📝 Register Here]({event.registration_url})")
+                    
+                    with col2:
+                        if event.image_url:
+                            st.image(image_src(event.image_url), width=200)
+        else:
+            st.info("No events found. Check back soon for upcoming events!")
+    except Exception as e:
+        st.error(f"Error loading events: {str(e)}")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+def set_gallery_focus(gallery_id):
+    """Open (or with None, close) the full-size view of a gallery item"""
+    st.session_state.gallery_focus = gallery_id
+
+@timed
+def render_gallery_tab():
+    """Render the gallery tab"""
+    st.markdown('<div class="card"><h2 class="card-title">📸 Visual Portfolio</h2>', unsafe_allow_html=True)
+    st.write("""
+    A visual journey through Yanti Siggs' creative world - from DJ sets and film shoots 
+    to studio sessions and red carpet moments.
+    """)
+    
+    # Gallery categories
+    categories = ["All", "Music", "Film", "Studio", "Events", "Personal"]
+    selected_category = st.selectbox("Filter by Category", categories)
+    
+    try:
+        gallery_items = website.get_gallery(
+            category=selected_category if selected_category != "All" else None, 
+            limit=12
+        )
+        
+        if gallery_items:
+            # Full-size view of the item the visitor opened
+            focused = [item for item in gallery_items if item.id == st.session_state.get('gallery_focus')]
+            if focused:
+                item = focused[0]
+                st.image(image_src(gallery_variant(item, 'large') or item.image_url), use_column_width=True)
+                st.markdown(f"**{item.title}** — {item.category} • {item.description}")
+                st.button("✖ Close", key="gallery_close", on_click=set_gallery_focus, args=(None,))
+            
+            # Display in grid (thumbnails only)
+            cols = st.columns(3)
+            for idx, item in enumerate(gallery_items):
+                with cols[idx % 3]:
+                    thumbnail = gallery_variant(item, 'thumb')
+                    if not thumbnail and os.path.isfile(item.image_url):
+                        # Uploaded before the pipeline existed; show the original this time
+                        get_image_workers().queue_gallery_variants(website, item.id, item.image_url)
+                    st.image(image_src(thumbnail or item.image_url), use_column_width=True)
+                    st.markdown(f"**{item.title}**")
+                    st.caption(f"{item.category} • {item.description}")
+                    st.button("🔍 View", key=f"gallery_view_{item.id}", on_click=set_gallery_focus, args=(item.id,))
+        else:
+            st.info("No gallery items available yet. Check back soon!")
+    except Exception as e:
+        st.error(f"Error loading gallery: {str(e)}")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+@timed
+def render_press_tab():
+    """Render the press and media tab"""
+    st.markdown('<div class="card"><h2 class="card-title">📰 Press & Media</h2>', unsafe_allow_html=True)
+    st.write("""
+    Featured press coverage and media appearances highlighting Yanti Siggs' work 
+    and creative journey.
+    """)
+    
+    try:
+        press_articles = website.get_press()
+        
+        if press_articles:
+            render_fragments('press', press_articles, press_card_html)
+        else:
+            st.info("No press articles available yet. Check back soon!")
+    except Exception as e:
+        st.error(f"Error loading press articles: {str(e)}")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+@timed
 def render_booking_tab():
     """Render the booking request tab with admin access option"""
     st.markdown('<div class="card"><h2 class="card-title">🎤 Book Yanti Siggs</h2>', unsafe_allow_html=True)
@@ -2206,14 +4373,20 @@ def render_booking_tab():
         
         if submitted:
             if name and email and phone and event_type and event_date and message:
-                website.add_booking_request(name, email, phone, event_type, str(event_date), venue, budget, message)
-                st.success("""
-                ✅ **Thank you for your booking request!**
-                
-                Our team has received your request and will contact you within 24-48 hours 
-                to discuss your event in detail. We're excited about the possibility of 
-                working with you!
-                """)
+                try:
+                    booking = website.queue_booking_request(name, email, phone, event_type, str(event_date),
+                                                            venue, budget, message)
+                except queue.Full:
+                    st.error(BUSY_MESSAGE)
+                else:
+                    if submission_saved(booking):
+                        st.success("""
+                        ✅ **Thank you for your booking request!**
+                    
+                        Our team has received your request and will contact you within 24-48 hours 
+                        to discuss your event in detail. We're excited about the possibility of 
+                        working with you!
+                        """)
             else:
                 st.error("Please fill in all required fields (*)")
     
@@ -2260,7 +4433,203 @@ def render_booking_tab():
                 st.success("✅ Admin access granted! Loading admin portal...")
                 st.rerun()
 
+@timed
+def render_contact_tab():
+    """Render the contact tab with the message form"""
+    st.markdown('<div class="card"><h2 class="card-title">📞 Contact Yanti Studios</h2>', unsafe_allow_html=True)
+    st.write("""
+    Get in touch with Yanti Siggs and the Yanti Studios team for collaborations, 
+    media inquiries, or general questions.
+    """)
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.markdown("""
+        ### Contact Information
+        
+        **🎵 CEO & Founder:** Yanti Siggs  
+        **🏢 Company:** Yanti Studios  
+        **📍 Location:** Zimbabwe
+        
+        ### Languages Spoken
+        • Shona  
+        • English
+        
+        ### Personal Details
+        **Gender:** Female  
+        **Birth Date:** June 17  
+        **Relationship Status:** Single
+        
+        ### Social Media
+        • **Instagram:** @sisiyantisiggs
+        • **Other:** @sisiyantisigss
+        """)
+    
+    with col2:
+        st.markdown("### Send a Message")
+        with st.form("contact_form"):
+            name = st.text_input("Your Name *")
+            email = st.text_input("Your Email *")
+            phone = st.text_input("Your Phone")
+            subject = st.selectbox("Subject", 
+                                 ["Collaboration Inquiry", "Media Interview", 
+                                  "General Inquiry", "Business Proposal", "Other"])
+            message = st.text_area("Your Message *", height=150)
+            
+            submitted = st.form_submit_button("Send Message", type="primary")
+            
+            if submitted:
+                if name and email and message:
+                    try:
+                        contact = website.queue_contact_message(name, email, phone, message)
+                    except queue.Full:
+                        st.error(BUSY_MESSAGE)
+                    else:
+                        if submission_saved(contact):
+                            st.success("""
+                            ✅ **Thank you for your message!**
+                        
+                            We have received your message and will respond as soon as possible.
+                            """)
+                else:
+                    st.error("Please fill in all required fields (*)")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+@timed
+def render_subscribe_tab():
+    """Render the newsletter subscription tab"""
+    st.markdown('<div class="card"><h2 class="card-title">💌 Subscribe to Newsletter</h2>', unsafe_allow_html=True)
+    st.write("""
+    Stay updated with Yanti Siggs' latest music releases, film projects, 
+    upcoming events, and creative endeavors. Join our exclusive community!
+    """)
+    
+    with st.form("subscribe_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            name = st.text_input("Your Name")
+        with col2:
+            email = st.text_input("Your Email *")
+        
+        interests = st.multiselect("Areas of Interest",
+                                  ["Music Releases", "DJ Events", "Film Projects", 
+                                   "Studio Updates", "Creative Workshops", "All Updates"])
+        
+        submitted = st.form_submit_button("Subscribe", type="primary")
+        
+        if submitted:
+            if email:
+                try:
+                    signup = website.queue_subscriber(email, name)
+                    # Wait briefly for the group commit so duplicates can be reported
+                    subscribed = signup.result(timeout=SUBMISSION_ACK_TIMEOUT) is not None
+                except queue.Full:
+                    subscribed = None
+                    st.error(BUSY_MESSAGE)
+                except FutureTimeoutError:
+                    subscribed = None  # Still queued: not confirmed until it commits
+                    st.info(SUBMISSION_PENDING_MESSAGE)
+                except sqlite3.Error:
+                    subscribed = None
+                    st.error(SUBMISSION_FAILED_MESSAGE)
+                if subscribed:
+                    st.success("""
+                    ✅ **Thank you for subscribing!**
+                    
+                    Welcome to the Yanti Siggs creative community. 
+                    You'll receive exclusive updates and behind-the-scenes content.
+                    """)
+                elif subscribed is False:
+                    st.warning("This email is already subscribed. Thank you for your continued support!")
+            else:
+                st.error("Please enter your email address")
+    
+    st.markdown("---")
+    st.markdown("""
+    ### What You'll Receive:
+    - 🎵 New music and DJ set releases
+    - 🎬 Film project announcements and trailers
+    - 📅 Exclusive event invitations
+    - 🎨 Behind-the-scenes studio content
+    - 💡 Creative insights and updates
+    - 🎫 Early access to tickets and merchandise
+    """)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+@timed
+def render_search_tab():
+    """Render the site-wide search tab"""
+    st.markdown('<div class="card"><h2 class="card-title">🔍 Search</h2>', unsafe_allow_html=True)
+    query = st.text_input("Search music, films, events, press and gallery",
+                          placeholder="e.g. afro house, Harare, documentary", key="search_query")
+    
+    if query:
+        try:
+            results = website.search(query)
+            if results:
+                st.caption(f"{len(results)} result{'s' if len(results) != 1 else ''}")
+                for index, (section, item_id, title, detail, excerpt) in enumerate(results):
+                    col1, col2 = st.columns([4, 1])
+                    with col1:
+                        st.markdown(f"**{title}** · {PUBLIC_SECTIONS[section][0]}" + (f" · {detail}" if detail else ""))
+                        if excerpt:
+                            st.caption(excerpt)
+                    with col2:
+                        st.button("Open", key=f"search_open_{index}",
+                                  on_click=go_to_section, args=(section,))
+            else:
+                st.info("No matches found. Try a different word.")
+        except Exception as e:
+            st.error(f"Error searching: {str(e)}")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+# Public site sections: ?tab= slug -> (navigation label, renderer)
+PUBLIC_SECTIONS = {
+    "Home": ("🏠 Home", render_home_tab),
+    "Music": ("🎵 Music", render_music_tab),
+    "Films": ("🎬 Films", render_films_tab),
+    "Events": ("📅 Events", render_events_tab),
+    "Gallery": ("📸 Gallery", render_gallery_tab),
+    "Press": ("📰 Press", render_press_tab),
+    "Bookings": ("🎤 Bookings", render_booking_tab),
+    "Contact": ("📞 Contact", render_contact_tab),
+    "Subscribe": ("💌 Subscribe", render_subscribe_tab),
+    "Search": ("🔍 Search", render_search_tab),
+}
+
+# Navigation label -> ?tab= slug
+SECTION_BY_LABEL = {label: section for section, (label, _) in PUBLIC_SECTIONS.items()}
+
+def go_to_section(section):
+    """Switch the visible public section (usable as a widget callback)"""
+    st.session_state.nav_section = PUBLIC_SECTIONS[section][0]
+    st.experimental_set_query_params(tab=section)
+
+def sync_section_query_param():
+    """Keep ?tab= in step with the navigation bar so the URL stays shareable"""
+    st.experimental_set_query_params(tab=SECTION_BY_LABEL[st.session_state.nav_section])
+
+@timed
+def render_section_nav():
+    """Render the public navigation bar and return the selected section"""
+    if st.session_state.get('nav_section') not in SECTION_BY_LABEL:
+        # New session (or back from the admin portal): honour ?tab= deep links
+        requested = st.experimental_get_query_params().get('tab', ['Home'])[0]
+        section = requested if requested in PUBLIC_SECTIONS else "Home"
+        st.session_state.nav_section = PUBLIC_SECTIONS[section][0]
+    
+    label = st.radio("Navigate", list(SECTION_BY_LABEL), key="nav_section", horizontal=True,
+                     label_visibility="collapsed", on_change=sync_section_query_param)
+    return SECTION_BY_LABEL[label]
+
+@timed
 def main():
+    count_emitted_bytes()
+    
     # Page configuration
     st.set_page_config(
         page_title="Yanti Siggs | DJ • Filmmaker • Entrepreneur",
@@ -2272,9 +4641,12 @@ def main():
     # Load CSS
     load_css()
     
-    # Initialize website database
+    # Shared website database (schema setup runs once per process)
     global website
-    website = YantiSiggsWebsite()
+    website = get_website()
+    start_media_server()
+    # First pass on startup, then every MEDIA_GC_INTERVAL against the current data layer
+    get_media_reconciler().data_layer = website
     
     # Initialize session state for admin access
     if 'admin_access' not in st.session_state:
@@ -2294,484 +4666,9 @@ def main():
         # Regular website content with photo header
         render_header_with_photo()
         
-        # Navigation Tabs - FIXED FOR MOBILE
-        tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9 = st.tabs([
-            "🏠 Home", "🎵 Music", "🎬 Films", "📅 Events", "📸 Gallery", 
-            "📰 Press", "🎤 Bookings", "📞 Contact", "💌 Subscribe"
-        ])
-        
-        # HOME TAB
-        with tab1:
-            col1, col2 = st.columns([2, 1])
-            
-            with col1:
-                st.markdown('<div class="card"><h2 class="card-title">Welcome to Yanti Siggs Official Website</h2>', unsafe_allow_html=True)
-                st.write("""
-                **Yanti Siggs** is a dynamic multi-talented creative force from Zimbabwe, 
-                seamlessly blending music, film, and entrepreneurship. As the CEO & Founder of 
-                Yanti Studios, she's redefining what it means to be a modern creative entrepreneur.
-                
-                ### Creative Portfolio:
-                • **DJ & Music Producer**: Blending house, afrobeat, and electronic sounds
-                • **Filmmaker & Actress**: Creating compelling stories for screen
-                • **Entrepreneur**: Building Yanti Studios into a creative powerhouse
-                • **Singer & Songwriter**: Expressing stories through music
-                
-                **Education**: Studied at Damelin College
-                """)
-                
-                # Quote
-                st.markdown("""
-                <div class="quote-box">
-                    <p>"make sure you die empty, life expectancy is now 45yrs!!"</p>
-                    <p style="text-align: right; margin-top: 1rem;"><strong>— Yanti Siggs</strong></p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Family Section
-                st.markdown("### 👨‍👩‍👧‍👦 Family")
-                col_a, col_b, col_c, col_d = st.columns(4)
-                with col_a:
-                    st.markdown("**Eric Zivanai**\n\nBrother")
-                with col_b:
-                    st.markdown("**Munashe Munzvengi**\n\nCousin")
-                with col_c:
-                    st.markdown("**Acenah Zee**\n\nCousin")
-                with col_d:
-                    st.markdown("**Kay Kudzai**\n\nCousin")
-                
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-                # Upcoming Events Preview
-                st.markdown('<div class="card"><h2 class="card-title">🎯 Upcoming Events</h2>', unsafe_allow_html=True)
-                try:
-                    events = website.get_events(limit=3, status='upcoming')
-                    if events:
-                        for event in events:
-                            st.markdown(f"""
-                            <div class="event-card">
-                                <h4>{event[1]}</h4>
-                                <p>📅 {event[2]} | 🕒 {event[3]}<br>
-                                📍 {event[4]}</p>
-                                <p>{event[5][:100]}...</p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                    else:
-                        st.info("No upcoming events at the moment. Check back soon!")
-                except Exception as e:
-                    st.error(f"Error loading events: {str(e)}")
-                    st.info("Events functionality is currently being updated.")
-                
-                if st.button("View All Events", key="home_events"):
-                    st.switch_page("?tab=Events")
-                st.markdown('</div>', unsafe_allow_html=True)
-            
-            with col2:
-                # Quick Links
-                st.markdown('<div class="card"><h2 class="card-title">🔗 Quick Links</h2>', unsafe_allow_html=True)
-                if st.button("🎶 Listen to Music", use_container_width=True):
-                    st.switch_page("?tab=Music")
-                if st.button("🎬 Watch Films", use_container_width=True):
-                    st.switch_page("?tab=Films")
-                if st.button("📅 View Events Calendar", use_container_width=True):
-                    st.switch_page("?tab=Events")
-                if st.button("🎤 Book for Event", use_container_width=True):
-                    st.switch_page("?tab=Bookings")
-                if st.button("📸 View Gallery", use_container_width=True):
-                    st.switch_page("?tab=Gallery")
-                if st.button("💌 Subscribe", use_container_width=True):
-                    st.switch_page("?tab=Subscribe")
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-                # Latest Music
-                st.markdown('<div class="card"><h2 class="card-title">🎵 Latest Release</h2>', unsafe_allow_html=True)
-                try:
-                    music = website.get_music(limit=1)
-                    if music:
-                        track = music[0]
-                        st.markdown(f"""
-                        <div class="music-card">
-                            <h4>{track[1]}</h4>
-                            <p>📀 Album: {track[2]}<br>
-                            🎤 Year: {track[3]}<br>
-                            ⏱️ Duration: {track[4]}<br>
-                            🎶 Genre: {track[10]}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    else:
-                        st.info("No music available yet. Check back soon!")
-                except Exception as e:
-                    st.error(f"Error loading music: {str(e)}")
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-                # Travel Timeline
-                st.markdown('<div class="card"><h2 class="card-title">🌍 Travel Timeline</h2>', unsafe_allow_html=True)
-                st.markdown("""
-                <div class="timeline">
-                    <div class="timeline-item">
-                        <strong>2006</strong><br>
-                        Poland (Sopot, Krakow, Warszawa)<br>
-                        Zambia
-                    </div>
-                    <div class="timeline-item">
-                        <strong>2007</strong><br>
-                        London, United Kingdom
-                    </div>
-                    <div class="timeline-item">
-                        <strong>2010</strong><br>
-                        Victoria Falls, Zimbabwe<br>
-                        Cape Town, South Africa
-                    </div>
-                    <div class="timeline-item">
-                        <strong>2011</strong><br>
-                        Mozambique
-                    </div>
-                    <div class="timeline-item">
-                        <strong>2012</strong><br>
-                        Blantyre, Malawi<br>
-                        Got a pet
-                    </div>
-                    <div class="timeline-item">
-                        <strong>2013</strong><br>
-                        Botswana<br>
-                        Harare, Zimbabwe<br>
-                        Johannesburg, South Africa
-                    </div>
-                    <div class="timeline-item">
-                        <strong>2014</strong><br>
-                        Other Life Event
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-        
-        # MUSIC TAB
-        with tab2:
-            st.markdown('<div class="card"><h2 class="card-title">🎵 Music & DJ Sets</h2>', unsafe_allow_html=True)
-            st.write("""
-            Experience the unique sound of Yanti Siggs - a fusion of house, afrobeat, 
-            and electronic music that gets any crowd moving.
-            """)
-            
-            # Music filters
-            col1, col2 = st.columns(2)
-            with col1:
-                music_genre = st.selectbox("Filter by Genre", ["All", "House", "Afro House", "Afrobeat", "Electronic", "Deep House", "Tech House"])
-            with col2:
-                sort_by = st.selectbox("Sort By", ["Newest First", "Oldest First", "Alphabetical"])
-            
-            try:
-                music_tracks = website.get_music(genre=music_genre if music_genre != "All" else None)
-                
-                if sort_by == "Oldest First":
-                    music_tracks = sorted(music_tracks, key=lambda x: x[3])  # Year
-                elif sort_by == "Alphabetical":
-                    music_tracks = sorted(music_tracks, key=lambda x: x[1])  # Title
-                
-                if music_tracks:
-                    for track in music_tracks:
-                        with st.expander(f"{track[1]} - {track[2]} ({track[3]}) • {track[10]}", expanded=False):
-                            col1, col2 = st.columns([3, 1])
-                            
-                            with col1:
-                                st.markdown(f"**Album:** {track[2]}")
-                                st.markdown(f"**Year:** {track[3]}")
-                                st.markdown(f"**Duration:** {track[4]}")
-                                st.markdown(f"**Genre:** {track[10]}")
-                                
-                                # Streaming links
-                                if track[5]:  # YouTube
-                                    st.markdown(f"[▶️ YouTube]({track[5]})")
-                                if track[6]:  # Spotify
-                                    st.markdown(f"[🎵 Spotify]({track[6]})")
-                                if track[7]:  # SoundCloud
-                                    st.markdown(f"[🎚️ SoundCloud]({track[7]})")
-                                
-                                if track[8]:  # Lyrics
-                                    with st.expander("📜 View Lyrics"):
-                                        st.write(track[8])
-                            
-                            with col2:
-                                # Play button for local files
-                                if track[9]:  # File path
-                                    try:
-                                        if os.path.exists(track[9]):
-                                            with open(track[9], 'rb') as f:
-                                                audio_bytes = f.read()
-                                            st.audio(audio_bytes, format='audio/mp3')
-                                    except:
-                                        st.warning("Audio file not available")
-                else:
-                    st.info("No music tracks available yet. Check back soon!")
-            except Exception as e:
-                st.error(f"Error loading music: {str(e)}")
-            
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # FILMS TAB
-        with tab3:
-            st.markdown('<div class="card"><h2 class="card-title">🎬 Film Projects</h2>', unsafe_allow_html=True)
-            st.write("""
-            Explore Yanti Siggs' filmography - from directing and producing to acting, 
-            each project tells a unique story.
-            """)
-            
-            try:
-                films = website.get_films()
-                
-                if films:
-                    for film in films:
-                        with st.expander(f"{film[1]} ({film[2]}) - {film[3]}", expanded=False):
-                            col1, col2 = st.columns([3, 1])
-                            
-                            with col1:
-                                st.markdown(f"**Year:** {film[2]}")
-                                st.markdown(f"**Role:** {film[3]}")
-                                st.markdown(f"**Status:** {film[9].replace('_', ' ').title() if len(film) > 9 else 'released'}")
-                                
-                                st.markdown("---")
-                                st.markdown(f"**Description:**")
-                                st.write(film[4])
-                                
-                                # Links
-                                col_a, col_b, col_c = st.columns(3)
-                                if film[5]:  # Trailer
-                                    with col_a:
-                                        st.markdown(f"[🎬 Trailer]({film[5]})")
-                                if film[6]:  # Watch
-                                    with col_b:
-                                        st.markdown(f"[📺 Watch]({film[6]})")
-                                if film[7]:  # IMDb
-                                    with col_c:
-                                        st.markdown(f"[⭐ IMDb]({film[7]})")
-                            
-                            with col2:
-                                if film[8]:  # Poster
-                                    st.image(film[8], width=200)
-                else:
-                    st.info("No film projects available yet. Check back soon!")
-            except Exception as e:
-                st.error(f"Error loading films: {str(e)}")
-            
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # EVENTS TAB
-        with tab4:
-            st.markdown('<div class="card"><h2 class="card-title">📅 Upcoming Events & Shows</h2>', unsafe_allow_html=True)
-            st.write("""
-            Catch Yanti Siggs live at these upcoming events. From club nights to film premieres, 
-            there's always something exciting happening.
-            """)
-            
-            # Event filters
-            col1, col2 = st.columns(2)
-            with col1:
-                event_status = st.selectbox("Filter Events", ["upcoming", "past", "all"])
-            with col2:
-                if st.button("🗓️ Add to Calendar", use_container_width=True):
-                    st.info("Calendar integration coming soon!")
-            
-            try:
-                events = website.get_events(status=event_status) if event_status != "all" else website.get_all_events()
-                
-                if events:
-                    for event in events:
-                        with st.expander(f"{event[1]} - {event[2]} ({event[8] if len(event) > 8 else 'upcoming'})", expanded=False):
-                            col1, col2 = st.columns([3, 1])
-                            
-                            with col1:
-                                st.markdown(f"**Date:** {event[2]}")
-                                st.markdown(f"**Time:** {event[3]}")
-                                st.markdown(f"**Venue:** {event[4]}")
-                                st.markdown(f"**Status:** {event[8].upper() if len(event) > 8 else 'UPCOMING'}")
-                                
-                                st.markdown("---")
-                                st.markdown(f"**Description:**")
-                                st.write(event[5])
-                                
-                                if len(event) > 7 and event[7]:  # Registration URL
-                                    st.markdown(f"[📝 Register Here]({event[7]})")
-                            
-                            with col2:
-                                if len(event) > 6 and event[6]:  # Image URL
-                                    st.image(event[6], width=200)
-                else:
-                    st.info("No events found. Check back soon for upcoming events!")
-            except Exception as e:
-                st.error(f"Error loading events: {str(e)}")
-            
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # GALLERY TAB
-        with tab5:
-            st.markdown('<div class="card"><h2 class="card-title">📸 Visual Portfolio</h2>', unsafe_allow_html=True)
-            st.write("""
-            A visual journey through Yanti Siggs' creative world - from DJ sets and film shoots 
-            to studio sessions and red carpet moments.
-            """)
-            
-            # Gallery categories
-            categories = ["All", "Music", "Film", "Studio", "Events", "Personal"]
-            selected_category = st.selectbox("Filter by Category", categories)
-            
-            try:
-                gallery_items = website.get_gallery(
-                    category=selected_category if selected_category != "All" else None, 
-                    limit=12
-                )
-                
-                if gallery_items:
-                    # Display in grid
-                    cols = st.columns(3)
-                    for idx, item in enumerate(gallery_items):
-                        with cols[idx % 3]:
-                            st.image(item[3], use_column_width=True)
-                            st.markdown(f"**{item[1]}**")
-                            st.caption(f"{item[2]} • {item[4]}")
-                else:
-                    st.info("No gallery items available yet. Check back soon!")
-            except Exception as e:
-                st.error(f"Error loading gallery: {str(e)}")
-            
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # PRESS TAB
-        with tab6:
-            st.markdown('<div class="card"><h2 class="card-title">📰 Press & Media</h2>', unsafe_allow_html=True)
-            st.write("""
-            Featured press coverage and media appearances highlighting Yanti Siggs' work 
-            and creative journey.
-            """)
-            
-            try:
-                press_articles = website.get_press()
-                
-                if press_articles:
-                    for article in press_articles:
-                        st.markdown(f"""
-                        <div class="press-card">
-                            <h4>{article[1]}</h4>
-                            <p><strong>{article[2]}</strong> • {article[3]}</p>
-                            <p>{article[5]}</p>
-                            <p><a href="{article[4]}" target="_blank">Read full article →</a></p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                else:
-                    st.info("No press articles available yet. Check back soon!")
-            except Exception as e:
-                st.error(f"Error loading press articles: {str(e)}")
-            
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # BOOKINGS TAB
-        with tab7:
-            render_booking_tab()
-        
-        # CONTACT TAB
-        with tab8:
-            st.markdown('<div class="card"><h2 class="card-title">📞 Contact Yanti Studios</h2>', unsafe_allow_html=True)
-            st.write("""
-            Get in touch with Yanti Siggs and the Yanti Studios team for collaborations, 
-            media inquiries, or general questions.
-            """)
-            
-            col1, col2 = st.columns([1, 1])
-            
-            with col1:
-                st.markdown("""
-                ### Contact Information
-                
-                **🎵 CEO & Founder:** Yanti Siggs  
-                **🏢 Company:** Yanti Studios  
-                **📍 Location:** Zimbabwe
-                
-                ### Languages Spoken
-                • Shona  
-                • English
-                
-                ### Personal Details
-                **Gender:** Female  
-                **Birth Date:** June 17  
-                **Relationship Status:** Single
-                
-                ### Social Media
-                • **Instagram:** @sisiyantisiggs
-                • **Other:** @sisiyantisigss
-                """)
-            
-            with col2:
-                st.markdown("### Send a Message")
-                with st.form("contact_form"):
-                    name = st.text_input("Your Name *")
-                    email = st.text_input("Your Email *")
-                    phone = st.text_input("Your Phone")
-                    subject = st.selectbox("Subject", 
-                                         ["Collaboration Inquiry", "Media Interview", 
-                                          "General Inquiry", "Business Proposal", "Other"])
-                    message = st.text_area("Your Message *", height=150)
-                    
-                    submitted = st.form_submit_button("Send Message", type="primary")
-                    
-                    if submitted:
-                        if name and email and message:
-                            website.add_contact_message(name, email, phone, message)
-                            st.success("""
-                            ✅ **Thank you for your message!**
-                            
-                            We have received your message and will respond as soon as possible.
-                            """)
-                        else:
-                            st.error("Please fill in all required fields (*)")
-            
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # SUBSCRIBE TAB
-        with tab9:
-            st.markdown('<div class="card"><h2 class="card-title">💌 Subscribe to Newsletter</h2>', unsafe_allow_html=True)
-            st.write("""
-            Stay updated with Yanti Siggs' latest music releases, film projects, 
-            upcoming events, and creative endeavors. Join our exclusive community!
-            """)
-            
-            with st.form("subscribe_form"):
-                col1, col2 = st.columns(2)
-                with col1:
-                    name = st.text_input("Your Name")
-                with col2:
-                    email = st.text_input("Your Email *")
-                
-                interests = st.multiselect("Areas of Interest",
-                                          ["Music Releases", "DJ Events", "Film Projects", 
-                                           "Studio Updates", "Creative Workshops", "All Updates"])
-                
-                submitted = st.form_submit_button("Subscribe", type="primary")
-                
-                if submitted:
-                    if email:
-                        if website.add_subscriber(email, name):
-                            st.success("""
-                            ✅ **Thank you for subscribing!**
-                            
-                            Welcome to the Yanti Siggs creative community. 
-                            You'll receive exclusive updates and behind-the-scenes content.
-                            """)
-                        else:
-                            st.warning("This email is already subscribed. Thank you for your continued support!")
-                    else:
-                        st.error("Please enter your email address")
-            
-            st.markdown("---")
-            st.markdown("""
-            ### What You'll Receive:
-            - 🎵 New music and DJ set releases
-            - 🎬 Film project announcements and trailers
-            - 📅 Exclusive event invitations
-            - 🎨 Behind-the-scenes studio content
-            - 💡 Creative insights and updates
-            - 🎫 Early access to tickets and merchandise
-            """)
-            
-            st.markdown('</div>', unsafe_allow_html=True)
+        # Section navigation - only the selected section runs on each rerun
+        section = render_section_nav()
+        PUBLIC_SECTIONS[section][1]()
         
         # Footer
         st.markdown("""
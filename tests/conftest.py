@@ -0,0 +1,24 @@
+"""Shared fixtures: import the app module and run it against scratch directories"""
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault('YANTI_MEDIA_PORT', '0')
+os.environ.setdefault('YANTI_PERF', '0')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import network_control_center_streamlit as site  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    """The app module"""
+    return site
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run the test inside an empty directory (the app uses relative paths)"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
@@ -0,0 +1,92 @@
+"""Audio analysis of uploaded WAV and MP3 tracks, including malformed files"""
+import array
+import math
+import struct
+import wave
+
+import pytest
+
+RATE = 8000
+# MPEG-1 Layer III, no CRC, 128 kbps, 44.1 kHz, stereo: 417-byte frames of 1152 samples
+MP3_HEADER = b'\xff\xfb\x90\x00'
+MP3_FRAME_BYTES = 417
+
+
+def write_wav(path, width, seconds=2.0):
+    """A sine that is loud for the first half and silent for the second"""
+    samples = []
+    for i in range(int(RATE * seconds)):
+        amplitude = 0.8 if i < RATE * seconds / 2 else 0.0
+        samples.append(amplitude * math.sin(2 * math.pi * 440 * i / RATE))
+    full = 1 << (8 * width - 1)
+    if width == 1:
+        frames = bytes(int(128 + sample * 127) for sample in samples)
+    elif width == 3:
+        frames = b''.join(struct.pack('<i', int(sample * (full - 1)))[:3] for sample in samples)
+    else:
+        frames = array.array('h' if width == 2 else 'i', (int(sample * (full - 1)) for sample in samples)).tobytes()
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(width)
+        wav.setframerate(RATE)
+        wav.writeframes(frames)
+
+
+def mp3_frame(payload=b''):
+    return (MP3_HEADER + payload).ljust(MP3_FRAME_BYTES, b'\x00')
+
+
+@pytest.mark.parametrize('width', [1, 2, 3, 4])
+def test_wav_duration_format_and_peaks(app, workdir, width):
+    write_wav('take.wav', width)
+
+    audio = app.analyse_audio('take.wav')
+
+    assert audio.duration_seconds == 2.0
+    assert (audio.sample_rate, audio.channels) == (RATE, 1)
+    assert audio.bitrate == RATE * width * 8 // 1000
+    assert len(audio.waveform) == app.WAVEFORM_PEAKS
+    half = app.WAVEFORM_PEAKS // 2
+    assert min(audio.waveform[:half]) > 200
+    assert max(audio.waveform[half + 1:]) < 5
+
+
+def test_mp3_duration_and_bitrate_from_frame_headers(app, workdir):
+    id3 = b'ID3\x03\x00\x00\x00\x00\x00\x0a' + b'\x00' * 10
+    xing = mp3_frame(b'\x00' * 32 + b'Xing')  # VBR header frame: no audio
+    with open('mix.mp3', 'wb') as f:
+        f.write(id3 + xing + b'junk' + mp3_frame() * 100 + b'TAG' + b'\x00' * 125)
+
+    audio = app.analyse_audio('mix.mp3')
+
+    assert audio.duration_seconds == pytest.approx(100 * 1152 / 44100)
+    assert audio.bitrate == 128
+    assert (audio.sample_rate, audio.channels) == (44100, 2)
+    assert not any(audio.waveform)  # No coded bits anywhere: silence
+
+
+@pytest.mark.parametrize('name, body', [
+    ('truncated_id3.mp3', b'ID3'),
+    ('empty.mp3', b''),
+    ('noise.mp3', bytes(range(256)) * 20),
+    ('truncated.wav', b'RIFF\x24\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00'
+                     b'\x40\x1f\x00\x00\x80\x3e\x00\x00\x02\x00\x10\x00data\xff\xff\xff\x7f'),
+    ('garbage.wav', b'RIFF\xff\xff\xff\xffWAVE' + b'\xff' * 40),
+])
+def test_malformed_files_are_skipped_not_raised(app, workdir, name, body):
+    with open(name, 'wb') as f:
+        f.write(body)
+
+    assert app.analyse_audio(name) is None
+
+
+def test_missing_and_unsupported_files(app, workdir):
+    assert app.analyse_audio('missing.mp3') is None
+    with open('song.m4a', 'wb') as f:
+        f.write(b'\x00' * 64)
+    assert app.analyse_audio('song.m4a') is None
+
+
+def test_format_duration(app):
+    assert app.format_duration(315.4) == '5:15'
+    assert app.format_duration(59.6) == '1:00'
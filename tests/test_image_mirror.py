@@ -0,0 +1,145 @@
+"""ImageMirror against a local HTTP stand-in for third-party image hosts"""
+import http.server
+import json
+import os
+import threading
+
+import pytest
+
+PNG = b'\x89PNG\r\n\x1a\n' + b'\x00' * 1000
+
+
+class InlineExecutor:
+    """Runs mirror fetches on the calling thread so tests see their effect at once"""
+
+    def submit(self, fn, *args):
+        fn(*args)
+
+
+class ImageHost(http.server.BaseHTTPRequestHandler):
+    """Serves `resources` ({path: (content type, body, etag)}) with ETag revalidation"""
+
+    resources = {}
+    requests = []
+
+    def do_GET(self):
+        self.requests.append((self.path, self.headers.get('If-None-Match')))
+        if self.path not in self.resources:
+            self.send_error(404)
+            return
+        content_type, body, etag = self.resources[self.path]
+        if etag and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if etag:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def image_host():
+    """Base URL of a local image host; its resources and request log start empty"""
+    ImageHost.resources = {}
+    ImageHost.requests = []
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), ImageHost)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def mirror(app, workdir):
+    return app.ImageMirror('image_cache', 10 * 1024 * 1024, InlineExecutor())
+
+
+def test_first_view_fetches_and_later_views_use_the_local_copy(mirror, image_host):
+    ImageHost.resources['/poster.png'] = ('image/png', PNG, '"v1"')
+    url = image_host + '/poster.png'
+
+    assert mirror.lookup(url) is None  # First view keeps the remote URL and queues the fetch
+    path = mirror.lookup(url)
+
+    assert path.endswith('.png')
+    with open(path, 'rb') as f:
+        assert f.read() == PNG
+    assert ImageHost.requests == [('/poster.png', None)]
+
+
+def test_stale_entry_is_revalidated_with_its_etag(app, mirror, image_host):
+    ImageHost.resources['/poster.png'] = ('image/png', PNG, '"v1"')
+    url = image_host + '/poster.png'
+    path = mirror.fetch(url)
+    mirror.index[url]['fetched_at'] -= app.IMAGE_CACHE_REVALIDATE_SECONDS + 1
+
+    assert mirror.lookup(url) == path
+
+    assert ImageHost.requests[-1] == ('/poster.png', '"v1"')  # Answered 304 Not Modified
+    assert os.path.exists(path)
+    assert mirror.lookup(url) == path
+    assert len(ImageHost.requests) == 2  # Fresh again: no further requests
+
+
+def test_changed_image_replaces_the_cached_copy(app, mirror, image_host):
+    ImageHost.resources['/poster.png'] = ('image/png', PNG, '"v1"')
+    url = image_host + '/poster.png'
+    path = mirror.fetch(url)
+    ImageHost.resources['/poster.png'] = ('image/png', PNG + b'new', '"v2"')
+    mirror.index[url]['fetched_at'] -= app.IMAGE_CACHE_REVALIDATE_SECONDS + 1
+
+    mirror.lookup(url)
+
+    with open(path, 'rb') as f:
+        assert f.read() == PNG + b'new'
+    assert mirror.index[url]['etag'] == '"v2"'
+
+
+def test_least_recently_used_images_are_evicted_past_the_size_cap(app, workdir, image_host):
+    mirror = app.ImageMirror('image_cache', int(len(PNG) * 2.5), InlineExecutor())
+    for name in ('a', 'b', 'c'):
+        ImageHost.resources[f'/{name}.png'] = ('image/png', PNG, None)
+    a, b, c = (image_host + f'/{name}.png' for name in ('a', 'b', 'c'))
+    path_a, path_b = mirror.fetch(a), mirror.fetch(b)
+    mirror.index[a]['last_used'] = mirror.index[b]['last_used'] + 1  # a was viewed more recently
+
+    path_c = mirror.fetch(c)
+
+    assert set(mirror.index) == {a, c}
+    assert os.path.exists(path_a) and os.path.exists(path_c)
+    assert not os.path.exists(path_b)
+    with open(os.path.join('image_cache', 'index.json')) as f:
+        assert set(json.load(f)) == {a, c}
+
+
+def test_index_is_reloaded_by_a_new_process(app, mirror, image_host):
+    ImageHost.resources['/poster.png'] = ('image/png', PNG, None)
+    url = image_host + '/poster.png'
+    path = mirror.fetch(url)
+
+    restarted = app.ImageMirror('image_cache', 10 * 1024 * 1024, InlineExecutor())
+
+    assert restarted.lookup(url) == path
+    assert len(ImageHost.requests) == 1
+
+
+@pytest.mark.parametrize('resource', [None, ('text/html', b'<html>gone</html>', None)],
+                         ids=['missing', 'not-an-image'])
+def test_failed_urls_are_not_refetched_on_every_view(mirror, image_host, resource):
+    if resource:
+        ImageHost.resources['/poster.png'] = resource
+    url = image_host + '/poster.png'
+
+    for _ in range(3):
+        assert mirror.lookup(url) is None
+    assert len(ImageHost.requests) == 1
+
+    mirror.prefetch(url)  # An admin saving the URL again retries at once
+    assert len(ImageHost.requests) == 2
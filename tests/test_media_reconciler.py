@@ -0,0 +1,125 @@
+"""MediaReconciler: which files count as orphans, and when they may be deleted"""
+import io
+import json
+import os
+import time
+
+import pytest
+
+
+@pytest.fixture
+def website(app, workdir):
+    website = app.YantiSiggsWebsite()
+    yield website
+    website.close()
+
+
+@pytest.fixture
+def reconciler(app, website):
+    return app.MediaReconciler(website)  # Not scheduled: tests run passes themselves
+
+
+def media_file(app, path, body=b'x', fresh=False):
+    """Write a file; unless fresh, backdate it past the reconciler's grace period"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(body)
+    if not fresh:
+        old = time.time() - app.MEDIA_GC_GRACE - 60
+        os.utime(path, (old, old))
+    return os.path.normpath(path)
+
+
+def add_track(website, file_path):
+    return website.add_music("Track", "Album", 2024, "3:00", "", "", "", "", file_path, "House")
+
+
+def orphan_paths(report):
+    return sorted(path for path, _ in report['orphans'])
+
+
+def test_only_old_unreferenced_files_are_orphans(app, website, reconciler):
+    used = media_file(app, os.path.join('music_uploads', 'used.mp3'))
+    old = media_file(app, os.path.join('music_uploads', 'old.mp3'))
+    new = media_file(app, os.path.join('gallery_uploads', 'new.jpg'), fresh=True)
+    cached = media_file(app, os.path.join('image_cache', 'cached.png'))  # Evicts its own files
+    add_track(website, used)
+    add_track(website, os.path.join('music_uploads', 'deleted.mp3'))
+
+    report = reconciler.reconcile(dry_run=False)
+
+    assert orphan_paths(report) == [old]
+    assert report['reclaimed_bytes'] == 1
+    assert report['missing'] == [os.path.join('music_uploads', 'deleted.mp3')]
+    assert report['directories']['music_uploads'] == {'files': 2, 'bytes': 2}
+    assert not os.path.exists(old)
+    assert all(os.path.exists(path) for path in (used, new, cached))
+
+
+def test_dry_run_reports_without_deleting(app, reconciler):
+    old = media_file(app, os.path.join('music_uploads', 'old.mp3'))
+
+    report = reconciler.reconcile(dry_run=True)
+
+    assert orphan_paths(report) == [old]
+    assert report['reclaimed_bytes'] == 0
+    assert os.path.exists(old)
+
+
+def test_gallery_variants_and_live_header_renditions_are_kept(app, website, reconciler):
+    image = media_file(app, os.path.join('gallery_uploads', 'photo.jpg'))
+    variant = media_file(app, os.path.join('gallery_uploads', 'photo_480.webp'))
+    stale_variant = media_file(app, os.path.join('gallery_uploads', 'photo_old_480.webp'))
+    item = website.add_gallery_item("Photo", "Live", image, "")
+    website.set_gallery_variants(item, {'480': {'path': variant, 'width': 480}})
+
+    photo = app.store_upload(io.BytesIO(b'header'))
+    website.add_header_photo(photo)
+    key = f"{app.stored_media_hash(photo)[:16]}_{os.stat(photo).st_mtime_ns}_"
+    live = media_file(app, os.path.join(app.HEADER_RENDITIONS_DIR, key + '640.webp'))
+    stale = media_file(app, os.path.join(app.HEADER_RENDITIONS_DIR, '0' * 16 + '_1_640.webp'))
+
+    report = reconciler.reconcile(dry_run=False)
+
+    assert orphan_paths(report) == sorted([stale_variant, stale])
+    assert all(os.path.exists(path) for path in (image, variant, photo, live))
+
+
+def test_file_referenced_after_the_scan_is_not_deleted(app, website, reconciler, monkeypatch):
+    old = media_file(app, os.path.join('music_uploads', 'old.mp3'))
+    remove_orphans = reconciler.remove_orphans
+
+    def row_added_mid_pass(orphans, errors):
+        add_track(website, old)  # Committed between the scan and the deletes
+        return remove_orphans(orphans, errors)
+    monkeypatch.setattr(reconciler, 'remove_orphans', row_added_mid_pass)
+
+    report = reconciler.reconcile(dry_run=False)
+
+    assert report['orphans'] == [] and report['reclaimed_bytes'] == 0
+    assert os.path.exists(old)
+
+
+def test_reuploaded_orphan_gets_a_new_grace_period(app, reconciler, monkeypatch):
+    body = b'audio'
+    stored = app.store_upload(io.BytesIO(body))
+    old = time.time() - app.MEDIA_GC_GRACE - 60
+    os.utime(stored, (old, old))
+    remove_orphans = reconciler.remove_orphans
+
+    def uploaded_again_mid_pass(orphans, errors):
+        assert orphan_paths({'orphans': orphans}) == [stored]
+        app.store_upload(io.BytesIO(body))
+        return remove_orphans(orphans, errors)
+    monkeypatch.setattr(reconciler, 'remove_orphans', uploaded_again_mid_pass)
+
+    reconciler.reconcile(dry_run=False)
+
+    assert os.path.exists(stored)
+
+
+def test_report_is_kept_for_the_admin_page(app, reconciler):
+    report = reconciler.reconcile(dry_run=True)
+
+    assert reconciler.last_report is report
+    assert json.dumps(report)  # Plain data only
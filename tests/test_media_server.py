@@ -0,0 +1,104 @@
+"""MediaRequestHandler access rules for public media and subscriber exports"""
+import functools
+import http.server
+import os
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+
+class Metrics:
+    def prometheus(self):
+        return 'yanti_up 1\n'
+
+
+def serve(handler):
+    """Start a server for handler on a free loopback port; returns it and its base URL"""
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+
+@pytest.fixture
+def media_server(app, workdir):
+    """(base URL, DownloadTokens) of a media server rooted at the test directory"""
+    tokens = app.DownloadTokens(app.EXPORT_TTL)
+    server, base = serve(functools.partial(app.MediaRequestHandler, directory=str(workdir), download_tokens=tokens))
+    yield base, tokens
+    server.shutdown()
+    server.server_close()
+
+
+def write_file(path, body):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(body)
+
+
+def get(url, headers=None):
+    """(status, headers, body) of a GET request"""
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers or {})) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, b''
+
+
+def test_media_files_are_public_and_support_ranges(media_server):
+    base, _ = media_server
+    write_file(os.path.join('media', 'ab', 'abc.mp3'), b'0123456789')
+
+    status, headers, body = get(base + '/media/ab/abc.mp3', {'Range': 'bytes=2-4'})
+
+    assert (status, body) == (206, b'234')
+    assert headers['Access-Control-Allow-Origin'] == '*'
+
+
+def test_exports_need_a_one_time_token(media_server):
+    base, tokens = media_server
+    path = os.path.join('exports', 'subscribers_x.csv')
+    write_file(path, b'email,name\na@example.com,A\n')
+    token = tokens.issue(path)
+
+    assert get(base + '/exports/subscribers_x.csv')[0] == 404
+    assert get(base + '/exports/subscribers_x.csv?token=wrong')[0] == 404
+
+    status, headers, body = get(f'{base}/exports/subscribers_x.csv?token={token}')
+    assert (status, body) == (200, b'email,name\na@example.com,A\n')
+    assert 'Access-Control-Allow-Origin' not in headers
+    assert headers['Cache-Control'] == 'private, no-store'
+
+    assert get(f'{base}/exports/subscribers_x.csv?token={token}')[0] == 404  # Spent
+
+
+def test_tokens_are_bound_to_their_file_and_expire(app, workdir):
+    tokens = app.DownloadTokens(ttl=0)
+    write_file(os.path.join('exports', 'a.csv'), b'a')
+    write_file(os.path.join('exports', 'b.csv'), b'b')
+
+    assert not tokens.redeem(tokens.issue(os.path.join('exports', 'a.csv')), os.path.join('exports', 'a.csv'))
+
+    tokens.ttl = 60
+    token = tokens.issue(os.path.join('exports', 'a.csv'))
+    assert not tokens.redeem(token, os.path.join('exports', 'b.csv'))
+
+
+@pytest.mark.parametrize('token, headers, status', [
+    ('', {}, 200),  # No token configured: loopback clients only
+    ('s3cret', {}, 404),
+    ('s3cret', {'Authorization': 'Bearer wrong'}, 404),
+    ('s3cret', {'Authorization': 'Bearer s3cret'}, 200),
+])
+def test_metrics_need_the_bearer_token_when_one_is_set(app, workdir, token, headers, status):
+    server, base = serve(functools.partial(app.MediaRequestHandler, directory=str(workdir),
+                                           metrics=Metrics(), metrics_token=token))
+    try:
+        code, _, body = get(base + app.METRICS_PATH, headers)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert code == status
+    assert body == (b'yanti_up 1\n' if status == 200 else b'')
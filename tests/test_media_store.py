@@ -0,0 +1,30 @@
+"""store_upload: content-addressed storage of uploads"""
+import hashlib
+import io
+import os
+
+
+def upload(body, name='track.mp3'):
+    f = io.BytesIO(body)
+    f.name = name
+    return f
+
+
+def test_upload_is_stored_under_its_hash(app, workdir):
+    path = app.store_upload(upload(b'audio'))
+
+    assert path == app.media_store_path(hashlib.sha256(b'audio').hexdigest(), '.mp3')
+    with open(path, 'rb') as f:
+        assert f.read() == b'audio'
+    assert os.listdir(app.MEDIA_STORE_DIR) == [os.path.basename(os.path.dirname(path))]  # No .part left
+
+
+def test_duplicate_upload_refreshes_the_stored_files_mtime(app, workdir):
+    path = app.store_upload(upload(b'audio'))
+    old = os.stat(path).st_mtime - app.MEDIA_GC_GRACE - 60
+    os.utime(path, (old, old))  # An orphan past its grace period
+
+    assert app.store_upload(upload(b'audio')) == path
+
+    assert os.stat(path).st_mtime > old + app.MEDIA_GC_GRACE
+    assert sorted(os.listdir(os.path.dirname(path))) == [os.path.basename(path)]
@@ -0,0 +1,50 @@
+"""Hot getters must be served by their index, never by a scan-and-sort"""
+import os
+import threading
+
+import pytest
+
+import network_control_center_streamlit as site
+
+
+@pytest.fixture(scope='module')
+def website(tmp_path_factory):
+    """Data layer on a fresh database built by apply_migrations"""
+    previous = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp('db'))
+    try:
+        website = site.YantiSiggsWebsite()
+        yield website
+        website.close()
+    finally:
+        os.chdir(previous)
+
+
+@pytest.fixture(scope='module')
+def plans(website):
+    return {label: (index, ok, plan) for label, index, ok, plan in website.check_query_plans()}
+
+
+@pytest.mark.parametrize('label', [check[0] for check in site.QUERY_PLAN_CHECKS])
+def test_getter_uses_its_index_without_sorting(plans, label):
+    index, ok, plan = plans[label]
+    assert f'INDEX {index}' in plan, plan
+    assert 'TEMP B-TREE' not in plan, plan
+    assert ok
+
+
+def test_plans_come_from_the_getters_real_sql(website):
+    with website.pool.capture() as statements:
+        website.query_music(genre='House', limit=10)
+    assert len(statements) == 1
+    # The exact ORDER BY query_music sends, tiebreak included, with parameters filled in
+    assert f"ORDER BY {site.MUSIC_SORTS['newest']}" in statements[0]
+    assert "genre = 'House'" in statements[0]
+
+
+def test_capture_only_sees_its_own_thread(website):
+    with website.pool.capture() as statements:
+        worker = threading.Thread(target=website.count_music, kwargs={'genre': 'Techno'})
+        worker.start()
+        worker.join()
+    assert statements == []
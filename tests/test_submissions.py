@@ -0,0 +1,62 @@
+"""Queued form submissions and shutting the data layer down"""
+import sqlite3
+
+import pytest
+
+
+@pytest.fixture
+def website(app, workdir):
+    website = app.YantiSiggsWebsite()
+    yield website
+    website.close()
+
+
+def count(website, table):
+    with website.read() as cursor:
+        return cursor.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+
+def test_queued_submissions_are_committed(website):
+    futures = [website.queue_contact_message(f"Visitor {i}", f"v{i}@example.com", "", "Hi") for i in range(50)]
+    duplicate = [website.queue_subscriber('fan@example.com', "Fan") for _ in range(2)]
+
+    assert all(future.result(timeout=5) for future in futures)
+    assert duplicate[0].result(timeout=5) and duplicate[1].result(timeout=5) is None  # Already subscribed
+    assert count(website, 'contacts') == 50
+
+
+def test_close_flushes_the_queue_and_releases_connections(app, workdir):
+    website = app.YantiSiggsWebsite()
+    future = website.queue_booking_request("A", "a@example.com", "", "Wedding", "2026-12-01", "Hall", "", "")
+
+    website.close()
+
+    assert future.done() and future.result()
+    assert not website.submissions.thread.is_alive()
+    with pytest.raises(sqlite3.ProgrammingError):
+        with website.read() as cursor:
+            cursor.execute('SELECT 1')
+    reopened = app.YantiSiggsWebsite()
+    assert count(reopened, 'bookings') == 1
+    reopened.close()
+
+
+@pytest.fixture
+def messages(app, monkeypatch):
+    """(kind, text) of every st.info/st.error the code under test shows"""
+    shown = []
+    monkeypatch.setattr(app.st, 'info', lambda text: shown.append(('info', text)))
+    monkeypatch.setattr(app.st, 'error', lambda text: shown.append(('error', text)))
+    return shown
+
+
+def test_only_a_committed_submission_counts_as_saved(app, messages, monkeypatch):
+    monkeypatch.setattr(app, 'SUBMISSION_ACK_TIMEOUT', 0.01)
+    committed, pending, failed = app.Future(), app.Future(), app.Future()
+    committed.set_result(1)
+    failed.set_exception(sqlite3.OperationalError("disk I/O error"))
+
+    assert app.submission_saved(committed)
+    assert not app.submission_saved(pending)
+    assert not app.submission_saved(failed)
+    assert messages == [('info', app.SUBMISSION_PENDING_MESSAGE), ('error', app.SUBMISSION_FAILED_MESSAGE)]